@@ -0,0 +1,81 @@
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os import path
+import argparse
+import re
+import sys
+
+root = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from llvmAnalyser.analyser import LLVMAnalyser
+
+# Report the time it takes to build the graph of a single large function, for functions of increasing size. Every
+# block of the generated function loads and updates a value, calls a function, and branches to the next block, so that
+# the blocks are looked up by their label throughout the function. The graph is built in linear time if the time per
+# instruction stays the same as the function grows.
+
+# the number of instructions within a single block of the generated function
+block_size = 8
+
+
+# generate a module, with a function consisting of (at least) the given number of instructions
+def generate_module(instructions):
+    lines = ["define dso_local void @_Z4stepi(i32) #0 {", "  ret void", "}", "",
+             "define dso_local i32 @_Z3bigi(i32) #0 {",
+             "  %2 = alloca i32, align 4",
+             "  store i32 %0, i32* %2, align 4",
+             "  br label %3"]
+
+    register = 3
+    for _ in range(instructions // block_size):
+        block = register
+        lines += ["",
+                  "{}:".format(block),
+                  "  %{} = load i32, i32* %2, align 4".format(block + 1),
+                  "  %{} = add nsw i32 %{}, 1".format(block + 2, block + 1),
+                  "  %{} = shl i32 %{}, 1".format(block + 3, block + 2),
+                  "  store i32 %{}, i32* %2, align 4".format(block + 3),
+                  "  call void @_Z4stepi(i32 %{})".format(block + 3),
+                  "  %{} = icmp slt i32 %{}, 7".format(block + 4, block + 3),
+                  "  br i1 %{}, label %{}, label %{}".format(block + 4, block + 5, block + 5)]
+        register = block + 5
+
+    lines += ["", "{}:".format(register),
+              "  %{} = load i32, i32* %2, align 4".format(register + 1),
+              "  ret i32 %{}".format(register + 1),
+              "}", "",
+              "attributes #0 = { noinline }", ""]
+    return "\n".join(lines)
+
+
+def analyse(file):
+    analyzer = LLVMAnalyser()
+    analyzer.config["graph"] = False
+    analyzer.config["cache"] = None
+    analyzer.config["max_depth"] = 1
+    analyzer.test_identifier = re.compile(r'@_Z3bigi')
+
+    start = perf_counter()
+    analyzer.get_relevant_functions(file)
+    duration = perf_counter() - start
+
+    analyzer.lines.close()
+    return duration, len(analyzer.graphs["@_Z3bigi"].nodes)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Report the time it takes to build the graph of a large function")
+    parser.add_argument("sizes", nargs="*", type=int, default=[6250, 12500, 25000, 50000],
+                        help="the number of instructions of the generated functions")
+    args = parser.parse_args()
+
+    print("{:>14}{:>10}{:>12}{:>24}".format("instructions", "nodes", "time (s)", "time/instruction (us)"))
+    with TemporaryDirectory() as directory:
+        for size in args.sizes:
+            file = path.join(directory, "linked_{}.ll".format(size))
+            with open(file, "w") as f:
+                f.write(generate_module(size))
+
+            duration, nodes = analyse(file)
+            print("{:>14}{:>10}{:>12.3f}{:>24.2f}".format(size, nodes, duration, 1e6 * duration / size))
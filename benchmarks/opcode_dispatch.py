@@ -0,0 +1,93 @@
+from timeit import timeit
+from collections import defaultdict
+import argparse
+import sys
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from llvmAnalyser.analyser import get_opcode, instructions, skipped_instructions
+from llvmAnalyser.lexer import get_words
+
+# Compare the classification of the instructions of an llvm file through the opcode dispatch table with the chain of
+# membership tests that was used before it. The lines are grouped per opcode, so that the gain can be seen for the
+# instructions that were tested late within the chain.
+
+binary_ops = ["add", "sub", "mul", "sdiv", "srem", "udiv", "urem", "fadd", "fsub", "fmul", "fdiv"]
+bitwise_ops = ["shl", "lshr", "ashr", "and", "or", "xor"]
+conversion_ops = ["trunc", "zext", "sext", "fptrunc", "fpext", "fptoui", "fptosi", "uitofp", "sitofp", "ptrtoint",
+                  "inttoptr", "bitcast", "addrspacecast"]
+
+
+# the chain of tests in the order in which the analyser used to apply them
+def classify_chain(tokens):
+    if tokens[0] == "ret":
+        return "ret"
+    for opcode in ["br", "switch", "indirectbr", "invoke", "callbr", "resume", "catchswitch", "catchret",
+                   "cleanupret", "unreachable"]:
+        if opcode in tokens:
+            return opcode
+    if len(tokens) > 2 and tokens[2] == "fneg":
+        return "fneg"
+    if len(tokens) > 2 and tokens[2] in binary_ops:
+        return tokens[2]
+    if len(tokens) > 2 and tokens[2] in bitwise_ops and tokens[1] == "=":
+        return tokens[2]
+    for opcode in ["extractelement", "insertelement", "shufflevector", "extractvalue", "insertvalue"]:
+        if len(tokens) > 2 and tokens[2] == opcode:
+            return opcode
+    for opcode in ["alloca", "load", "store", "fence", "cmpxchg", "atomicrmw"]:
+        if opcode in tokens:
+            return opcode
+    if len(tokens) > 2 and tokens[2] == "getelementptr" and tokens[1] == "=":
+        return "getelementptr"
+    if len(tokens) > 2 and tokens[2] in conversion_ops and tokens[1] == "=":
+        return tokens[2]
+    if len(tokens) > 2 and tokens[1] == "=" and tokens[2] in ["icmp", "fcmp"]:
+        return tokens[2]
+    if len(tokens) > 2 and tokens[1] == "=" and tokens[2] == "phi":
+        return "phi"
+    for opcode in ["select", "freeze", "call", "landingpad", "catchpad", "cleanuppad"]:
+        if opcode in tokens:
+            return opcode
+    return None
+
+
+def classify_dispatch(tokens):
+    opcode = get_opcode(tokens)
+    if opcode in instructions or opcode in skipped_instructions:
+        return opcode
+    return None
+
+
+# group the instructions of the functions of the file by their opcode
+def read_instructions(file):
+    groups = defaultdict(list)
+    opened = False
+    with open(file, 'r') as f:
+        for line in f:
+            tokens = get_words(line)
+            if not tokens:
+                continue
+            if tokens[0] == "define":
+                opened = True
+            elif tokens[0] == "}":
+                opened = False
+            elif opened and classify_dispatch(tokens) is not None:
+                groups[get_opcode(tokens)].append(tokens)
+    return groups
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare the opcode dispatch table with the chain of tests")
+    parser.add_argument("file", help="the llvm file of which the instructions are classified")
+    parser.add_argument("--repeat", type=int, default=200, help="the number of times every line is classified")
+    args = parser.parse_args()
+
+    print("{:<16}{:>8}{:>16}{:>16}{:>10}".format("opcode", "lines", "chain (l/s)", "dispatch (l/s)", "speedup"))
+    for opcode, lines in sorted(read_instructions(args.file).items(), key=lambda item: -len(item[1])):
+        chain = timeit(lambda: [classify_chain(tokens) for tokens in lines], number=args.repeat)
+        dispatch = timeit(lambda: [classify_dispatch(tokens) for tokens in lines], number=args.repeat)
+        count = len(lines) * args.repeat
+        print("{:<16}{:>8}{:>16.0f}{:>16.0f}{:>9.1f}x".format(opcode, len(lines), count / chain, count / dispatch,
+                                                                chain / dispatch))
@@ -0,0 +1,49 @@
+from statistics import median
+from subprocess import run
+from os import path
+import argparse
+import ast
+import sys
+
+# Measure the time it takes to import the modules that main.py and test.py depend on. Each measurement is done in a
+# fresh interpreter, so that the modules that were already imported by a previous measurement are not cached.
+
+root = path.dirname(path.dirname(path.abspath(__file__)))
+
+entry_points = ["main.py", "test.py"]
+
+measure = '''
+from time import perf_counter
+start = perf_counter()
+{}
+print(perf_counter() - start)
+'''
+
+
+# get the top level imports of the given entry point, the remainder of the entry point is not executed
+def get_imports(entry_point):
+    with open(path.join(root, entry_point), 'r') as f:
+        tree = ast.parse(f.read())
+
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom, ast.Try))]
+    return ast.unparse(ast.Module(body=imports, type_ignores=[]))
+
+
+def measure_imports(imports, runs):
+    times = []
+    for _ in range(runs):
+        result = run([sys.executable, "-c", measure.format(imports)], cwd=root, capture_output=True, text=True,
+                     check=True)
+        times.append(float(result.stdout))
+    return times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the import time of the entry points")
+    parser.add_argument("--runs", type=int, default=10, help="the number of fresh interpreters per entry point")
+    args = parser.parse_args()
+
+    for entry_point in entry_points:
+        times = measure_imports(get_imports(entry_point), args.runs)
+        print("{}: median {:.1f} ms, min {:.1f} ms, max {:.1f} ms".format(entry_point, median(times) * 1000,
+                                                                           min(times) * 1000, max(times) * 1000))
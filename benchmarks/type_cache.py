@@ -0,0 +1,91 @@
+from time import perf_counter
+from glob import glob
+from os import path
+from unittest.mock import patch
+import argparse
+import sys
+
+root = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from llvmAnalyser.analyser import LLVMAnalyser
+from llvmAnalyser.index import load_module, load_module_set
+from llvmAnalyser import types
+from llvmAnalyser.types import type_cache
+
+# Report the hit rate of the type cache while the llvm files of the example projects are analysed, along with the time
+# the analysis takes with and without the cache. Files or projects can be given explicitly, by default the linked llvm
+# files of the built example projects are used.
+
+candidates = ["linked.ll", "linked.ll.gz", "linked.ll.zst", "linked.ll.xz", "llvm_submodules/linked.bc",
+              "llvm_submodules"]
+
+
+# get the llvm file of the project, the same candidates as in main.py are considered
+def get_llvm_path(project):
+    if not path.isdir(project):
+        return project
+    for candidate in candidates:
+        if path.exists(path.join(project, "llvm", candidate)):
+            return path.join(project, "llvm", candidate)
+    return None
+
+
+# build the module index of the file up front, so that neither of the timed passes includes the scan of the file
+def warm_index(file):
+    if path.isdir(file):
+        reader, _ = load_module_set(file)
+    else:
+        reader, _ = load_module(file)
+    reader.close()
+
+
+# analyse the file while counting the lookups in the type cache, a lookup that misses is followed by storing the type
+def analyse_cached(file, max_depth):
+    type_cache.clear()
+    with patch.object(type_cache, "lookup", wraps=type_cache.lookup) as lookup, \
+            patch.object(type_cache, "store", wraps=type_cache.store) as store:
+        duration = analyse(file, max_depth)
+    return duration, lookup.call_count - store.call_count, store.call_count
+
+
+# analyse the file while every type is parsed, as if none of the types could be cached
+def analyse_uncached(file, max_depth):
+    with patch.object(types, "is_cacheable", return_value=False):
+        return analyse(file, max_depth)
+
+
+def analyse(file, max_depth):
+    analyzer = LLVMAnalyser()
+    analyzer.config["graph"] = False
+    analyzer.config["cache"] = None
+    analyzer.config["max_depth"] = max_depth
+
+    start = perf_counter()
+    analyzer.get_relevant_functions(file)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Report the hit rate of the type cache")
+    parser.add_argument("projects", nargs="*", help="the llvm files or project directories that are analysed")
+    parser.add_argument("--max-depth", type=int, default=2, help="the depth up to which the functions are analysed")
+    args = parser.parse_args()
+
+    projects = args.projects or sorted(glob(path.join(root, "exampleProjects", "*")))
+
+    print("{:<40}{:>10}{:>10}{:>10}{:>10}{:>14}{:>14}".format("project", "types", "hits", "misses", "hit rate",
+                                                             "cached (s)", "uncached (s)"))
+    for project in projects:
+        file = get_llvm_path(project)
+        if file is None:
+            print("{:<40} no llvm file found, build the project first".format(path.basename(project)))
+            continue
+
+        warm_index(file)
+        uncached = analyse_uncached(file, args.max_depth)
+        cached, hits, misses = analyse_cached(file, args.max_depth)
+
+        print("{:<40}{:>10}{:>10}{:>10}{:>9.1f}%{:>14.3f}{:>14.3f}".format(
+            path.basename(project.rstrip("/")), len(type_cache), hits, misses,
+            100 * hits / max(hits + misses, 1), cached, uncached))
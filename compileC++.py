@@ -46,7 +46,7 @@ def create_build_dir(project_path):
         call(["mkdir", "{}/llvm/llvm_submodules".format(project_path)])
 
 
-def build_project(project_path):
+def build_project(project_path, disassemble=True):
     c_compiler = "-DCMAKE_C_COMPILER={}".format(config["c"]["c_clang_path"])
     cxx_compiler = "-DCMAKE_CXX_COMPILER={}".format(config["c++"]["cxx_clang_path"])
     build_path = "{}/llvm".format(project_path)
@@ -88,13 +88,17 @@ def build_project(project_path):
     f.close()
 
     call(["llvm-link-6.0 *.ll -o linked.bc"], cwd="{}/llvm_submodules".format(build_path), shell=True)
-    call(["llvm-dis-6.0", "./llvm_submodules/linked.bc", "-o", "linked.ll"], cwd=build_path)
+
+    # the analyser can read the bitcode directly, in which case the disassembled file does not need to be written
+    if disassemble:
+        call(["llvm-dis-6.0", "./llvm_submodules/linked.bc", "-o", "linked.ll"], cwd=build_path)
 
 
 parser = ArgumentParser(description='Compiler capable of compiling c++ project using cmake to LLVM IR.')
 parser.add_argument('path', type=str, help='the path to the root cmake file')
+parser.add_argument('--bitcode', action='store_true', help='only produce the linked bitcode, without disassembling it')
 
 args = parser.parse_args()
 
 create_build_dir(args.path)
-build_project(args.path)
+build_project(args.path, not args.bitcode)
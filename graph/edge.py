@@ -1,8 +1,17 @@
 class Edge:
-    def __init__(self, start_node, end_node, label):
+    def __init__(self, start_node, end_node, label, context=None):
         self.start_node = start_node
         self.end_node = end_node
+
+        # as for the nodes, the label of an edge can be a function that renders the label from its context, once the
+        # label is needed
         self.label = label
+        self.context = context
+
+    def get_label(self):
+        if self.context is not None:
+            return self.label(*self.context)
+        return self.label
 
     def __str__(self):
-        return "{} -> {} [label = \"{}\"]".format(self.start_node.get_id(), self.end_node.get_id(), self.label)
+        return "{} -> {} [label = \"{}\"]".format(self.start_node.get_id(), self.end_node.get_id(), self.get_label())
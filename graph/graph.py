@@ -1,6 +1,5 @@
-from graph.node import Node
+from graph.node import Node, escaped_quotes
 from graph.edge import Edge
-from subprocess import call, DEVNULL
 from os import path
 import re
 
@@ -9,9 +8,15 @@ class Graph:
     def __init__(self):
         self.nodes = dict()
         self.edges = dict()
-        self.needed_nodes = list()
+
+        # the nodes that are linked by an edge, in the order in which they were linked, as the keys of a dict
+        self.needed_nodes = dict()
+
+        # map every name onto the nodes that were added with it, in the order in which they were added, so that the
+        # nodes can be found by their name without visiting every node
+        self.named_nodes = dict()
+
         self.node_count = 0
-        self.trans = str.maketrans({"\"": "\\\""})
         self.test_func = False
 
         # this dict will be used to map block names to the corresponding start nodes
@@ -23,10 +28,43 @@ class Graph:
         self.func = re.compile(r'^.*(= )?call .*$')
         self.invoke = re.compile(r'^.*(= )?invoke .*$')
 
-    def register_start_of_block(self, block_name):
+    # the nodes are pickled without their links, the links are stored as the keys of the nodes instead
+    def __getstate__(self):
+        keys = {node: key for key, node in self.nodes.items()}
+
+        state = self.__dict__.copy()
+        del state["named_nodes"]
+        state["links"] = {key: ([keys[inc] for inc in node.inc],
+                                [keys[out] for out in node.out],
+                                [keys[argument] for argument in node.arguments]) for key, node in self.nodes.items()}
+        return state
+
+    def __setstate__(self, state):
+        links = state.pop("links")
+        self.__dict__.update(state)
+
+        for key, (incs, outs, arguments) in links.items():
+            node = self.nodes[key]
+            node.inc = [self.nodes[inc] for inc in incs]
+            node.out = [self.nodes[out] for out in outs]
+            node.arguments = [self.nodes[argument] for argument in arguments]
+
+        self.named_nodes = dict()
         for node in self.nodes.values():
-            if node.get_name() == block_name:
-                self.block_map[block_name] = node
+            if node.node_name is not None:
+                self.named_nodes.setdefault(node.node_name, []).append(node)
+
+    # get the most recently added node that has the given name
+    def get_named_node(self, name):
+        for node in reversed(self.named_nodes.get(name, ())):
+            if node.has_name(name):
+                return node
+        return None
+
+    def register_start_of_block(self, block_name):
+        node = self.get_named_node(block_name)
+        if node is not None:
+            self.block_map[block_name] = node
 
     def get_start_of_block(self, block_name):
         if block_name in self.block_map:
@@ -39,32 +77,41 @@ class Graph:
     def is_test_func(self):
         return self.test_func
 
-    def add_node(self, node_name):
-        self.nodes[self.node_count] = Node("Q{}".format(self.node_count), node_name.translate(self.trans))
+    def reset_test_func(self):
+        self.test_func = False
+        self.assertions = list()
+
+    # add a node with the given name, or with the name that is rendered by the label function, see Node.get_name
+    def add_node(self, node_name, label=None):
+        if node_name is not None and "\"" in node_name:
+            node_name = node_name.translate(escaped_quotes)
+        node = Node("Q{}".format(self.node_count), node_name, label)
+        self.nodes[self.node_count] = node
         self.node_count += 1
-        return self.nodes[self.node_count-1]
+
+        if node_name is not None:
+            self.named_nodes.setdefault(node_name, []).append(node)
+        return node
 
     def add_final_node(self, node_name):
         node = self.add_node(node_name)
         node.set_final()
         return node
 
-    def add_edge(self, start_node, end_node, label=""):
-        key = frozenset([start_node, end_node, label])
+    def add_edge(self, start_node, end_node, label="", context=None):
+        key = frozenset([start_node, end_node, label if context is None else (label, context)])
 
         if key not in self.edges:
-            if start_node not in self.needed_nodes:
-                self.needed_nodes.append(start_node)
-            if end_node not in self.needed_nodes:
-                self.needed_nodes.append(end_node)
-            self.edges[key] = Edge(start_node, end_node, label)
+            self.needed_nodes[start_node] = None
+            self.needed_nodes[end_node] = None
+            self.edges[key] = Edge(start_node, end_node, label, context)
             start_node.add_out(end_node)
             end_node.add_inc(start_node)
         return self.edges[key]
 
     def make_node_start_node(self, node_name):
-        for node in self.nodes.values():
-            if node.get_name() == node_name:
+        for node in self.named_nodes.get(node_name, ()):
+            if node.has_name(node_name):
                 node.set_start()
 
     def add_assertion(self, node):
@@ -104,6 +151,9 @@ class Graph:
         return assertions
 
     def export_graph(self, filename):
+        # the subprocess module is only needed to export graphs, so it is only imported once it is needed
+        from subprocess import call, DEVNULL
+
         changes_occurred = True
         added_nodes = list()
 
@@ -1,7 +1,16 @@
+# the quotes within the names of the nodes are escaped, as the names are used as the labels of the exported graphs
+escaped_quotes = str.maketrans({"\"": "\\\""})
+
+
 class Node:
-    def __init__(self, node_id, node_name):
+    def __init__(self, node_id, node_name, label=None):
         self.node_id = node_id
         self.node_name = node_name
+
+        # the nodes of the statements have no name of their own, instead their name is rendered by the label function
+        # from the statement that is set as their context, once the name is needed
+        self.label = label
+        self.assignee = None
         self.inc = list()
         self.out = list()
         self.context = None
@@ -12,16 +21,48 @@ class Node:
         self.test_var = False
         self.mutator_function = False
 
+    # the links to other nodes are left out, these are restored by the graph that owns the node, so that pickling a
+    # long chain of nodes does not exceed the recursion limit
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["inc"] = list()
+        state["out"] = list()
+        state["arguments"] = list()
+        return state
+
     def __str__(self):
         if self.final:
-            return "{}[label=\"{}\", shape=doublecircle]".format(self.node_id, self.node_name)
-        return "{}[label=\"{}\"]".format(self.node_id, self.node_name)
+            return "{}[label=\"{}\", shape=doublecircle]".format(self.node_id, self.get_name())
+        return "{}[label=\"{}\"]".format(self.node_id, self.get_name())
 
     def set_name(self, name):
         self.node_name = name
+        self.label = None
+        self.assignee = None
 
     def get_name(self):
-        return self.node_name
+        name = self.node_name
+        if self.label is not None:
+            name = self.label(self.context).translate(escaped_quotes)
+        if self.assignee is not None:
+            return "{} = {}".format(self.assignee, name)
+        return name
+
+    # check whether the node has the given name, without rendering the label of the node
+    def has_name(self, name):
+        return self.label is None and self.get_name() == name
+
+    def get_label(self):
+        return self.label
+
+    # the value of a statement can be assigned to a register, this is shown in front of the name of the node
+    def set_assignee(self, assignee):
+        if self.assignee is not None:
+            assignee = "{} = {}".format(assignee, self.assignee)
+        self.assignee = assignee
+
+    def get_assignee(self):
+        return self.assignee
 
     def get_id(self):
         return self.node_id
@@ -32,6 +73,10 @@ class Node:
     def set_test(self):
         self.start = True
 
+    def reset_marks(self):
+        self.start = False
+        self.assertion = False
+
     def is_test(self):
         return self.start
 
@@ -2,19 +2,22 @@ from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # The ‘extractvalue’ instruction extracts the value of a member field from an aggregate value.
 # <result> = extractvalue <aggregate type> <val>, <idx>{, <idx>}*
 
 
 def analyze_extractvalue(tokens):
+    tokens = as_cursor(tokens)
+
     extractvalue = Extractvalue()
 
     # skip initial assignment part
-    while tokens[0] != "extractvalue":
-        tokens.pop(0)
+    while tokens.peek() != "extractvalue":
+        tokens.advance()
 
     # pop the extractvalue token
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the type
     _, tokens = get_type(tokens)
@@ -32,6 +35,8 @@ def analyze_extractvalue(tokens):
 
 
 class Extractvalue(LlvmStatement):
+    __slots__ = ("value", "indices")
+
     def __init__(self):
         super().__init__()
         self.value = None
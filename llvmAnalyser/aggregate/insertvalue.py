@@ -2,27 +2,30 @@ from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # The ‘insertvalue’ instruction inserts a value into a member field in an aggregate value.
 # <result> = insertvalue <aggregate type> <val>, <ty> <elt>, <idx>{, <idx>}*    ; yields <aggregate type>
 
 
 def analyze_insertvalue(tokens):
+    tokens = as_cursor(tokens)
+
     insertvalue_instruction = Insertvalue()
 
     # pop the assignment segment
-    while tokens[0] != "insertvalue":
-        tokens.pop(0)
+    while tokens.peek() != "insertvalue":
+        tokens.advance()
 
     # pop the insertvalue instruction
-    tokens.pop(0)
+    tokens.advance()
 
     # get the object type
     object_type, tokens = get_type(tokens)
     insertvalue_instruction.set_object_type(object_type)
 
     # get the original object
-    insertvalue_instruction.set_original(tokens[0].replace(",", ""))
-    tokens.pop(0)
+    insertvalue_instruction.set_original(tokens.peek().replace(",", ""))
+    tokens.advance()
 
     # get the type and value that is to be inserted
     insert_type, tokens = get_type(tokens)
@@ -30,7 +33,7 @@ def analyze_insertvalue(tokens):
 
     value, tokens = get_value(tokens)
     insertvalue_instruction.set_insert_value(value)
-    tokens.pop(0)
+    tokens.advance()
 
     while len(tokens) != 0:
         index, tokens = get_value(tokens)
@@ -40,6 +43,8 @@ def analyze_insertvalue(tokens):
 
 
 class Insertvalue(LlvmStatement):
+    __slots__ = ("object_type", "original", "insert_type", "insert_value", "indices")
+
     def __init__(self):
         super().__init__()
         self.object_type = None
@@ -1,6 +1,7 @@
 from llvmAnalyser.llvmChecker import *
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
+from llvmAnalyser.cursor import as_cursor
 # Aliases, unlike function or variables, don’t create any new data.
 # They are just a new symbol and metadata for an existing position.
 #
@@ -9,33 +10,35 @@ from llvmAnalyser.types import get_type
 
 
 def analyze_alias(tokens):
+    tokens = as_cursor(tokens)
+
     alias = Alias()
 
-    alias.set_name(tokens.pop(0))
+    alias.set_name(tokens.advance())
 
     # pop assignment
-    tokens.pop(0)
+    tokens.advance()
 
-    while is_linkage_type(tokens[0]):
-        tokens.pop(0)
+    while is_linkage_type(tokens.peek()):
+        tokens.advance()
 
-    while is_runtime_preemptable(tokens[0]):
-        tokens.pop(0)
+    while is_runtime_preemptable(tokens.peek()):
+        tokens.advance()
 
-    while is_visibility_style(tokens[0]):
-        tokens.pop(0)
+    while is_visibility_style(tokens.peek()):
+        tokens.advance()
 
-    while is_dll_storage_class(tokens[0]):
-        tokens.pop(0)
+    while is_dll_storage_class(tokens.peek()):
+        tokens.advance()
 
-    while is_tls(tokens[0]):
-        tokens.pop(0)
+    while is_tls(tokens.peek()):
+        tokens.advance()
 
-    while is_unnamed_addr(tokens[0]):
-        tokens.pop(0)
+    while is_unnamed_addr(tokens.peek()):
+        tokens.advance()
 
     # pop the alias token
-    tokens.pop(0)
+    tokens.advance()
 
     # skip the alias type
     _, tokens = get_type(tokens)
@@ -44,12 +47,14 @@ def analyze_alias(tokens):
     _, tokens = get_type(tokens)
 
     # get the alliasee
-    alias.set_aliasee(tokens.pop(0))
+    alias.set_aliasee(tokens.advance())
 
     return alias
 
 
 class Alias(LlvmStatement):
+    __slots__ = ("name", "aliasee")
+
     def __init__(self):
         super().__init__()
         self.name = None
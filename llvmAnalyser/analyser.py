@@ -1,54 +1,156 @@
 from graph.graph import Graph
-from yaml import load
 from copy import copy
+from os import path
 import re
 
-try:
-    from yaml import CLoader as Loader
-except ImportError:
-    from yaml import Loader
-
+from llvmAnalyser.index import load_module, load_module_set
+from llvmAnalyser.cache import FunctionCache
+from llvmAnalyser.incremental import IncrementalState, get_fingerprint, get_body_hash, get_state_path, read_state, \
+    write_state
 from llvmAnalyser.function import FunctionHandler
 from llvmAnalyser.attributes import AttributeGroupHandler
-from llvmAnalyser.alias import analyze_alias
-
-from llvmAnalyser.terminator.ret import analyze_ret
-from llvmAnalyser.terminator.br import analyze_br
-from llvmAnalyser.terminator.switch import analyze_switch
-from llvmAnalyser.terminator.indirectbr import analyze_inidrectbr
-from llvmAnalyser.terminator.invoke import analyze_invoke, Invoke
-from llvmAnalyser.terminator.callbr import analyze_callbr, CallBr
-from llvmAnalyser.terminator.resume import analyze_resume
-
-from llvmAnalyser.unary.fneg import analyze_fneg, Fneg
-
-from llvmAnalyser.binary.binaryOp import BinaryOpAnalyzer, BinOp
-
-from llvmAnalyser.bitwiseBinary.bitwiseBinary import analyze_bitwise_binary
-
-from llvmAnalyser.vector.extractelement import analyze_extractelement, ExtractElement
-from llvmAnalyser.vector.insertelement import analyze_insertelement, InsertElement
-from llvmAnalyser.vector.shufflevector import analyze_shufflevector, Shufflevector
-
-from llvmAnalyser.aggregate.insertvalue import analyze_insertvalue
-from llvmAnalyser.aggregate.extractvalue import analyze_extractvalue
 
-from llvmAnalyser.memoryAccess.store import analyze_store, Store
-from llvmAnalyser.memoryAccess.load import analyze_load, Load
-from llvmAnalyser.memoryAccess.cmpxchg import analyze_cmpxchg
-from llvmAnalyser.memoryAccess.atomicrmw import analyze_atomicrmw
-from llvmAnalyser.memoryAccess.getelementptr import analyze_getelementptr, Getelementptr
-
-from llvmAnalyser.conversion.conversion import analyze_conversion, Conversion
-
-from llvmAnalyser.other.cmp import analyze_cmp
-from llvmAnalyser.other.phi import analyze_phi
-from llvmAnalyser.other.select import analyze_select
-from llvmAnalyser.other.freeze import analyze_freeze
-from llvmAnalyser.other.call import analyze_call, Call
+from llvmAnalyser.registry import get_analyzer, is_statement
+from llvmAnalyser.joiner import iter_instructions, get_opcode
+from llvmAnalyser.lexer import tokenize_words
+from llvmAnalyser.symbols import SymbolTable
+from llvmAnalyser.types import type_cache
+from llvmAnalyser.values import constant_expression_cache
+from llvmAnalyser import labels
 
 block_start_format = re.compile(r'[0-9]*:')
 
+# map every instruction onto the name of the method that registers it
+# the call instruction can be preceded by a tail call marker, so that marker is mapped onto the call as well
+instructions = {
+    # Terminator instructions
+    # -----------------------
+    # Terminator instructions are used to end every basic block. It is used to redirect the execution
+    # to the next code block.
+    # The terminator instructions are:
+    #   'ret', 'br', 'switch', 'indirectbr', 'invoke', 'callbr', 'resume'
+    #   'catchswitch', 'catchret', 'cleanupret', 'unreachable'
+    "ret": "register_return",
+    "br": "register_br",
+    "switch": "register_switch",
+    "indirectbr": "register_indirectbr",
+    "invoke": "register_invoke",
+    "callbr": "register_callbr",
+    "resume": "register_resume",
+    "unreachable": "register_unreachable",
+
+    # Unary operations
+    # ----------------
+    # Unary operators require a single operand, execute an operation on it, and produce a single value.
+    # The operand might represent multiple data, as is the case with the vector data type.
+    # The result value has the same type as its operand.
+    "fneg": "register_fneg",
+
+    # Binary operations
+    # -----------------
+    # Binary operations are used for most computations in a program. They require two operands of the same type
+    # and it results in a single value on which the operation is applied.
+    "add": "register_binary_op",
+    "sub": "register_binary_op",
+    "mul": "register_binary_op",
+    "sdiv": "register_binary_op",
+    "srem": "register_binary_op",
+    "udiv": "register_binary_op",
+    "urem": "register_binary_op",
+    "fadd": "register_binary_op",
+    "fsub": "register_binary_op",
+    "fmul": "register_binary_op",
+    "fdiv": "register_binary_op",
+
+    # Bitwise binary operations
+    # -------------------------
+    # Bitwise binary operations are used to do various forms of bit-twiddling in a program. They require two
+    # operands of the same type, execute an operation on them, and produce a single value.
+    "shl": "register_bitwise_binary",
+    "lshr": "register_bitwise_binary",
+    "ashr": "register_bitwise_binary",
+    "and": "register_bitwise_binary",
+    "or": "register_bitwise_binary",
+    "xor": "register_bitwise_binary",
+
+    # Vector operations
+    # -----------------
+    # Vector operations cover element-access and vector-specific operations needed to process vectors
+    # effectively.
+    "extractelement": "register_extractelement",
+    "insertelement": "register_insertelement",
+    "shufflevector": "register_shufflevector",
+
+    # Aggregate Operations
+    # --------------------
+    # Aggregate operations are instructions that allow us to work with aggregate values.
+    "extractvalue": "register_extractvalue",
+    "insertvalue": "register_insertvalue",
+
+    # Memory Access and Addressing operations
+    # ---------------------------------------
+    # The following operations are used to read, write and allocate memory in LLVM:
+    #   'alloca, 'load', 'store', 'fence', 'cmpxchg', 'atomicrmw', 'getelementptr'
+    "load": "register_load",
+    "store": "register_store",
+    "cmpxchg": "register_cmpxchg",
+    "atomicrmw": "register_atomicrmw",
+    "getelementptr": "register_getelementptr",
+
+    # Conversion operations
+    # ---------------------
+    # Conversion operations allow the casting of variables, the following conversion operations are defined
+    # within LLVM:
+    #   'trunc .. to', 'zext .. to', 'sext .. to', 'fptrunc .. to', 'fpext .. to',
+    #   'fptoui .. to', 'fptosi .. to', 'uitofp .. to', 'sitofp .. to',
+    #   'ptrtoint .. to', 'inttoptr .. to', 'bitcast .. to', 'addrspacecast .. to'
+    "trunc": "register_conversion",
+    "zext": "register_conversion",
+    "sext": "register_conversion",
+    "fptrunc": "register_conversion",
+    "fpext": "register_conversion",
+    "fptoui": "register_conversion",
+    "fptosi": "register_conversion",
+    "uitofp": "register_conversion",
+    "sitofp": "register_conversion",
+    "ptrtoint": "register_conversion",
+    "inttoptr": "register_conversion",
+    "bitcast": "register_conversion",
+    "addrspacecast": "register_conversion",
+
+    # other operations
+    # ----------------
+    # The other instructions are specified as other, due to lack of better classification. These are general
+    # cross operation set operations. The llvm instruction set contains the following operations of type other:
+    #   'icmp', 'fcmp', 'phi', 'select', 'freeze', 'call', 'va_arg', 'landingpad', 'catchpad', 'cleanuppad'
+    "icmp": "register_cmp",
+    "fcmp": "register_cmp",
+    "phi": "register_phi",
+    "select": "register_select",
+    "freeze": "register_freeze",
+    "call": "analyze_call",
+    "tail": "analyze_call",
+    "musttail": "analyze_call",
+    "notail": "analyze_call"
+}
+
+# the instructions that do not influence the analysis, these are skipped
+skipped_instructions = {"alloca", "fence", "catchswitch", "catchret", "cleanupret", "landingpad", "catchpad",
+                        "cleanuppad"}
+
+
+# load the config, the yaml loader is only imported at this point, so that importing the analyser remains cheap
+def load_config():
+    from yaml import load
+
+    try:
+        from yaml import CLoader as Loader
+    except ImportError:
+        from yaml import Loader
+
+    with open('config.yml', 'r') as f:
+        return load(f.read(), Loader=Loader)
+
 
 # test_identifier must be a class that contains a identify test function member
 # this function should return a boolean indicating whether or not the function is a test function
@@ -56,8 +158,7 @@ block_start_format = re.compile(r'[0-9]*:')
 class LLVMAnalyser:
     def __init__(self):
         # load the config
-        with open('config.yml', 'r') as f:
-            self.config = load(f.read(), Loader=Loader)
+        self.config = load_config()
 
         # register a test analyzer to determine which function signature should be used to discover which functions
         # are tests
@@ -65,14 +166,30 @@ class LLVMAnalyser:
         self.assertion_identifier = re.compile(r'{}'.format(self.config["assertion_function_signature"]))
         self.exclusion_filter = re.compile(r'{}'.format(self.config["exclusion_filter"]))
 
-        # store the lines of the llvm file
+        # store the reader that gives access to the lines of the llvm file, as well as the index of the file
         self.lines = None
+        self.index = None
+
+        # the cache of analysed functions, this is only used if a cache directory is configured
+        self.cache = None
+
+        # keep track of the llvm file, as well as the hash and the analysis state of every function that was checked
+        # in incremental mode
+        self.file = None
+        self.function_states = dict()
+
+        # the names that are encountered throughout the analysis are interned within the symbol table of the analyser
+        self.symbols = SymbolTable()
 
         # make handlers for the specific llvm statements
-        self.function_handler = FunctionHandler()
+        self.function_handler = FunctionHandler(self.symbols)
         self.attribute_group_handler = AttributeGroupHandler()
 
-        self.binary_op_analyzer = BinaryOpAnalyzer()
+        # the binary operation analyzer is created once the first binary operation is encountered
+        self.binary_op_analyzer = None
+
+        # map every instruction onto the method that registers it
+        self.instruction_handlers = {opcode: getattr(self, handler) for opcode, handler in instructions.items()}
 
         # keep track of the graph objects
         self.graphs = dict()
@@ -96,7 +213,8 @@ class LLVMAnalyser:
         self.called_functions = dict()
 
         # keep track of the found mutation types for the functions
-        # it will be tracked per function, and per argument of said function
+        # it will be tracked per function, and per argument of said function, the key is a tuple containing the interned
+        # names of the function and the argument, as well as whether or not the argument is a reference
         self.found_mutation_types = dict()
 
         # keep track of what register we are assigning to (if any),
@@ -111,36 +229,51 @@ class LLVMAnalyser:
         self.evaluated_functions = list()
         self.functions_to_evaluate = list()
 
+        # keep track of the definitions and aliases within the llvm file, so that functions can be analysed on demand
+        self.function_names = dict()
+        self.aliases = dict()
+
+        # in lazy mode, keep track of the functions that were evaluated within the depth limit
+        self.depth_evaluated_functions = set()
+
         self.references = dict()
 
     def get_relevant_functions(self, file):
-        f = open(file, "r")
-        self.lines = [line.rstrip() for line in f.readlines()]
-        f.close()
+        # the parsed types and constant expressions are cleared along with the symbols of a previous analysis, so that
+        # the caches only keep the names of the module that is being analysed alive
+        type_cache.clear()
+        constant_expression_cache.clear()
+
+        # a directory is expected to contain the llvm files of the separate translation units
+        if path.isdir(file):
+            self.lines, index = load_module_set(file, self.config["llvm_dis"])
+        else:
+            self.lines, index = load_module(file, self.config["llvm_dis"])
+        self.index = index
+        self.file = file
 
-        indexes = [i for i in range(len(self.lines)) if " alias " in self.lines[i]]
+        if self.config["cache"]:
+            self.cache = FunctionCache(self.config["cache"], self.config["cache_size"] * 1024 * 1024)
 
-        # analyze all aliases specified within the llvm file
-        aliases = dict()
-        for index in reversed(indexes):
-            line = self.lines.pop(index)
-            tokens = list(filter(None, line.replace("\t", "").replace("\n", "").split(";")[0].split(" ")))
-            alias = analyze_alias(tokens)
-            aliases[alias.get_name()] = alias.get_aliasee()
+        aliases = index.get_aliases()
+        self.aliases = aliases
 
-        # get the line indices for all definitions
-        indexes = [i for i in range(len(self.lines)) if "define" == self.lines[i][:6]]
+        # the attribute groups reside in the global scope, and were already registered by the pre-scan, a set of
+        # modules has no attribute groups, as the ids of the groups are only unique within a single module
+        for group_id, attributes in index.get_attribute_groups().items():
+            self.attribute_group_handler.add_group(group_id, attributes)
 
-        # iterate over the definitions and analyze all test functions
+        # get the line indices for all definitions
         function_names = dict()
-        for index in reversed(indexes):
-            m = re.search(r'(@.*?\()+?', self.lines[index])
-            function_name = m.group()[:-1]
-            function_names[function_name] = index
+        for function_name, entry in index.get_functions().items():
+            function_names[function_name] = entry.get_define_line()
+        self.function_names = function_names
 
+        # iterate over the definitions and analyze all test functions
+        for function_name in sorted(function_names, key=function_names.get, reverse=True):
             if self.test_identifier.match(function_name):
                 self.evaluated_functions.append(function_name)
-                self.analyse(index)
+                self.analyse_function(function_name)
 
         # track the depth, this depth implies the number of functions we traversed, starting from the test function
         # this is limited, as we do not want to evaluate every single function to maximize efficiency
@@ -153,12 +286,18 @@ class LLVMAnalyser:
             for function_name in temp_copy:
                 if not self.assertion_identifier.match(function_name):
                     if function_name in function_names:
-                        self.analyse(function_names[function_name])
+                        self.analyse_function(function_name)
                     elif function_name in aliases:
-                        self.analyse(function_names[aliases[function_name]])
+                        self.analyse_function(aliases[function_name])
 
             depth += 1
 
+        # in lazy mode, the functions that match the exclusion filter are only analysed once their graph or their
+        # tables are actually requested by the focal method analysis
+        if self.config["lazy"]:
+            self.depth_evaluated_functions = set(self.evaluated_functions)
+            return
+
         # continue analysing all functions that match the exclusion filter, these functions are assumed to be
         # functions that are not part of the source code, and are therefore not impacted by the depth limit
         # mutations that occur at lower depths within excluded code can still lead to mutation in private functions
@@ -170,14 +309,139 @@ class LLVMAnalyser:
             for function_name in temp_copy:
                 if self.exclusion_filter.match(function_name) and self.exclusion_filter.pattern != '':
                     if function_name in function_names:
-                        self.analyse(function_names[function_name])
+                        self.analyse_function(function_name)
                     elif function_name in aliases:
-                        self.analyse(function_names[aliases[function_name]])
+                        self.analyse_function(aliases[function_name])
+
+    # check whether or not a function was analysed, in lazy mode, the function will be analysed on demand in case
+    # it would have been analysed as part of the exclusion filter closure
+    def is_analysed(self, function_name):
+        if function_name in self.node_stack or not self.config["lazy"]:
+            return function_name in self.node_stack
+
+        defined_function = self.get_lazy_function(function_name)
+        if defined_function is None:
+            return False
+
+        # the analysis of a function overwrites the opened function, so restore it afterwards
+        temp = self.opened_function
+        self.analyse_function(defined_function)
+        self.opened_function = temp
+
+        return function_name in self.node_stack
+
+    # get the definition that is analysed once the function is requested in lazy mode, without analysing it, None is
+    # returned in case the function would not be analysed
+    def get_lazy_function(self, function_name):
+        # functions encountered within the depth limit were already analysed, or deliberately skipped
+        if function_name in self.depth_evaluated_functions:
+            return None
+
+        if self.exclusion_filter.pattern == '' or not self.exclusion_filter.match(function_name):
+            return None
+
+        if function_name in self.function_names:
+            return function_name
+
+        # the aliasee is registered under its own name, so the alias itself never counts as analysed
+        if function_name in self.aliases and self.aliases[function_name] in self.function_names and \
+                self.aliases[function_name] not in self.node_stack:
+            return self.aliases[function_name]
+
+        return None
+
+    # analyse the function that is defined under the given name, in case the function cache is enabled, the result
+    # of a previous analysis of the same function body is reused
+    def analyse_function(self, function_name):
+        entry = self.index.get_function(function_name)
+
+        if self.cache is None:
+            self.analyse(entry.get_define_line())
+            return
+
+        key = self.cache.get_key(self.lines.read(entry.get_start(), entry.get_end()))
+        data = self.cache.load(key)
+        if data is not None:
+            self.restore_function(function_name, data)
+            return
+
+        self.analyse(entry.get_define_line())
+
+        # only cache the function if it got registered under the name used within the index
+        if function_name in self.graphs:
+            self.cache.store(key, (self.function_handler.get_function(function_name),
+                                   self.graphs[function_name],
+                                   self.node_stack[function_name],
+                                   self.stores[function_name],
+                                   self.loads[function_name],
+                                   self.references[function_name],
+                                   self.assignments[function_name],
+                                   self.returns[function_name],
+                                   self.called_functions[function_name]))
+
+    # register a function that was loaded from the function cache, as if it was just analysed
+    def restore_function(self, function_name, data):
+        function, graph, node_stack, stores, loads, references, assignments, returns, called_functions = data
+        self.opened_function = function_name
+
+        # the names that were unpickled are copies, so they are interned again, just like the names that are parsed
+        self.function_handler.add_function(function)
+        self.stores[function_name] = self.symbols.intern_table(stores)
+        self.loads[function_name] = self.symbols.intern_table(loads)
+        self.references[function_name] = self.symbols.intern_table(references)
+        self.assignments[function_name] = self.symbols.intern_table(assignments)
+        self.returns[function_name] = returns
+        self.called_functions[function_name] = self.symbols.intern_table(called_functions)
+        self.graphs[function_name] = graph
+        self.node_stack[function_name] = node_stack
+        for block_name in graph.block_map:
+            self.node_stack["{}:{}".format(function_name, block_name)] = list()
+
+        # the marks that depend upon the configured signatures are determined again, as the configuration might differ
+        # from the one that was used when the function was cached
+        root_node = graph.nodes[0]
+        root_node.reset_marks()
+        graph.reset_test_func()
+        self.register_function(function_name, root_node)
+
+        for node in graph.nodes.values():
+            context = node.get_context()
+            if is_statement(context, "Call", "Invoke", "CallBr"):
+                self.intern_call(context)
+                self.register_called_function(context.get_function_name())
+                if not is_statement(context, "Invoke"):
+                    self.register_top_graph_edge(context.get_function_name())
+
+        self.register_function_end()
+
+    # intern the names of a call, either when it is parsed or when it is loaded from the function cache
+    def intern_call(self, context):
+        if is_statement(context, "Invoke"):
+            context.set_func(self.symbols.intern(context.get_function_name()))
+            self.intern_arguments(context.get_arguments())
+        elif is_statement(context, "CallBr"):
+            context.set_function(self.symbols.intern(context.get_function_name()))
+            self.intern_arguments(context.get_function_arguments())
+        else:
+            context.set_function_name(self.symbols.intern(context.get_function_name()))
+            self.intern_arguments(context.get_arguments())
+
+    def intern_arguments(self, arguments):
+        for argument in arguments:
+            argument.set_parameter_type(self.symbols.intern(argument.get_parameter_type()))
+            argument.set_register(self.symbols.intern(argument.get_register()))
 
     def get_focal_methods(self):
         # keep track of the functions under test for each test function
         focal_methods = dict()
 
+        # in incremental mode, the focal methods of the previous run are reused for every test function whose
+        # call closure did not change
+        if self.config["incremental"]:
+            fingerprint = self.get_state_fingerprint()
+            previous_state = read_state(get_state_path(self.file), fingerprint)
+            state = IncrementalState(fingerprint)
+
         for function in self.evaluated_functions:
             # skip all non test functions
             if not self.test_identifier.match(function):
@@ -190,6 +454,22 @@ class LLVMAnalyser:
             if len(assertions) == 0:
                 continue
 
+            if self.config["incremental"] and previous_state is not None:
+                previous_test = previous_state.get_test(function)
+                if previous_test is not None and self.is_unchanged(previous_state, previous_test[1]):
+                    focal_methods[function] = set(previous_test[0])
+                    state.add_test(function, focal_methods[function],
+                                   {name: previous_state.get_function(name) for name in previous_test[1]},
+                                   previous_test[2])
+
+                    # restore the mutation types that were found for the test, so that the tests that are analysed
+                    # afterwards start from the same mutation types as they would without the previous run
+                    for (function_name, argument, is_ref), mutation_type in previous_test[2]:
+                        key = (self.symbols.intern(function_name), self.symbols.intern(argument), is_ref)
+                        self.found_mutation_types.setdefault(key, mutation_type)
+                    continue
+
+            found_mutation_types = len(self.found_mutation_types)
             focal_methods[function] = set()
             self.opened_function = function
 
@@ -207,6 +487,13 @@ class LLVMAnalyser:
                         methods = self.find_focal_methods(arguments[i].get_name(), inc)
                         focal_methods[function] = focal_methods[function].union(methods)
 
+            if self.config["incremental"]:
+                state.add_test(function, focal_methods[function], self.get_closure(function),
+                               list(self.found_mutation_types.items())[found_mutation_types:])
+
+        if self.config["incremental"]:
+            write_state(get_state_path(self.file), state)
+
         # iterate over all defined graphs
         for graph in self.graphs:
             # we only want to draw test functions
@@ -221,6 +508,65 @@ class LLVMAnalyser:
 
         return focal_methods
 
+    def get_state_fingerprint(self):
+        return get_fingerprint(self.test_identifier, self.assertion_identifier, self.exclusion_filter,
+                               self.config["max_depth"])
+
+    # get the call closure of a function, mapping every function that can be reached through the analysed functions
+    # onto the hash of its body and whether or not it was analysed
+    def get_closure(self, function_name):
+        closure = dict()
+
+        stack = [function_name]
+        while stack:
+            name = stack.pop()
+            if name in closure:
+                continue
+
+            closure[name] = self.get_function_state(name)
+
+            # only the calls of the functions that were actually analysed are known
+            if name in self.node_stack:
+                for used_function in self.function_handler.get_used_functions(name):
+                    stack.append(used_function.get_context().get_function_name())
+
+        return closure
+
+    def get_function_state(self, function_name):
+        if function_name not in self.function_states:
+            entry = self.index.get_function(function_name)
+            if entry is None:
+                body_hash = None
+            else:
+                body_hash = get_body_hash(self.lines.read(entry.get_start(), entry.get_end()))
+            # in lazy mode, a function that would be analysed on demand counts as analysed, whether or not the focal
+            # methods requested it so far, so that its state is the same throughout the run
+            analysed = function_name in self.node_stack or \
+                (self.config["lazy"] and self.get_lazy_function(function_name) is not None)
+            self.function_states[function_name] = (body_hash, analysed)
+        return self.function_states[function_name]
+
+    # check whether or not all functions within a closure of the previous run are still the same
+    def is_unchanged(self, previous_state, closure):
+        for function_name in closure:
+            if previous_state.get_function(function_name) != self.get_function_state(function_name):
+                return False
+        return True
+
+    # get the numbered register that is assigned to by the node, if any, without rendering the label of the node
+    def get_assigned_register(self, node):
+        assignee = node.get_assignee()
+        if assignee is not None:
+            assignee = assignee.split(" = ", 1)[0]
+        elif is_statement(node.get_context(), "Store") and node.get_label() is not None:
+            assignee = node.get_context().get_register()
+        else:
+            return None
+
+        if assignee[:1] != "%" or not assignee[1:].isdigit():
+            return None
+        return assignee
+
     def get_assertions(self, function):
         assertions = list()
 
@@ -281,7 +627,6 @@ class LLVMAnalyser:
 
                 # capture the relevant data from the node
                 context = test_node.get_context()
-                node_name = test_node.get_name()
 
                 # track some attributes of our current node
                 test_is_arg = False
@@ -299,14 +644,14 @@ class LLVMAnalyser:
                 is_intrinsic = False
 
                 # verify whether or not a function was used
-                if isinstance(context, (Call, Invoke, CallBr)):
+                if is_statement(context, "Call", "Invoke", "CallBr"):
 
                     # register that our context is indeed a function call
                     is_func_call = True
                     arguments = context.get_arguments()
                     function_name = context.get_function_name()
 
-                    if function_name in self.node_stack:
+                    if self.is_analysed(function_name):
                         is_defined = True
 
                     if re.match(r'@llvm\.(memcpy|memset|memmove).*', function_name):
@@ -333,12 +678,13 @@ class LLVMAnalyser:
                     if self.exclusion_filter.pattern != "" and self.exclusion_filter.match(function_name):
                         is_excluded = True
 
-                # verify whether or not an assignment occurred
-                if re.match(r'^%\d*? = .*?$', node_name):
+                # verify whether or not an assignment to a numbered register occurred, a store assigns to the register
+                # it stores to, the label of the node is never rendered for this
+                assignee = self.get_assigned_register(test_node)
+                if assignee is not None:
 
                     # if the test var is the assignee, we need to consider all used variables in the rhs as being
                     # potential variables used in the mutation of our test var
-                    assignee = node_name.split(" = ")[0]
                     if assignee == test_var:
                         test_is_assignee = True
 
@@ -369,25 +715,13 @@ class LLVMAnalyser:
                         temp = self.opened_function
                         self.opened_function = function_name
 
-                        if self.opened_function in self.found_mutation_types:
-                            if reg in self.found_mutation_types[self.opened_function]:
-                                if False in self.found_mutation_types[self.opened_function][reg]:
-                                    mutator = self.found_mutation_types[self.opened_function][reg][False]
-                                else:
-                                    self.found_mutation_types[self.opened_function][reg][False] = "inspector"
-                                    mutator, _ = self.is_arg_mutated(reg, callee_attribute.is_pointer())
-                                    self.found_mutation_types[self.opened_function][reg][False] = mutator
-                            else:
-                                self.found_mutation_types[self.opened_function][reg] = dict()
-                                self.found_mutation_types[self.opened_function][reg][False] = "inspector"
-                                mutator, _ = self.is_arg_mutated(reg, callee_attribute.is_pointer())
-                                self.found_mutation_types[self.opened_function][reg][False] = mutator
+                        key = (self.opened_function, reg, False)
+                        if key in self.found_mutation_types:
+                            mutator = self.found_mutation_types[key]
                         else:
-                            self.found_mutation_types[self.opened_function] = dict()
-                            self.found_mutation_types[self.opened_function][reg] = dict()
-                            self.found_mutation_types[self.opened_function][reg][False] = "inspector"
+                            self.found_mutation_types[key] = "inspector"
                             mutator, _ = self.is_arg_mutated(reg, callee_attribute.is_pointer())
-                            self.found_mutation_types[self.opened_function][reg][False] = mutator
+                            self.found_mutation_types[key] = mutator
 
                         self.opened_function = temp
 
@@ -416,24 +750,24 @@ class LLVMAnalyser:
 
                 # check if our variable was assigned to a reference, in that case, the object from which it is a
                 # reference now contains our variable under tests, and is therefore also a variable under test
-                if isinstance(context, Store):
+                if is_statement(context, "Store"):
                     if test_var == context.get_value():
                         if assignee in self.references[self.opened_function]:
                             next_iteration.append((self.references[self.opened_function][assignee], root, True, 0))
 
                 # check if we loaded a reference of our test var that contains a reference to our original test var
-                if isinstance(context, Load) and contains:
+                if is_statement(context, "Load") and contains:
                     loaded_var = context.get_value()
                     for lhs, rhs in self.references[self.opened_function].items():
                         if rhs == test_var and lhs == loaded_var:
                             next_iteration.append((assignee, root, False, 0))
 
                 # check if we created a reference of our test var
-                if isinstance(context, Getelementptr) and context.get_value() == test_var:
+                if is_statement(context, "Getelementptr") and context.get_value() == test_var:
                     next_iteration.append((assignee, root, contains, 0))
 
                 # check if we casted a variable that contained our original test var to a var of different type
-                if isinstance(context, Conversion) and context.get_value() == test_var:
+                if is_statement(context, "Conversion") and context.get_value() == test_var:
                     next_iteration.append((assignee, root, contains, 0))
 
                 # check if we called an intrinsic memory move function upon a variable that contained our
@@ -480,7 +814,7 @@ class LLVMAnalyser:
                 # this means the function was never analysed, and was therefore not defined
                 # in case it was defined, but below the max depth, our current depth will be equal to the
                 # max depth, and we will not consider the function as being uncertain
-                if self.opened_function not in self.node_stack and recursion_depth < self.config["max_depth"]:
+                if not self.is_analysed(self.opened_function) and recursion_depth < self.config["max_depth"]:
                     return "uncertain", False
 
                 used_functions = self.function_handler.get_used_functions(self.opened_function)
@@ -490,7 +824,7 @@ class LLVMAnalyser:
                     func_name = context.get_function_name()
                     intrinsic_functions = r'@llvm\.(memcopy|memset|memmove).*'
                     arg_regs = context.get_argument_registers()
-                    if tracked_variable in arg_regs and func_name in self.node_stack:
+                    if tracked_variable in arg_regs and self.is_analysed(func_name):
                         temp = self.opened_function
                         self.opened_function = context.get_function_name()
                         index = context.get_argument_registers().index(tracked_variable)
@@ -498,25 +832,13 @@ class LLVMAnalyser:
                         new_function_args = function.get_argument_registers()
                         new_var = new_function_args[index]
 
-                        if self.opened_function in self.found_mutation_types:
-                            if new_var in self.found_mutation_types[self.opened_function]:
-                                if is_ref in self.found_mutation_types[self.opened_function][new_var]:
-                                    mut = self.found_mutation_types[self.opened_function][new_var][is_ref]
-                                else:
-                                    self.found_mutation_types[self.opened_function][new_var][is_ref] = "inspector"
-                                    mut, ref = self.is_arg_mutated(new_var, is_ref, recursion_depth + 1)
-                                    self.found_mutation_types[self.opened_function][new_var][is_ref] = mut
-                            else:
-                                self.found_mutation_types[self.opened_function][new_var] = dict()
-                                self.found_mutation_types[self.opened_function][new_var][is_ref] = "inspector"
-                                mut, ref = self.is_arg_mutated(new_var, is_ref, recursion_depth + 1)
-                                self.found_mutation_types[self.opened_function][new_var][is_ref] = mut
+                        key = (self.opened_function, new_var, is_ref)
+                        if key in self.found_mutation_types:
+                            mut = self.found_mutation_types[key]
                         else:
-                            self.found_mutation_types[self.opened_function] = dict()
-                            self.found_mutation_types[self.opened_function][new_var] = dict()
-                            self.found_mutation_types[self.opened_function][new_var][is_ref] = "inspector"
+                            self.found_mutation_types[key] = "inspector"
                             mut, ref = self.is_arg_mutated(new_var, is_ref, recursion_depth + 1)
-                            self.found_mutation_types[self.opened_function][new_var][is_ref] = mut
+                            self.found_mutation_types[key] = mut
 
                         self.opened_function = temp
 
@@ -529,7 +851,7 @@ class LLVMAnalyser:
                             re.match(intrinsic_functions, func_name):
                         return "mutator", False
 
-                    elif tracked_variable in arg_regs and func_name not in self.node_stack and \
+                    elif tracked_variable in arg_regs and not self.is_analysed(func_name) and \
                             recursion_depth + 1 < self.config["max_depth"]:
                         mutation_type = "uncertain"
 
@@ -585,260 +907,35 @@ class LLVMAnalyser:
         return mutation_type, returns_ref
 
     def analyse(self, i):
-        while i < len(self.lines):
-            tokens = list(filter(None, self.lines[i].replace("\t", "").replace("\n", "").split(";")[0].split(" ")))
-
-            if len(tokens) == 0:
-                i += 1
-                continue
-
-            # register assignment
-            if "=" in tokens and self.opened_function is not None:
-                self.analyze_assignment(tokens)
+        for instruction in iter_instructions(self.lines, i):
+            tokens = instruction.get_tokens()
 
             # register new function definition
             if tokens[0] == "define":
                 self.analyze_define(tokens)
+                continue
 
             # register attribute group
-            elif tokens[0] == "attributes":
+            if tokens[0] == "attributes":
                 self.analyze_attribute_group(tokens)
-
-            # skip global scope
-            elif self.opened_function is None:
-                i += 1
-                continue
-
-            # Terminator instructions
-            # -----------------------
-            # Terminator instructions are used to end every basic block. It is used to redirect the execution
-            # to the next code block.
-            # The terminator instructions are:
-            #   'ret', 'br', 'switch', 'indirectbr', 'invoke', 'callbr', 'resume'
-            #   'catchswitch', 'catchret', 'cleanupret', 'unreachable'
-
-            # register ret statement
-            elif tokens[0] == "ret":
-                self.register_return(tokens)
-
-            # register br statement
-            elif "br" in tokens:
-                self.register_br(tokens)
-
-            # register switch statement
-            elif "switch" in tokens:
-                while "]" not in tokens:
-                    tokens += list(filter(None, self.lines[i + 1].replace("\t", "").replace("\n", "").split(" ")))
-                    i += 1
-                self.register_switch(tokens)
-
-            # register indirectbr statement
-            elif "indirectbr" in tokens:
-                self.register_indirectbr(tokens)
-
-            # register invoke statement
-            elif "invoke" in tokens:
-                tokens += list(filter(None, self.lines[i + 1].replace("\t", "").replace("\n", "").split(" ")))
-                i += 1
-                self.register_invoke(tokens)
-
-            # register callbr statement
-            elif "callbr" in tokens:
-                self.register_callbr(tokens)
-
-            # register resume statement
-            elif "resume" in tokens:
-                self.register_resume(tokens)
-
-            # skip catchswitch
-            elif "catchswitch" in tokens:
-                i += 1
-                continue
-
-            # skip catchret
-            elif "catchret" in tokens:
-                i += 1
-                continue
-
-            # skip cleanupret
-            elif "cleanupret" in tokens:
-                i += 1
                 continue
 
-            # register unreachable statement
-            elif "unreachable" in tokens:
-                self.register_unreachable()
-
-            # Unary operations
-            # ----------------
-            # Unary Operations
-            # Unary operators require a single operand, execute an operation on it, and produce a single value.
-            # The operand might represent multiple data, as is the case with the vector data type.
-            # The result value has the same type as its operand.
-
-            # register unary operation
-            elif len(tokens) > 2 and tokens[2] == "fneg":
-                self.register_fneg(tokens)
-
-            # Binary operations
-            # -----------------
-            # Binary operations are used for most computations in a program. They require two operands of the same type
-            # and it results in a single value on which the operation is applied.
-
-            # register binary integer operation
-            elif len(tokens) > 2 and tokens[2] in ["add", "sub", "mul", "sdiv", "srem", "udiv",
-                                                   "urem", "fadd", "fsub", "fmul", "fdiv"]:
-                self.register_binary_op(tokens)
-
-            # Bitwise binary operations
-            # -------------------------
-            # Bitwise binary operations are used to do various forms of bit-twiddling in a program. They require two
-            # operands of the same type, execute an operation on them, and produce a single value. The following
-            # bitwise binary operations exist within llvm:
-            #   'shl', 'lshr', 'ashr', 'and', 'or', 'xor'
-
-            # register bitwise binary instruction
-            elif len(tokens) > 2 and tokens[2] in ["shl", "lshr", "ashr", "and", "or", "xor"] and \
-                    tokens[1] == "=":
-                self.register_bitwise_binary(tokens)
-
-            # Vector operations
-            # -----------------
-            # Vector operations cover element-access and vector-specific operations needed to process vectors
-            # effectively.
-            # The vector instructions are:
-            #   'extractelement', 'insertelement', 'shufflevector'
-
-            # register extractelement statement
-            elif len(tokens) > 2 and tokens[2] == "extractelement":
-                self.register_extractelement(tokens)
-
-            # register insertelement statement
-            elif len(tokens) > 2 and tokens[2] == "insertelement":
-                self.register_insertelement(tokens)
-
-            # register shufflevector statement
-            elif len(tokens) > 2 and tokens[2] == "shufflevector":
-                self.register_shufflevector(tokens)
-
-            # Aggregate Operations
-            # --------------------
-            # Aggregate operations are instructions that allow us to work with aggregate values.
-            # The aggregate instructions are:
-            #   'extractvalue', 'insertvalue'
-
-            # register extractvalue statement
-            elif len(tokens) > 2 and tokens[2] == "extractvalue":
-                self.register_extractvalue(tokens)
-
-            # register insertvalue statement
-            elif len(tokens) > 2 and tokens[2] == "insertvalue":
-                self.register_insertvalue(tokens)
-
-            # Memory Access and Addressing operations
-            # ---------------------------------------
-            # The following operations are used to read, write and allocate memory in LLVM:
-            #   'alloca, 'load', 'store', 'fence', 'cmpxchg', 'atomicrmw', 'getelementptr'
-
-            # register alloca statement
-            elif "alloca" in tokens:
-                self.assignee = None
-                i += 1
-                continue
-
-            # register load statement
-            elif "load" in tokens:
-                self.register_load(tokens)
-
-            # register store statement
-            elif "store" in tokens:
-                self.register_store(tokens)
-
-            # register fence statement
-            elif "fence" in tokens:
-                i += 1
+            # skip global scope
+            if self.opened_function is None:
                 continue
 
-            # register cmpxchg statement
-            elif "cmpxchg" in tokens:
-                self.register_cmpxchg(tokens)
-
-            # register atomicrmx statement
-            elif "atomicrmw" in tokens:
-                self.register_atomicrmw(tokens)
-
-            # register getelementptr statement
-            elif len(tokens) > 2 and tokens[2] == "getelementptr" and tokens[1] == "=":
-                self.register_getelementptr(tokens)
-
-            # Conversion operations
-            # ---------------------
-            # Conversion operations allow the casting of variables, the following conversion operations are defined
-            # within LLVM:
-            #   'trunc .. to', 'zext .. to', 'sext .. to', 'fptrunc .. to', 'fpext .. to',
-            #   'fptoui .. to', 'fptosi .. to', 'uitofp .. to', 'sitofp .. to',
-            #   'ptrtoint .. to', 'inttoptr .. to', 'bitcast .. to', 'addrspacecast .. to'
-
-            # register conversion statement
-            elif len(tokens) > 2 and tokens[2] in ["trunc", "zext", "sext", "fptrunc",
-                                                   "fpext", "fptoui", "fptosi", "uitofp",
-                                                   "sitofp", "ptrtoint", "inttoptr", "bitcast",
-                                                   "addrspacecast"] \
-                    and tokens[1] == "=":
-                self.register_conversion(tokens)
-
-            # other operations
-            # ----------------
-            # The other instructions are specified as other, due to lack of better classification. These are general
-            # cross operation set operations. The llvm instruction set contains the following operations of type other:
-            #   'icmp', 'fcmp', 'phi', 'select', 'freeze', 'call', 'va_arg', 'landingpad', 'catchpad', 'cleanuppad'
-
-            # register icmp statement
-            elif len(tokens) > 2 and tokens[1] == "=" and tokens[2] in ["icmp", "fcmp"]:
-                self.register_cmp(tokens)
-
-            # register phi statement
-            elif len(tokens) > 2 and tokens[1] == "=" and tokens[2] == "phi":
-                self.register_phi(tokens)
-
-            # register select statement
-            elif "select" in tokens:
-                self.register_select(tokens)
-
-            # register freeze statement
-            elif "freeze" in tokens:
-                self.register_freeze(tokens)
-
-            # register function call
-            elif "call" in tokens:
-                self.analyze_call(tokens)
-
-            # register landingpad statement
-            elif "landingpad" in tokens:
-                while True:
-                    if "catch" in self.lines[i + 1]:
-                        i += 1
-                    elif "cleanup" in self.lines[i + 1]:
-                        i += 1
-                    elif "filter" in self.lines[i + 1]:
-                        i += 1
-                    else:
-                        break
+            # register assignment
+            if len(tokens) > 1 and tokens[1] == "=":
+                self.analyze_assignment(tokens)
 
-                self.assignee = None
-                i += 1
-                continue
+            opcode = get_opcode(tokens)
 
-            # register catchpad statement
-            elif "catchpad" in tokens:
-                self.assignee = None
-                i += 1
-                continue
+            if opcode in self.instruction_handlers:
+                self.instruction_handlers[opcode](tokens)
 
-            # register clenuppad statement
-            elif "cleanuppad" in tokens:
+            # skip the instructions that are not analyzed
+            elif opcode in skipped_instructions:
                 self.assignee = None
-                i += 1
                 continue
 
             # register new code block
@@ -851,42 +948,37 @@ class LLVMAnalyser:
                 self.register_function_end()
                 return
 
-            elif self.opened_function is not None:
+            else:
                 print("Error: unregistered instruction!")
                 print(tokens)
-                print(self.lines[i])
+                print(self.lines[instruction.get_first_line()])
 
             if self.assignee is not None:
-                new_name = "{} = {}".format(self.assignee, self.node_stack[self.opened_function][-1].get_name())
                 top_node = self.node_stack[self.opened_function][-1]
-                top_node.set_name(new_name)
+                top_node.set_assignee(self.assignee)
 
-                if isinstance(self.rhs, Load):
+                if is_statement(self.rhs, "Load"):
                     self.loads[self.opened_function][self.assignee] = self.rhs
 
-                elif isinstance(self.rhs, Getelementptr):
-                    self.references[self.opened_function][self.assignee] = self.rhs.get_value()
+                elif is_statement(self.rhs, "Getelementptr"):
+                    self.references[self.opened_function][self.assignee] = self.symbols.intern(self.rhs.get_value())
 
-                elif isinstance(self.rhs, (Conversion, Fneg)):
-                    self.assignments[self.opened_function][self.assignee] = self.rhs.get_value()
+                elif is_statement(self.rhs, "Conversion", "Fneg"):
+                    self.assignments[self.opened_function][self.assignee] = self.symbols.intern(self.rhs.get_value())
 
-                elif isinstance(self.rhs, (ExtractElement, InsertElement, Shufflevector)):
+                elif is_statement(self.rhs, "ExtractElement", "InsertElement", "Shufflevector"):
                     self.assignments[self.opened_function][self.assignee] = self.rhs.get_vector_value()
 
-                elif isinstance(self.rhs, BinOp):
+                elif is_statement(self.rhs, "BinOp"):
                     self.assignments[self.opened_function][self.assignee] = self.rhs.get_value1()
                     self.assignments[self.opened_function][self.assignee] = self.rhs.get_value2()
 
-                elif isinstance(self.rhs, (Call, CallBr, Invoke)):
+                elif is_statement(self.rhs, "Call", "CallBr", "Invoke"):
                     self.called_functions[self.opened_function][self.assignee] = self.rhs
 
                 self.rhs = None
                 self.assignee = None
 
-            i += 1
-
-        return
-
     def analyze_define(self, tokens):
         self.opened_function = self.function_handler.identify_function(tokens)
         self.stores[self.opened_function] = dict()
@@ -898,17 +990,21 @@ class LLVMAnalyser:
         self.graphs[self.opened_function] = Graph()
         self.node_stack[self.opened_function] = list()
         new_node = self.add_node(self.opened_function)
-        if self.opened_function not in self.top_graph_nodes:
-            top_graph_node = self.top_graph.add_node(self.opened_function)
-            self.top_graph_nodes[self.opened_function] = top_graph_node
-        if self.test_identifier.match(self.opened_function):
-            self.top_graph_nodes[self.opened_function].set_test()
-            self.graphs[self.opened_function].set_test_func()
-            new_node.set_test()
-            self.graphs[self.opened_function].add_assertion(new_node)
-        if self.assertion_identifier.match(self.opened_function):
-            self.top_graph_nodes[self.opened_function].set_assertion()
-            new_node.set_assertion()
+        self.register_function(self.opened_function, new_node)
+
+    # register the function within the top graph, and mark it according to the configured signatures
+    def register_function(self, function_name, root_node):
+        if function_name not in self.top_graph_nodes:
+            top_graph_node = self.top_graph.add_node(function_name)
+            self.top_graph_nodes[function_name] = top_graph_node
+        if self.test_identifier.match(function_name):
+            self.top_graph_nodes[function_name].set_test()
+            self.graphs[function_name].set_test_func()
+            root_node.set_test()
+            self.graphs[function_name].add_assertion(root_node)
+        if self.assertion_identifier.match(function_name):
+            self.top_graph_nodes[function_name].set_assertion()
+            root_node.set_assertion()
 
     def analyze_attribute_group(self, tokens):
         self.attribute_group_handler.identify_attribute_groups(tokens)
@@ -925,16 +1021,13 @@ class LLVMAnalyser:
     # register_unreachable()
 
     def register_return(self, tokens):
-        self.rhs = analyze_ret(tokens)
+        self.rhs = get_analyzer("ret")(tokens)
         if self.rhs.get_value() is not None:
-            label = "ret {}".format(self.rhs.get_value())
             self.returns[self.opened_function].append(self.rhs.get_value())
-        else:
-            label = "ret"
-        self.register_statement(label)
+        self.register_statement(labels.get_return_label)
 
     def register_br(self, tokens):
-        self.rhs = analyze_br(tokens)
+        self.rhs = get_analyzer("br")(tokenize_words(tokens))
         new_node = self.register_statement("br")
 
         block_name = "{}:{}".format(self.opened_function, self.rhs.get_label1())
@@ -947,36 +1040,38 @@ class LLVMAnalyser:
             self.graphs[self.opened_function].add_edge(new_node, second_branch)
 
     def register_switch(self, tokens):
-        self.rhs = analyze_switch(tokens)
+        self.rhs = get_analyzer("switch")(tokenize_words(tokens))
         new_node = self.register_statement("switch")
 
         block_name = "{}:{}".format(self.opened_function, self.rhs.get_default())
         def_node = self.get_first_node_of_block(block_name)
         self.graphs[self.opened_function].add_edge(new_node, def_node, "default")
 
-        for branch in self.rhs.get_branches():
-            block_name = "{}:{}".format(self.opened_function, branch.get_destination())
+        # the cases that lead to the same block share a single edge
+        for destination in self.rhs.get_destinations():
+            block_name = "{}:{}".format(self.opened_function, destination)
             branch_node = self.get_first_node_of_block(block_name)
-            self.graphs[self.opened_function].add_edge(new_node, branch_node, "= {}".format(branch.get_condition()))
+            self.graphs[self.opened_function].add_edge(new_node, branch_node, labels.get_switch_edge_label,
+                                                       (self.rhs, destination))
 
     def register_indirectbr(self, tokens):
-        self.rhs = analyze_inidrectbr(tokens)
+        self.rhs = get_analyzer("indirectbr")(tokenize_words(tokens))
         new_node = self.register_statement("indirectbr")
 
         for label in self.rhs.get_labels():
             block_name = "{}:{}".format(self.opened_function, label)
             branch_node = self.get_first_node_of_block(block_name)
-            self.graphs[self.opened_function].add_edge(new_node, branch_node, "{} == {}".format(self.rhs.get_address(),
-                                                                                                label))
+            self.graphs[self.opened_function].add_edge(new_node, branch_node, labels.get_indirectbr_edge_label,
+                                                       (self.rhs, label))
 
     def register_invoke(self, tokens):
-        self.rhs = analyze_invoke(tokens)
+        self.rhs = get_analyzer("invoke")(tokens)
+        self.intern_call(self.rhs)
         func_name = self.rhs.get_function_name()
-        new_node = self.register_statement("invoke {}".format(func_name))
+        new_node = self.register_statement(labels.get_invoke_label)
         self.function_handler.add_invoke(self.opened_function, new_node)
 
-        if func_name not in self.evaluated_functions and func_name not in self.functions_to_evaluate:
-            self.functions_to_evaluate.append(func_name)
+        self.register_called_function(func_name)
 
         for argument in self.rhs.get_arguments():
             argument_node = self.graphs[self.opened_function].add_node(argument.get_register())
@@ -991,18 +1086,17 @@ class LLVMAnalyser:
         self.graphs[self.opened_function].add_edge(new_node, exception_node, "exception")
 
         # move the main node to the back of the list, so that the assignment can be handled properly
-        index = self.node_stack[self.opened_function].index(new_node)
-        self.node_stack[self.opened_function].append(self.node_stack[self.opened_function].pop(index))
+        self.move_to_top(new_node)
 
     def register_callbr(self, tokens):
-        self.rhs = analyze_callbr(tokens)
+        self.rhs = get_analyzer("callbr")(tokens)
+        self.intern_call(self.rhs)
         prev_node = self.node_stack[self.opened_function][-1]
         function_name = self.rhs.get_function_name()
-        new_node = self.add_node("call {}".format(function_name), self.rhs)
+        new_node = self.add_node(None, self.rhs, labels.get_call_label)
         self.function_handler.add_callbr(self.opened_function, new_node)
 
-        if function_name not in self.evaluated_functions and function_name not in self.functions_to_evaluate:
-            self.functions_to_evaluate.append(function_name)
+        self.register_called_function(function_name)
 
         for argument in self.rhs.get_function_arguments():
             argument_node = self.graphs[self.opened_function].add_node(argument.get_argument_name())
@@ -1010,24 +1104,16 @@ class LLVMAnalyser:
 
         self.graphs[self.opened_function].add_edge(prev_node, new_node)
 
-        if function_name in self.top_graph_nodes:
-            final_node = self.top_graph_nodes[function_name]
-        else:
-            final_node = self.top_graph.add_node(function_name)
-            self.top_graph_nodes[function_name] = final_node
-        first_node = self.top_graph_nodes[self.opened_function]
-        self.top_graph.add_edge(first_node, final_node)
+        self.register_top_graph_edge(function_name)
 
         # move the main node to the back of the list, so that the assignment can be handled properly
-        index = self.node_stack[self.opened_function].index(new_node)
-        self.node_stack[self.opened_function].append(self.node_stack[self.opened_function].pop(index))
+        self.move_to_top(new_node)
 
     def register_resume(self, tokens):
-        self.rhs = analyze_resume(tokens)
-        node_name = "resume {} {}".format(self.rhs.get_type(), self.rhs.get_type())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("resume")(tokens)
+        self.register_statement(labels.get_resume_label)
 
-    def register_unreachable(self):
+    def register_unreachable(self, tokens):
         prev_node = self.node_stack[self.opened_function][-1]
 
         new_node = self.add_node("unreachable")
@@ -1038,27 +1124,26 @@ class LLVMAnalyser:
     # register_fneg()
 
     def register_fneg(self, tokens):
-        self.rhs = analyze_fneg(tokens)
-        node_name = "fneg {}".format(self.rhs.get_value())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("fneg")(tokens)
+        self.register_statement(labels.get_fneg_label)
 
     # Analyze Binary operations
     # -------------------------
     # register_binary_op()
 
     def register_binary_op(self, tokens):
+        if self.binary_op_analyzer is None:
+            self.binary_op_analyzer = get_analyzer("binary")()
         self.rhs = self.binary_op_analyzer.analyze_binary_op(tokens)
-        node_name = "{} {} {}".format(self.rhs.get_value1(), self.rhs.get_op(), self.rhs.get_value2())
-        self.register_statement(node_name)
+        self.register_statement(labels.get_binary_op_label)
 
     # Analyze Bitwise Binary operations
     # ---------------------------------
     # register_bitwise_binary()
 
     def register_bitwise_binary(self, tokens):
-        self.rhs = analyze_bitwise_binary(tokens)
-        node_name = "{} {} {}".format(self.rhs.op1, self.rhs.get_statement_type(), self.rhs.op2)
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("bitwise_binary")(tokens)
+        self.register_statement(labels.get_bitwise_binary_label)
 
     # Analyze Vector operations
     # -------------------------
@@ -1067,23 +1152,16 @@ class LLVMAnalyser:
     # register_shufflevector()
 
     def register_extractelement(self, tokens):
-        self.rhs = analyze_extractelement(tokens)
-        node_name = "extract element from {} at index {}".format(self.rhs.get_vector_value(), self.rhs.get_index())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("extractelement")(tokens)
+        self.register_statement(labels.get_extractelement_label)
 
     def register_insertelement(self, tokens):
-        self.rhs = analyze_insertelement(tokens)
-        node_name = "insert {} in {} at index {}".format(self.rhs.get_scalar_value(),
-                                                         self.rhs.get_vector_type(),
-                                                         self.rhs.get_index())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("insertelement")(tokens)
+        self.register_statement(labels.get_insertelement_label)
 
     def register_shufflevector(self, tokens):
-        self.rhs = analyze_shufflevector(tokens)
-        node_name = "permute {} with {} using the pattern defined in {}".format(self.rhs.get_first_vector_value(),
-                                                                                self.rhs.get_second_vector_value(),
-                                                                                self.rhs.get_third_vector_value())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("shufflevector")(tokens)
+        self.register_statement(labels.get_shufflevector_label)
 
     # Analyze Aggregate operations
     # ----------------------------
@@ -1091,26 +1169,12 @@ class LLVMAnalyser:
     # register_insertvalue()
 
     def register_extractvalue(self, tokens):
-        self.rhs = analyze_extractvalue(tokens)
-
-        node_name = "extract value from {} at index ".format(self.rhs.get_value())
-        for index in self.rhs.get_indices():
-            node_name += "{}, ".format(index)
-
-        self.register_statement(node_name[:-2])
+        self.rhs = get_analyzer("extractvalue")(tokens)
+        self.register_statement(labels.get_extractvalue_label)
 
     def register_insertvalue(self, tokens):
-        self.rhs = analyze_insertvalue(tokens)
-
-        if self.rhs.get_original() != "undef":
-            node_name = "insert {} in {} at index ".format(self.rhs.get_insert_value(), self.rhs.get_original())
-        else:
-            node_name = "insert {} in new object of type {} at index ".format(self.rhs.get_insert_value(),
-                                                                              self.rhs.get_object_type())
-        for index in self.rhs.get_indices():
-            node_name += "{}, ".format(index)
-
-        self.register_statement(node_name[:-2])
+        self.rhs = get_analyzer("insertvalue")(tokens)
+        self.register_statement(labels.get_insertvalue_label)
 
     # Analyze Memory Access and Addressing operations
     # -----------------------------------------------
@@ -1121,40 +1185,34 @@ class LLVMAnalyser:
     # register_getelementptr()
 
     def register_load(self, tokens):
-        self.rhs = analyze_load(tokens)
-        self.register_statement(self.rhs.get_value())
+        self.rhs = get_analyzer("load")(tokens)
+        self.register_statement(labels.get_load_label)
 
     def register_store(self, tokens):
-        self.rhs = analyze_store(tokens)
-        self.register_statement("{} = {}".format(self.rhs.get_register(), str(self.rhs.get_value())))
+        self.rhs = get_analyzer("store")(tokens)
+        self.register_statement(labels.get_store_label)
 
         self.stores[self.opened_function][self.rhs.get_register()] = self.rhs.get_value()
 
     def register_cmpxchg(self, tokens):
-        self.rhs = analyze_cmpxchg(tokens)
-        node_name = "*{0} = {2} if *{0} = {1}".format(self.rhs.get_address(), self.rhs.get_cmp(), self.rhs.get_new())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("cmpxchg")(tokens)
+        self.register_statement(labels.get_cmpxchg_label)
 
     def register_atomicrmw(self, tokens):
-        self.rhs = analyze_atomicrmw(tokens)
-        node_name = "{0}; {1}({0}, {2})".format(self.rhs.get_address(), self.rhs.get_operation(), self.rhs.get_value())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("atomicrmw")(tokens)
+        self.register_statement(labels.get_atomicrmw_label)
 
     def register_getelementptr(self, tokens):
-        self.rhs = analyze_getelementptr(tokens)
-        node_name = "getelementptr {}".format(self.rhs.get_value())
-        for idx in self.rhs.get_indices():
-            node_name += "[{}]".format(idx)
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("getelementptr")(tokens)
+        self.register_statement(labels.get_getelementptr_label)
 
     # Analyze Conversion operations
     # -----------------------------
     # register_conversion()
 
     def register_conversion(self, tokens):
-        self.rhs = analyze_conversion(tokens)
-        node_name = "{} {} to {}".format(self.rhs.get_operation(), self.rhs.get_value(), self.rhs.get_final_type())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("conversion")(tokens)
+        self.register_statement(labels.get_conversion_label)
 
     # Analyze Other operations
     # ------------------------
@@ -1166,70 +1224,74 @@ class LLVMAnalyser:
     # register_call()
 
     def register_cmp(self, tokens):
-        self.rhs = analyze_cmp(tokens)
-        self.register_statement("{} {} {}".format(self.rhs.get_value1(),
-                                                  self.rhs.get_condition(),
-                                                  self.rhs.get_value2()))
+        self.rhs = get_analyzer("cmp")(tokens)
+        self.register_statement(labels.get_cmp_label)
 
     def register_phi(self, tokens):
-        self.rhs = analyze_phi(tokens)
-        node_name = ""
-        for option in self.rhs.get_options():
-            node_name += ", {} if prev= {}".format(option.get_value(), option.get_label())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("phi")(tokens)
+        self.register_statement(labels.get_phi_label)
 
     def register_select(self, tokens):
-        self.rhs = analyze_select(tokens)
-        node_name = "select {} if {} else {}".format(self.rhs.get_val1(), self.rhs.get_condition(), self.rhs.get_val2())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("select")(tokens)
+        self.register_statement(labels.get_select_label)
 
     def register_freeze(self, tokens):
-        self.rhs = analyze_freeze(tokens)
-        node_name = "freeze {}".format(self.rhs.get_value())
-        self.register_statement(node_name)
+        self.rhs = get_analyzer("freeze")(tokens)
+        self.register_statement(labels.get_freeze_label)
 
     def analyze_call(self, tokens):
-        self.rhs = analyze_call(tokens)
+        self.rhs = get_analyzer("call")(tokens)
+        self.intern_call(self.rhs)
         function_name = self.rhs.function_name
-        function_call = "call {}".format(function_name)
 
-        if function_name not in self.evaluated_functions and function_name not in self.functions_to_evaluate:
-            self.functions_to_evaluate.append(function_name)
+        self.register_called_function(function_name)
 
-        new_node = self.register_statement(function_call)
+        new_node = self.register_statement(labels.get_call_label)
         self.function_handler.add_call(self.opened_function, new_node)
 
         for argument in self.rhs.get_arguments():
             argument_node = self.graphs[self.opened_function].add_node(argument.get_register())
             new_node.add_argument(argument_node)
 
-        if function_name in self.top_graph_nodes:
-            final_node = self.top_graph_nodes[function_name]
-        else:
-            final_node = self.top_graph.add_node(function_name)
-            self.top_graph_nodes[function_name] = final_node
-        first_node = self.top_graph_nodes[self.opened_function]
-        self.top_graph.add_edge(first_node, final_node)
+        self.register_top_graph_edge(function_name)
 
         # move the main node to the back of the list, so that the assignment can be handled properly
-        index = self.node_stack[self.opened_function].index(new_node)
-        self.node_stack[self.opened_function].append(self.node_stack[self.opened_function].pop(index))
+        self.move_to_top(new_node)
 
     # analyze assignment
     # ------------------
     # assignments are tracked to determine the linkage of variables, and to track value at time of analysis
 
     def analyze_assignment(self, tokens):
-        self.assignee = tokens[0]
+        self.assignee = self.symbols.intern(tokens[0])
+
+    # queue a called function to be evaluated, in case it was not evaluated before
+    def register_called_function(self, function_name):
+        if function_name not in self.evaluated_functions and function_name not in self.functions_to_evaluate:
+            self.functions_to_evaluate.append(function_name)
+
+    # connect the opened function to the called function within the top graph
+    def register_top_graph_edge(self, function_name):
+        if function_name in self.top_graph_nodes:
+            final_node = self.top_graph_nodes[function_name]
+        else:
+            final_node = self.top_graph.add_node(function_name)
+            self.top_graph_nodes[function_name] = final_node
+        first_node = self.top_graph_nodes[self.opened_function]
+        self.top_graph.add_edge(first_node, final_node)
 
     def register_function_end(self):
         self.opened_function = None
 
-    # create a new node, based upon the statement given
+    # create a new node, based upon the statement given, this is either the name of the node, or the function that
+    # renders the label of the node from the analysed statement once it is needed
     def register_statement(self, statement):
         prev_node = self.node_stack[self.opened_function][-1]
 
-        new_node = self.add_node(statement, self.rhs)
+        if callable(statement):
+            new_node = self.add_node(None, self.rhs, statement)
+        else:
+            new_node = self.add_node(statement, self.rhs)
         self.graphs[self.opened_function].add_edge(prev_node, new_node)
 
         return new_node
@@ -1244,14 +1306,25 @@ class LLVMAnalyser:
             self.graphs[self.opened_function].register_start_of_block(block_name.split(":")[1])
             return new_node
 
-    def add_node(self, node_name, context=None):
-        new_node = self.graphs[self.opened_function].add_node(node_name)
+    # move the node to the top of the node stack, the node was added after the most recent statement, so the stack is
+    # searched from the top
+    def move_to_top(self, node):
+        node_stack = self.node_stack[self.opened_function]
+        index = len(node_stack) - 1
+        while node_stack[index] is not node:
+            index -= 1
+        node_stack.append(node_stack.pop(index))
+
+    def add_node(self, node_name, context=None, label=None):
+        new_node = self.graphs[self.opened_function].add_node(node_name, label)
         new_node.set_context(context)
         self.node_stack[self.opened_function].append(new_node)
         return new_node
 
 
 class AssignedValue:
+    __slots__ = ("value", "memory_ref")
+
     def __init__(self, value, ref=False):
         self.value = value
         self.memory_ref = ref
@@ -10,13 +10,20 @@ class AttributeGroupHandler:
         group.set_id(tokens[1])
 
         i = 4
-        while tokens[i] != "}":
+        while i < len(tokens) and tokens[i] != "}":
             if is_attribute(tokens[i]):
                 group.add_attribute(tokens[i])
             i += 1
 
         self.groups[tokens[1]] = group
 
+    def add_group(self, group_id, attributes):
+        group = AttributeGroup()
+        group.set_id(group_id)
+        for attr in attributes:
+            group.add_attribute(attr)
+        self.groups[group_id] = group
+
     def get_attributes_for_id(self, group_id):
         return self.groups[group_id].get_attributes()
 
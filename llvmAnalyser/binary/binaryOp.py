@@ -2,6 +2,7 @@ from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.llvmChecker import is_fast_math_flag
+from llvmAnalyser.cursor import as_cursor
 
 
 class BinaryOpAnalyzer:
@@ -22,30 +23,32 @@ class BinaryOpAnalyzer:
         }
 
     def analyze_binary_op(self, tokens: list):
+        tokens = as_cursor(tokens)
+
         op = BinOp()
 
         # pop the assignment
-        while tokens[0] not in self.operations:
-            tokens.pop(0)
+        while tokens.peek() not in self.operations:
+            tokens.advance()
 
         # pop the operation
-        op.set_op(self.op_symbols[tokens.pop(0)])
+        op.set_op(self.op_symbols[tokens.advance()])
 
         # pop potential nuw token
-        if tokens[0] == "nuw":
-            tokens.pop(0)
+        if tokens.peek() == "nuw":
+            tokens.advance()
 
         # pop potential nsw token
-        if tokens[0] == "nsw":
-            tokens.pop(0)
+        if tokens.peek() == "nsw":
+            tokens.advance()
 
         # pop potential exact token
-        if tokens[0] == "exact":
-            tokens.pop(0)
+        if tokens.peek() == "exact":
+            tokens.advance()
 
         # pop potential fastmath flags
-        while is_fast_math_flag(tokens[0]):
-            tokens.pop(0)
+        while is_fast_math_flag(tokens.peek()):
+            tokens.advance()
 
         # get the type
         _, tokens = get_type(tokens)
@@ -62,6 +65,8 @@ class BinaryOpAnalyzer:
 
 
 class BinOp(LlvmStatement):
+    __slots__ = ("operation", "value1", "value2")
+
     def __init__(self):
         super().__init__()
         self.operation = None
@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 
 # Overview:
@@ -13,26 +14,28 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 
 
 def analyze_bitwise_binary(tokens):
+    tokens = as_cursor(tokens)
+
     statement = BitwiseBinaryStatement()
 
     # pop the potential assignment
-    while tokens[0] not in ["shl", "lshr", "ashr", "and", "or", "xor"]:
-        tokens.pop(0)
+    while tokens.peek() not in ["shl", "lshr", "ashr", "and", "or", "xor"]:
+        tokens.advance()
 
     # pop the bin instruction
-    statement.set_statement_type(tokens.pop(0))
+    statement.set_statement_type(tokens.advance())
 
     # pop potential nuw token
-    if tokens[0] == "nuw":
-        tokens.pop(0)
+    if tokens.peek() == "nuw":
+        tokens.advance()
 
     # pop potential nsw token
-    if tokens[0] == "nsw":
-        tokens.pop(0)
+    if tokens.peek() == "nsw":
+        tokens.advance()
 
     # pop potential exact token
-    if tokens[0] == "exact":
-        tokens.pop(0)
+    if tokens.peek() == "exact":
+        tokens.advance()
 
     # pop the type
     _, tokens = get_type(tokens)
@@ -49,6 +52,8 @@ def analyze_bitwise_binary(tokens):
 
 
 class BitwiseBinaryStatement(LlvmStatement):
+    __slots__ = ("statement_type", "op1", "op2")
+
     def __init__(self):
         super().__init__()
         self.statement_type = None
@@ -0,0 +1,99 @@
+from pickle import dumps, loads, HIGHEST_PROTOCOL, UnpicklingError
+from zlib import compress, decompress, error as ZlibError
+from hashlib import blake2b
+from os import makedirs, scandir, path, replace, remove, utime
+
+# The function cache stores the result of analysing a single function on disk, so that later runs on the same llvm
+# file (e.g. with a different configuration) do not have to tokenize and analyse the function again.
+#
+# The cache is content addressed, every entry is keyed by the hash of the body of the function. An entry contains the
+# function object, the graph of the function, and the tables that were registered for the function. The entries are
+# pickled and compressed. Once the total size of the entries exceeds the maximal size of the cache, the least recently
+# used entries get evicted. The modification time of an entry is used to track when it was last used.
+#
+# The version needs to be incremented whenever the output of the analysis of a function changes.
+
+CACHE_VERSION = 9
+
+
+class FunctionCache:
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+
+        # map the name of every entry onto its size
+        self.entries = dict()
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            makedirs(directory, exist_ok=True)
+            for entry in scandir(directory):
+                if entry.name.endswith(".fn"):
+                    self.entries[entry.name] = entry.stat().st_size
+        except OSError:
+            pass
+
+        self.size = sum(self.entries.values())
+
+    def get_key(self, body):
+        digest = blake2b(body, digest_size=16)
+        digest.update(str(CACHE_VERSION).encode())
+        return "{}.fn".format(digest.hexdigest())
+
+    def load(self, key):
+        entry_path = path.join(self.directory, key)
+        try:
+            with open(entry_path, "rb") as f:
+                data = loads(decompress(f.read()))
+
+            # mark the entry as recently used
+            utime(entry_path)
+        except (OSError, EOFError, ZlibError, UnpicklingError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def store(self, key, data):
+        entry_path = path.join(self.directory, key)
+        temp_path = "{}.tmp".format(entry_path)
+        content = compress(dumps(data, protocol=HIGHEST_PROTOCOL))
+
+        # write to a temporary file first, so that an interrupted run can never leave a broken entry behind
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            replace(temp_path, entry_path)
+        except OSError:
+            # the cache is an optimization, if an entry can not be written, it will simply be analysed again
+            return
+
+        self.size += len(content) - self.entries.get(key, 0)
+        self.entries[key] = len(content)
+
+        if self.size > self.max_size:
+            self.evict()
+
+    # remove the least recently used entries, until the cache fits within its maximal size again
+    def evict(self):
+        last_used = dict()
+        for key in self.entries:
+            try:
+                last_used[key] = path.getmtime(path.join(self.directory, key))
+            except OSError:
+                last_used[key] = 0
+
+        for key in sorted(last_used, key=last_used.get):
+            if self.size <= self.max_size:
+                break
+
+            try:
+                remove(path.join(self.directory, key))
+            except OSError:
+                pass
+
+            self.size -= self.entries.pop(key)
@@ -1,6 +1,7 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 # The instructions in this category are the conversion instructions (casting)
 # which all take a single operand and a type. They perform various bit conversions on the operand.
 
@@ -21,37 +22,40 @@ from llvmAnalyser.values import get_value
 
 
 def analyze_conversion(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Conversion()
 
     # pop the assignment
-    if tokens[1] == "=":
-        tokens.pop(0)
-        tokens.pop(0)
+    if tokens.peek(1) == "=":
+        tokens.advance()
+        tokens.advance()
 
     # pop the operation
-    statement.set_operation(tokens.pop(0))
+    statement.set_operation(tokens.advance())
 
     # check if the first token starts with an opening bracket
     # this happens when this object is an argument in a different statement, in those cases, to prevent
     # confusion with commas, certain sub statements can get enclosed within brackets
     final_index = len(tokens)
-    if tokens[0][0] == "(":
-        tokens[0] = tokens[0][1:]
+    if tokens.peek()[0] == "(":
+        tokens.replace(tokens.peek()[1:])
 
         open_brackets = 1
 
         # loop over the tokens until this first bracket is closed again, when this happens, return the index
         for i in range(len(tokens)):
-            for j in range(len(tokens[i])):
-                char = tokens[i][j]
+            token = tokens.peek(i)
+            for j in range(len(token)):
+                char = token[j]
                 if char == "(":
                     open_brackets += 1
                 elif char == ")":
                     open_brackets -= 1
                 if open_brackets == 0:
-                    if tokens[i][j+1:] != "":
-                        tokens.insert(i+1, tokens[i][j+1:])
-                    tokens[i] = tokens[i][:j]
+                    if token[j+1:] != "":
+                        tokens.insert(i+1, token[j+1:])
+                    tokens.replace(token[:j], i)
                     final_index = i + 1
                     break
             if final_index != len(tokens):
@@ -65,28 +69,30 @@ def analyze_conversion(tokens):
     statement.set_value(value)
 
     # pop the to token
-    tokens.pop(0)
+    tokens.advance()
 
     final_index -= start_len - len(tokens)
 
     # get the final type
     final_type = ""
-    while final_index > 0 and "dereferenceable" not in tokens[0]:
-        final_type += tokens.pop(0)
+    while final_index > 0 and "dereferenceable" not in tokens.peek():
+        final_type += tokens.advance()
         final_index -= 1
 
     statement.set_final_type(final_type)
 
     # pop potential remaining tokens
-    while final_index > 0 and tokens and "dereferenceable" in tokens[0]:
-        tokens.pop(0)
-        tokens.pop(0)
+    while final_index > 0 and tokens and "dereferenceable" in tokens.peek():
+        tokens.advance()
+        tokens.advance()
         final_index -= 2
 
     return statement
 
 
 class Conversion(LlvmStatement):
+    __slots__ = ("operation", "value", "final_type")
+
     def __init__(self):
         super().__init__()
         self.operation = None
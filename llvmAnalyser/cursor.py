@@ -0,0 +1,160 @@
+# The token cursor walks over the tokens of an instruction, without removing the tokens it passes. Consuming a token
+# only moves the position of the cursor, so that consuming the tokens of a long instruction (e.g. a call with many
+# mangled template arguments) takes linear time, rather than the quadratic time that popping the first element of a
+# list would take.
+#
+# The offsets that are given to the cursor are relative to its position, offset 0 refers to the next token that will be
+# consumed. The length of the cursor is the number of tokens that remain.
+#
+# The cursor can match the round brackets of the tokens it holds. The brackets of the remaining tokens are matched in a
+# single pass, the first time a bracket is looked up, after which every lookup takes constant time. The matches are
+# discarded once the tokens are modified.
+
+
+class TokenCursor:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+        self.brackets = None
+
+    # get the token at the given offset, without consuming it
+    def peek(self, offset=0):
+        return self.tokens[self.position + offset]
+
+    # consume the next token and return it
+    def advance(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    # consume the next token, which has to be the given token
+    def expect(self, token):
+        if self.position >= len(self.tokens) or self.tokens[self.position] != token:
+            raise ValueError("Expected {} but found {}".format(token, self.tokens[self.position:self.position + 1]))
+        self.position += 1
+        return token
+
+    # consume the next token in case it is the given token, return whether or not the token was consumed
+    def accept(self, token):
+        if self.position < len(self.tokens) and self.tokens[self.position] == token:
+            self.position += 1
+            return True
+        return False
+
+    # replace the token at the given offset, this is used when only a part of a token is consumed
+    def replace(self, token, offset=0):
+        self.tokens[self.position + offset] = token
+        self.brackets = None
+
+    # put a token in front of the remaining tokens, so that it is the next token that will be consumed
+    def push(self, token):
+        self.brackets = None
+        if self.position > 0:
+            self.position -= 1
+            self.tokens[self.position] = token
+        else:
+            self.tokens.insert(0, token)
+
+    # insert a token at the given offset
+    def insert(self, offset, token):
+        self.tokens.insert(self.position + offset, token)
+        self.brackets = None
+
+    # consume the given number of tokens
+    def skip(self, count):
+        self.position += count
+
+    # get the given number of tokens, starting at the given offset, as a tuple
+    def get_slice(self, count, offset=0):
+        start = self.position + offset
+        return tuple(self.tokens[start:start + count])
+
+    # replace the given number of tokens by the given tokens, of which the given number is consumed
+    def splice(self, count, tokens, consumed):
+        self.tokens[self.position:self.position + count] = tokens
+        self.position += consumed
+        self.brackets = None
+
+    # get the bracket that closes the bracket in which the token at the given offset is enclosed, this is returned as
+    # the offset of the token that contains the closing bracket, along with the index of the bracket within said token
+    # None is returned in case the bracket is never closed
+    def get_closing_bracket(self, offset=0):
+        return self.get_bracket(0, offset)
+
+    # get the bracket that closes the bracket with which the token at the given offset starts, in the same format
+    def get_matching_bracket(self, offset=0):
+        return self.get_bracket(1, offset)
+
+    def get_bracket(self, kind, offset):
+        index = self.position + offset
+        if self.brackets is None or index < self.brackets[0]:
+            self.brackets = (self.position, match_brackets(self.tokens, self.position))
+
+        bracket = self.brackets[1][kind].get(index)
+        if bracket is None:
+            return None
+        return bracket[0] - self.position, bracket[1]
+
+    def get_position(self):
+        return self.position
+
+    def get_remaining(self):
+        return self.tokens[self.position:]
+
+    def __len__(self):
+        return len(self.tokens) - self.position
+
+    def __iter__(self):
+        return iter(self.get_remaining())
+
+    # a cursor equals the list of its remaining tokens
+    def __eq__(self, other):
+        if isinstance(other, TokenCursor):
+            other = other.get_remaining()
+        return self.get_remaining() == other
+
+    def __repr__(self):
+        return repr(self.get_remaining())
+
+
+# match the round brackets of the tokens, starting at the given index, in a single pass
+# this returns two dicts that map the index of a token onto the position of a closing bracket:
+#   - the bracket at which the depth first drops below the depth at the start of the token
+#   - the bracket that matches the opening bracket with which the token starts
+def match_brackets(tokens, start):
+    closing = dict()
+    matching = dict()
+
+    # the tokens that are waiting for the depth to drop below the given depth
+    pending = dict()
+
+    depth = 0
+    for k in range(start, len(tokens)):
+        token = tokens[k]
+        pending.setdefault(depth, []).append((closing, k))
+
+        # the depth can only drop within tokens that contain a closing bracket
+        if ")" not in token:
+            if token[:1] == "(":
+                pending.setdefault(depth + 1, []).append((matching, k))
+            depth += token.count("(")
+            continue
+
+        for j, char in enumerate(token):
+            if char == "(":
+                depth += 1
+                if j == 0:
+                    pending.setdefault(depth, []).append((matching, k))
+            elif char == ")":
+                for brackets, waiting in pending.pop(depth, ()):
+                    brackets[waiting] = (k, j)
+                depth -= 1
+
+    return closing, matching
+
+
+# wrap the given tokens in a cursor, unless they already are
+def as_cursor(tokens):
+    if isinstance(tokens, TokenCursor):
+        return tokens
+    return TokenCursor(tokens)
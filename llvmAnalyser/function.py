@@ -1,7 +1,8 @@
 from llvmAnalyser.llvmChecker import *
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
-from copy import copy
+from llvmAnalyser.cursor import as_cursor
+from llvmAnalyser.symbols import SymbolTable
 # LLVM function definitions consist of the “define” keyword, an optional linkage type,
 # an optional runtime preemption specifier, an optional visibility style, an optional DLL storage class,
 # an optional calling convention, an optional unnamed_addr attribute, a return type,
@@ -22,118 +23,108 @@ from copy import copy
 
 # this handler will create all needed function objects from tokens
 class FunctionHandler:
-    def __init__(self):
+    def __init__(self, symbols=None):
         self.functions = dict()
 
+        # the names of the functions and their parameters are interned within the symbol table of the analyser
+        self.symbols = SymbolTable() if symbols is None else symbols
+
     # return a function name if the tokens define a function
     # return None if not
     def identify_function(self, tokens):
+        tokens = as_cursor(tokens)
+
         # skip the define keyword
-        tokens.pop(0)
+        tokens.advance()
 
         # create the function object
         func = Function()
 
         # check linkage type
-        if is_linkage_type(tokens[0]):
-            func.set_linkage_type(tokens[0])
-            tokens.pop(0)
+        if is_linkage_type(tokens.peek()):
+            func.set_linkage_type(tokens.advance())
 
         # check runtime preemption
-        if is_runtime_preemptable(tokens[0]):
-            func.set_runtime_preemption(tokens[0])
-            tokens.pop(0)
+        if is_runtime_preemptable(tokens.peek()):
+            func.set_runtime_preemption(tokens.advance())
         else:
             func.set_runtime_preemption("dso_preemptable")
 
         # check visibility style
-        if is_visibility_style(tokens[0]):
-            func.set_visibility_style(tokens[0])
-            tokens.pop(0)
+        if is_visibility_style(tokens.peek()):
+            func.set_visibility_style(tokens.advance())
 
         # check DLL storage class
-        if is_dll_storage_class(tokens[0]):
-            func.set_dll_storage_class(tokens[0])
-            tokens.pop(0)
+        if is_dll_storage_class(tokens.peek()):
+            func.set_dll_storage_class(tokens.advance())
 
         # check calling convention
-        if is_calling_convention(tokens[0]):
-            func.set_calling_convention(tokens[0])
-            tokens.pop(0)
+        if is_calling_convention(tokens.peek()):
+            func.set_calling_convention(tokens.advance())
             if func.get_calling_convention() == "cc":
-                func.set_calling_convention("cc {}".format(tokens.pop(0)))
+                func.set_calling_convention("cc {}".format(tokens.advance()))
         else:
             func.set_calling_convention("ccc")
 
         # check return parameter attributes
-        if is_parameter_attribute(tokens[0]):
-            open_brackets = tokens[0].count("(") - tokens[0].count(")")
-            attribute = tokens.pop(0)
-            while open_brackets != 0:
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += tokens.pop(0)
-            if attribute == "align":
-                attribute += " {}".format(tokens.pop(0))
-            func.set_return_parameter_attribute(attribute)
+        if is_parameter_attribute(tokens.peek()):
+            func.set_return_parameter_attribute(read_attribute(tokens))
 
         # set return type
         ret_type, tokens = get_type(tokens)
         func.set_return_type(ret_type)
 
         # set function name
-        new_tokens = tokens[0].split("(", 1)
-        tokens[0] = new_tokens[1]
+        new_tokens = tokens.peek().split("(", 1)
+        tokens.replace(new_tokens[1])
         func.set_function_name(new_tokens[0])
 
         final_bracket_token = get_nr_of_tokens_past_last_bracket(tokens)
 
-        if tokens[0] == ")":
-            tokens.pop(0)
+        if tokens.peek() == ")":
+            tokens.advance()
 
         # read parameter data
         while len(tokens) >= final_bracket_token:
             # function without parameters
-            if tokens[0] == ")":
-                tokens.pop(0)
+            if tokens.peek() == ")":
+                tokens.advance()
                 break
 
             parameter = Parameter()
 
-            if "..." in tokens[0]:
+            if "..." in tokens.peek():
                 parameter.set_register("...")
-                tokens.pop(0)
+                tokens.advance()
                 func.add_parameter(parameter)
                 break
 
-            old_tokens = copy(tokens)
-
             # read parameter type
             parameter_type, tokens = get_type(tokens)
             parameter.set_parameter_type(parameter_type)
 
             # read all parameter attributes
-            if is_group_attribute(tokens[0]):
-                parameter.set_group_parameter_attribute(tokens[0])
-                tokens.pop(0)
+            if is_group_attribute(tokens.peek()):
+                parameter.set_group_parameter_attribute(tokens.advance())
             else:
-                while is_parameter_attribute(tokens[0]):
-                    open_brackets = tokens[0].count("(") - tokens[0].count(")")
-                    attribute = tokens.pop(0)
+                while is_parameter_attribute(tokens.peek()):
+                    open_brackets = get_extent(tokens.peek())
+                    attribute = tokens.advance()
                     while True:
                         if open_brackets <= 0:
                             break
-                        for j in range(len(tokens[0])):
-                            char = tokens[0][j]
+                        for j in range(len(tokens.peek())):
+                            char = tokens.peek()[j]
                             if char == "(":
                                 open_brackets += 1
                             elif char == ")":
                                 open_brackets -= 1
                             if open_brackets == 0:
-                                tokens[0] = tokens[0][:j+1]
+                                tokens.replace(tokens.peek()[:j+1])
                                 break
-                        attribute += " {}".format(tokens.pop(0))
+                        attribute += " {}".format(tokens.advance())
                     if attribute == "align":
-                        attribute += " {}".format(tokens.pop(0))
+                        attribute += " {}".format(tokens.advance())
 
                     # pop end of argument comma
                     if attribute[-1] == ",":
@@ -148,115 +139,107 @@ class FunctionHandler:
             # parameter with only parameter type
             # this can be detected by a comma being directly behind the type, or the number of tokens being lower than
             # the token in which the final bracket was found
-            if old_tokens[len(old_tokens) - len(tokens) - 1][-1] == "," or len(tokens) < final_bracket_token:
+            if tokens.peek(-1)[-1] == "," or len(tokens) < final_bracket_token:
                 parameter.set_register("%{}".format(func.get_number_of_parameters()))
                 func.add_parameter(parameter)
                 continue
 
             # read parameter name
-            if "%" in tokens[0]:
-                parameter.set_register(tokens[0].replace(",", "").replace(")", ""))
+            if "%" in tokens.peek():
+                parameter.set_register(tokens.peek().replace(",", "").replace(")", ""))
 
             func.add_parameter(parameter)
-            final = ')' in tokens[0]
-            tokens.pop(0)
+            final = ')' in tokens.peek()
+            tokens.advance()
 
             # end of parameter list
             if final:
                 break
 
         # check unnamed addr
-        if is_unnamed_addr(tokens[0]):
-            func.set_unnamed_address(tokens[0])
-            tokens.pop(0)
+        if is_unnamed_addr(tokens.peek()):
+            func.set_unnamed_address(tokens.advance())
 
         # check address space
-        if is_address_space(tokens[0]):
-            func.set_address_space(tokens[0])
-            tokens.pop(0)
+        if is_address_space(tokens.peek()):
+            func.set_address_space(tokens.advance())
 
         # check function attributes
-        if is_group_attribute(tokens[0]):
-            func.set_group_function_attribute(tokens[0])
-            tokens.pop(0)
-        elif is_function_attribute(tokens[0]):
-            if "allocsize" in tokens[0]:
-                attribute = tokens.pop(0)
-                open_brackets = attribute.count("(") - attribute.count(")")
-                while open_brackets != 0:
-                    open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                    attribute += " {}".format(tokens.pop(0))
-                func.add_function_attribute(attribute)
-            while is_function_attribute(tokens[0]):
-                func.add_function_attribute(tokens[0])
-                tokens.pop(0)
+        if is_group_attribute(tokens.peek()):
+            func.set_group_function_attribute(tokens.advance())
+        else:
+            while is_function_attribute(tokens.peek()):
+                func.add_function_attribute(read_attribute(tokens))
 
         # check section info
-        if tokens[0] == "section":
-            func.set_section(tokens[1])
-            tokens.pop(1)
-            tokens.pop(0)
+        if tokens.accept("section"):
+            func.set_section(tokens.advance())
 
         # check comdat info
-        if "comdat" in tokens[0]:
-            if "(" in tokens[0]:
-                open_brackets = tokens[0].count("(") - tokens[0].count(")")
-                value = tokens.pop(0).split("(", 1)[1]
+        if "comdat" in tokens.peek():
+            if "(" in tokens.peek():
+                open_brackets = tokens.peek().count("(") - tokens.peek().count(")")
+                value = tokens.advance().split("(", 1)[1]
                 while open_brackets != 0:
-                    value += tokens.pop(0)
-                    open_brackets += tokens[0].count("(") - tokens[0].count(")")
+                    value += tokens.advance()
+                    open_brackets += tokens.peek().count("(") - tokens.peek().count(")")
                 func.set_comdat(value.rsplit(")", 1)[0])
             else:
-                tokens.pop(0)
+                tokens.advance()
 
         # check alignment info
-        if tokens[0] == "align":
-            func.set_alignment(tokens[1])
-            tokens.pop(1)
-            tokens.pop(0)
+        if tokens.accept("align"):
+            func.set_alignment(tokens.advance())
 
         # check garbage collector name info
-        if tokens[0] == "gc":
-            func.set_garbage_collector_name(tokens[1])
-            tokens.pop(1)
-            tokens.pop(0)
+        if tokens.accept("gc"):
+            func.set_garbage_collector_name(tokens.advance())
 
         # check prefix info
-        if tokens[0] == "prefix":
-            tokens.pop(0)
+        if tokens.peek() == "prefix":
+            tokens.advance()
             prefix_type, tokens = get_type(tokens)
             prefix_value, tokens = get_value(tokens)
             func.set_prefix("{} {}".format(prefix_type, prefix_value))
 
         # check prologue info
-        if tokens[0] == "prologue":
-            tokens.pop(0)
+        if tokens.peek() == "prologue":
+            tokens.advance()
             prologue_type, tokens = get_type(tokens)
             prologue_value, tokens = get_value(tokens)
             func.set_prologue("{} {}".format(prologue_type, prologue_value))
 
         # check personality info
-        if tokens[0] == "personality":
-            tokens.pop(0)
+        if tokens.peek() == "personality":
+            tokens.advance()
             personality_type, tokens = get_type(tokens)
             personality_value, tokens = get_value(tokens)
             func.set_personality("{} {}".format(personality_type, personality_value))
 
         # check metadata info
-        while tokens and is_metadata(tokens[0]):
-            func.add_metadata(tokens.pop(0))
+        while tokens and is_metadata(tokens.peek()):
+            func.add_metadata(tokens.advance())
 
         finished = len(tokens) == 1
         if not finished:
             print("analysis did not finish for function: {}".format(func.function_name))
             print(tokens)
         else:
-            tokens.pop(0)
+            tokens.advance()
 
-        self.functions[func.function_name] = func
+        self.add_function(func)
 
         return func.function_name
 
+    # register the function under its name, the names of the function and its parameters are interned first
+    def add_function(self, func):
+        func.set_function_name(self.symbols.intern(func.get_function_name()))
+        for parameter in func.get_parameters():
+            parameter.set_parameter_type(self.symbols.intern(parameter.get_parameter_type()))
+            parameter.set_register(self.symbols.intern(parameter.get_register()))
+
+        self.functions[func.function_name] = func
+
     def get_function_arguments(self, function_name):
         return self.functions[function_name].get_parameters()
 
@@ -303,23 +286,23 @@ class FunctionHandler:
         return result
 
 
+# get the number of tokens that remain from the token that closes the bracket in which the tokens are enclosed
 def get_nr_of_tokens_past_last_bracket(tokens):
-    open_brackets = 1
+    tokens = as_cursor(tokens)
 
-    # loop over the tokens until this first bracket is closed again, when this happens, return the index
-    for i in range(len(tokens)):
-        for j in range(len(tokens[i])):
-            char = tokens[i][j]
-            if char == "(":
-                open_brackets += 1
-            elif char == ")":
-                open_brackets -= 1
-            if open_brackets == 0:
-                return len(tokens) - i
+    bracket = tokens.get_closing_bracket()
+    if bracket is None:
+        return None
+    return len(tokens) - bracket[0]
 
 
 # this class will define a function specified within llvm
 class Function:
+    __slots__ = ("linkage_type", "runtime_preemption", "visibility_style", "dll_storage_class", "calling_convention",
+                 "unnamed_address", "return_type", "return_parameter_attribute", "function_name", "parameters",
+                 "function_attributes", "address_space", "section", "alignment", "comdat", "garbage_collector_name",
+                 "prefix", "prologue", "personality", "metadata", "calls", "callbrs", "invokes", "mutator")
+
     def __init__(self):
         self.linkage_type = None
         self.runtime_preemption = None
@@ -558,6 +541,8 @@ class Function:
 
 
 class Parameter:
+    __slots__ = ("parameter_type", "parameter_attributes", "register")
+
     def __init__(self):
         self.parameter_type = None
         self.parameter_attributes = list()
@@ -0,0 +1,91 @@
+from pickle import dump, load, HIGHEST_PROTOCOL, UnpicklingError
+from hashlib import blake2b
+from os import replace
+
+# The incremental state stores the focal methods that were found for each test function during the previous run,
+# alongside the call closure of said test function. It is stored in a sidecar file next to the llvm file
+# (<file>.state), so that the next run on a changed version of the llvm file only needs to recompute the focal methods
+# of the tests whose call closure changed.
+#
+# The call closure of a test function contains every function that can be reached from the test function through the
+# analysed functions. For each of these functions, the hash of its body (None if it is not defined) is stored, as well
+# as whether or not it was analysed. Once either of these changes for one of the functions in the closure, the focal
+# methods of the test function have to be recomputed.
+#
+# The mutation types that were found while determining the focal methods of a test function are stored as well. These
+# are shared between the test functions of a run, so they are restored once the focal methods of a test function are
+# reused, in order for the tests that are recomputed afterwards to find the same results as they would in a clean run.
+#
+# The state is only valid for the configuration it was created with, the relevant parts of the configuration are
+# stored as the fingerprint of the state.
+#
+# The state only saves the determination of the focal methods, every function within the module is still analysed
+# to build its graph. The function cache (the cache option) is needed to skip the analysis of unchanged functions as
+# well, both options are meant to be used together.
+
+STATE_VERSION = 4
+
+
+class IncrementalState:
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+
+        # map every function within any of the closures onto a tuple containing the hash of its body and whether or
+        # not it was analysed
+        self.functions = dict()
+
+        # map every test function onto a tuple containing its focal methods, the functions within its closure and the
+        # mutation types that were found for it, in the order in which they were found
+        self.tests = dict()
+
+    def add_test(self, test_function, focal_methods, closure, mutation_types):
+        for function_name, function_state in closure.items():
+            self.functions[function_name] = function_state
+        self.tests[test_function] = (sorted(focal_methods), list(closure), list(mutation_types))
+
+    def get_test(self, test_function):
+        return self.tests.get(test_function)
+
+    def get_function(self, function_name):
+        return self.functions[function_name]
+
+
+def get_fingerprint(test_identifier, assertion_identifier, exclusion_filter, max_depth):
+    return (STATE_VERSION,
+            test_identifier.pattern,
+            assertion_identifier.pattern,
+            exclusion_filter.pattern,
+            max_depth)
+
+
+def get_body_hash(body):
+    return blake2b(body, digest_size=16).hexdigest()
+
+
+def get_state_path(file):
+    return "{}.state".format(file)
+
+
+def read_state(state_path, fingerprint):
+    try:
+        with open(state_path, "rb") as f:
+            state = load(f)
+    except (OSError, EOFError, UnpicklingError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(state, IncrementalState) or state.fingerprint != fingerprint:
+        return None
+
+    return state
+
+
+def write_state(state_path, state):
+    # write to a temporary file first, so that an interrupted run can never leave a broken state behind
+    temp_path = "{}.tmp".format(state_path)
+    try:
+        with open(temp_path, "wb") as f:
+            dump(state, f, protocol=HIGHEST_PROTOCOL)
+        replace(temp_path, state_path)
+    except OSError:
+        # the state is an optimization, if it can not be written, the next run will simply recompute every test
+        pass
@@ -0,0 +1,297 @@
+from pickle import dump, load, HIGHEST_PROTOCOL, UnpicklingError
+from hashlib import blake2b
+from array import array
+from os import stat, replace, listdir, path
+import re
+
+from llvmAnalyser.reader import open_reader, ModuleSetReader
+from llvmAnalyser.alias import analyze_alias
+from llvmAnalyser.attributes import AttributeGroupHandler
+from llvmAnalyser.lexer import get_words
+
+# The module index describes where each of the functions within an llvm file is located. It is stored in a sidecar
+# file next to the llvm file (<file>.idx), so that later runs on an unchanged file can skip scanning the entire file,
+# and can jump directly to the functions that need to be analysed.
+#
+# The sidecar is keyed by the size, the modification time and the content hash of the llvm file. If the size and the
+# modification time still match, the index is used as is. If only the modification time changed, the content hash is
+# used to verify whether or not the content is still the same, before the index is reused.
+#
+# A directory containing the llvm files of the separate translation units can be used instead of a single linked llvm
+# file. Every file is indexed separately, after which the indexes are merged into a global symbol table, in which the
+# lines and byte ranges refer to the files as if they were concatenated.
+
+INDEX_VERSION = 3
+
+function_name_format = re.compile(r'(@.*?\()+?')
+block_start_format = re.compile(rb'[0-9]*:')
+
+# the first bytes of the lines that are of interest while scanning a module, all other lines are skipped
+scanned_first_bytes = frozenset(b"}:0123456789da@%")
+
+
+class ModuleIndex:
+    def __init__(self):
+        self.size = None
+        self.mtime = None
+        self.digest = None
+        self.offsets = None
+
+        # map every function name onto its entry, and every alias onto its aliasee
+        self.functions = dict()
+        self.aliases = dict()
+
+        # map every declared function onto the line on which it is declared
+        self.declarations = dict()
+
+        # map every attribute group onto its attributes, and every named type onto its definition
+        self.attribute_groups = dict()
+        self.named_types = dict()
+
+    def add_function(self, name, entry):
+        # in case of duplicate definitions, the first definition is used
+        if name not in self.functions:
+            self.functions[name] = entry
+
+    def get_function(self, name):
+        return self.functions.get(name)
+
+    def get_functions(self):
+        return self.functions
+
+    def add_alias(self, name, aliasee):
+        self.aliases[name] = aliasee
+
+    def get_aliases(self):
+        return self.aliases
+
+    def add_declaration(self, name, line):
+        if name not in self.declarations:
+            self.declarations[name] = line
+
+    def get_declarations(self):
+        return self.declarations
+
+    def add_attribute_group(self, group_id, attributes):
+        self.attribute_groups[group_id] = attributes
+
+    def get_attribute_groups(self):
+        return self.attribute_groups
+
+    def add_named_type(self, name, definition):
+        self.named_types[name] = definition
+
+    def get_named_types(self):
+        return self.named_types
+
+    def to_dict(self):
+        return {"version": INDEX_VERSION,
+                "size": self.size,
+                "mtime": self.mtime,
+                "digest": self.digest,
+                "offsets": self.offsets.tobytes(),
+                "functions": {name: entry.to_tuple() for name, entry in self.functions.items()},
+                "aliases": self.aliases,
+                "declarations": self.declarations,
+                "attribute_groups": self.attribute_groups,
+                "named_types": self.named_types}
+
+    @staticmethod
+    def from_dict(data):
+        index = ModuleIndex()
+        index.size = data["size"]
+        index.mtime = data["mtime"]
+        index.digest = data["digest"]
+        index.offsets = array("Q")
+        index.offsets.frombytes(data["offsets"])
+        index.functions = {name: FunctionEntry(*entry) for name, entry in data["functions"].items()}
+        index.aliases = data["aliases"]
+        index.declarations = data["declarations"]
+        index.attribute_groups = data["attribute_groups"]
+        index.named_types = data["named_types"]
+        return index
+
+
+class FunctionEntry:
+    def __init__(self, start, end, define_line, labels):
+        # the byte range of the function, starting at the define line and ending after the closing bracket
+        self.start = start
+        self.end = end
+
+        # the index of the line on which the function is defined
+        self.define_line = define_line
+
+        # the block labels used within the function, mapped onto the line index at which the block starts
+        self.labels = labels
+
+    def get_start(self):
+        return self.start
+
+    def get_end(self):
+        return self.end
+
+    def get_define_line(self):
+        return self.define_line
+
+    def get_labels(self):
+        return self.labels
+
+    def to_tuple(self):
+        return self.start, self.end, self.define_line, self.labels
+
+
+# open the llvm file, and get the index that belongs to it
+# this will return a tuple containing the reader that gives access to the lines, as well as the module index
+# llvm_dis is the disassembler that is used in case a bitcode file is given
+def load_module(file, llvm_dis="llvm-dis-6.0"):
+    status = stat(file)
+    index = read_index(get_index_path(file))
+
+    if index is not None and index.size == status.st_size and index.mtime == status.st_mtime_ns:
+        return open_reader(file, index.offsets, llvm_dis), index
+
+    digest = get_digest(file)
+
+    # the file was touched, but the content did not change, the stored offsets can still be used
+    if index is not None and index.size == status.st_size and index.digest == digest:
+        index.mtime = status.st_mtime_ns
+        write_index(get_index_path(file), index)
+        return open_reader(file, index.offsets, llvm_dis), index
+
+    reader = open_reader(file, llvm_dis=llvm_dis)
+    index = scan_module(reader)
+    index.size = status.st_size
+    index.mtime = status.st_mtime_ns
+    index.digest = digest
+    write_index(get_index_path(file), index)
+
+    return reader, index
+
+
+# load all llvm files within a directory, this returns a reader that gives access to the lines of all files as if they
+# were concatenated, along with the merged index of all files
+# as with linking, the first definition of a function is used, functions with internal linkage that share their name
+# with a function in another file will therefore resolve to the first of these functions
+# the attribute groups are not merged, their ids are local to each translation unit, so the same id can refer to
+# different groups within different files
+def load_module_set(directory, llvm_dis="llvm-dis-6.0"):
+    files = list()
+    for file in sorted(listdir(directory)):
+        if file.endswith((".ll", ".ll.gz", ".ll.zst", ".ll.xz")):
+            files.append(path.join(directory, file))
+
+    index = ModuleIndex()
+    offsets = list()
+    line_base = 0
+    byte_base = 0
+    for file in files:
+        reader, file_index = load_module(file, llvm_dis)
+        reader.close()
+        offsets.append(file_index.offsets)
+
+        for name, entry in file_index.get_functions().items():
+            labels = {label: line + line_base for label, line in entry.get_labels().items()}
+            index.add_function(name, FunctionEntry(entry.get_start() + byte_base, entry.get_end() + byte_base,
+                                                   entry.get_define_line() + line_base, labels))
+        for name, line in file_index.get_declarations().items():
+            index.add_declaration(name, line + line_base)
+        for name, aliasee in file_index.get_aliases().items():
+            index.aliases.setdefault(name, aliasee)
+        for name, definition in file_index.get_named_types().items():
+            index.named_types.setdefault(name, definition)
+
+        line_base += len(file_index.offsets) - 1
+        byte_base += file_index.offsets[-1]
+
+    return ModuleSetReader(files, offsets, llvm_dis), index
+
+
+# scan all the lines of the reader in a single streaming pass, registering everything that is declared within the
+# global scope: function definitions (along with their block labels), function declarations, aliases,
+# attribute groups and named types
+# the lines are classified by their first bytes, so that only the lines that are actually of interest get visited
+def scan_module(reader):
+    index = ModuleIndex()
+    attribute_group_handler = AttributeGroupHandler()
+
+    function_name = None
+    entry = None
+    for i, start, line in reader.iter_selected_lines(scanned_first_bytes):
+        if entry is not None:
+            if line[:1] == b"}":
+                entry.end = start + len(line)
+                index.add_function(function_name, entry)
+                entry = None
+
+            elif block_start_format.match(line):
+                entry.labels["%{}".format(line.split(b":", 1)[0].decode())] = i
+
+        elif line[:6] == b"define":
+            function_name = function_name_format.search(line.decode()).group()[:-1]
+            entry = FunctionEntry(start, None, i, dict())
+
+        elif line[:7] == b"declare":
+            index.add_declaration(function_name_format.search(line.decode()).group()[:-1], i)
+
+        elif line[:10] == b"attributes":
+            attribute_group_handler.identify_attribute_groups(get_tokens(line))
+
+        # aliases are defined within the global scope
+        elif line[:1] == b"@" and b" alias " in line:
+            alias = analyze_alias(get_tokens(line))
+            index.add_alias(alias.get_name(), alias.get_aliasee())
+
+        elif line[:1] == b"%" and b" = type " in line:
+            name, definition = line.decode().rstrip().split(" = type ", 1)
+            index.add_named_type(name, definition)
+
+    for group_id, group in attribute_group_handler.groups.items():
+        index.add_attribute_group(group_id, group.get_attributes())
+
+    index.offsets = reader.offsets
+
+    return index
+
+
+def get_tokens(line):
+    return get_words(line.decode())
+
+
+def get_index_path(file):
+    return "{}.idx".format(file)
+
+
+# the digest is taken over the file as it is stored, so that compressed files do not need to be decompressed for it
+def get_digest(file):
+    digest = blake2b(digest_size=16)
+    with open(file, "rb") as f:
+        data = f.read(1 << 20)
+        while data:
+            digest.update(data)
+            data = f.read(1 << 20)
+    return digest.hexdigest()
+
+
+def read_index(index_path):
+    try:
+        with open(index_path, "rb") as f:
+            data = load(f)
+    except (OSError, EOFError, UnpicklingError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+
+    return ModuleIndex.from_dict(data)
+
+
+def write_index(index_path, index):
+    # write to a temporary file first, so that an interrupted run can never leave a broken index behind
+    temp_path = "{}.tmp".format(index_path)
+    try:
+        with open(temp_path, "wb") as f:
+            dump(index.to_dict(), f, protocol=HIGHEST_PROTOCOL)
+        replace(temp_path, index_path)
+    except OSError:
+        # the index is an optimization, if it can not be written, the next run will simply rebuild it
+        pass
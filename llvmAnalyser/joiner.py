@@ -0,0 +1,89 @@
+from llvmAnalyser.lexer import get_words
+
+# Most instructions are written on a single line, a few of them span multiple lines however:
+#   - the cases of a switch are written on the lines that follow it, up to the closing ']'
+#   - the normal and the unwind label of an invoke are written on the line that follows it
+#   - the clauses of a landingpad (catch, filter and cleanup) are written on the lines that follow it
+# The joiner reads every line once, and yields the logical instructions as a single list of words, along with the range
+# of lines the instruction was read from, so that the analyser never has to look ahead itself.
+# The calls to the debug intrinsics (e.g. llvm.dbg.declare and llvm.dbg.value) of a debug build only describe the debug
+# information of the variables, these instructions are skipped along with the empty lines.
+
+landingpad_clauses = {"catch", "filter", "cleanup"}
+call_opcodes = {"call", "tail", "musttail", "notail"}
+debug_intrinsic = "@llvm.dbg."
+
+
+class LogicalInstruction:
+    __slots__ = ("tokens", "first_line", "last_line")
+
+    def __init__(self, tokens, first_line, last_line):
+        self.tokens = tokens
+        self.first_line = first_line
+        self.last_line = last_line
+
+    def get_tokens(self):
+        return self.tokens
+
+    def get_first_line(self):
+        return self.first_line
+
+    def get_last_line(self):
+        return self.last_line
+
+
+# get the opcode of the instruction, this is the first token, unless the result of the instruction is assigned
+def get_opcode(tokens):
+    if len(tokens) > 2 and tokens[1] == "=":
+        return tokens[2]
+    return tokens[0]
+
+
+# check whether the called function is one of the debug intrinsics, these calls return void, so the function
+# follows the few words that may precede it (tail call void @llvm.dbg.value(...))
+def is_debug_intrinsic_call(tokens):
+    for token in tokens[:4]:
+        if token.startswith(debug_intrinsic):
+            return True
+    return False
+
+
+# iterate over the logical instructions of the lines, starting at the given line, the empty lines are skipped
+def iter_instructions(lines, i=0):
+    while i < len(lines):
+        first_line = i
+        tokens = get_words(lines[i])
+        i += 1
+
+        if len(tokens) == 0:
+            continue
+
+        opcode = get_opcode(tokens)
+
+        if opcode in call_opcodes and is_debug_intrinsic_call(tokens):
+            continue
+
+        # only the words of the new line are searched for the closing bracket, so that large jump tables are read in
+        # linear time
+        if opcode == "switch":
+            closed = "]" in tokens
+            while not closed and i < len(lines):
+                words = get_words(lines[i])
+                tokens.extend(words)
+                closed = "]" in words
+                i += 1
+
+        elif opcode == "invoke":
+            if "unwind" not in tokens and i < len(lines):
+                tokens.extend(get_words(lines[i]))
+                i += 1
+
+        elif opcode == "landingpad":
+            while i < len(lines):
+                words = get_words(lines[i])
+                if len(words) == 0 or words[0] not in landingpad_clauses:
+                    break
+                tokens.extend(words)
+                i += 1
+
+        yield LogicalInstruction(tokens, first_line, i - 1)
@@ -0,0 +1,147 @@
+# The nodes of the statements within a function graph are labelled with a human-readable description of the statement.
+# These labels are only rendered once the name of a node is needed, such as when a graph is exported, so each function
+# renders the label of a node from the analysed statement that is kept as the context of the node. The same holds for
+# the edges to the destinations of the switch and indirectbr instructions.
+
+
+# Terminator instructions
+# -----------------------
+
+def get_return_label(statement):
+    if statement.get_value() is not None:
+        return "ret {}".format(statement.get_value())
+    return "ret"
+
+
+def get_invoke_label(statement):
+    return "invoke {}".format(statement.get_function_name())
+
+
+def get_resume_label(statement):
+    return "resume {} {}".format(statement.get_type(), statement.get_type())
+
+
+# Unary, binary and bitwise binary operations
+# -------------------------------------------
+
+def get_fneg_label(statement):
+    return "fneg {}".format(statement.get_value())
+
+
+def get_binary_op_label(statement):
+    return "{} {} {}".format(statement.get_value1(), statement.get_op(), statement.get_value2())
+
+
+def get_bitwise_binary_label(statement):
+    return "{} {} {}".format(statement.op1, statement.get_statement_type(), statement.op2)
+
+
+# Vector operations
+# -----------------
+
+def get_extractelement_label(statement):
+    return "extract element from {} at index {}".format(statement.get_vector_value(), statement.get_index())
+
+
+def get_insertelement_label(statement):
+    return "insert {} in {} at index {}".format(statement.get_scalar_value(), statement.get_vector_type(),
+                                                statement.get_index())
+
+
+def get_shufflevector_label(statement):
+    return "permute {} with {} using the pattern defined in {}".format(statement.get_first_vector_value(),
+                                                                       statement.get_second_vector_value(),
+                                                                       statement.get_third_vector_value())
+
+
+# Aggregate operations
+# --------------------
+
+def get_extractvalue_label(statement):
+    node_name = "extract value from {} at index ".format(statement.get_value())
+    for index in statement.get_indices():
+        node_name += "{}, ".format(index)
+    return node_name[:-2]
+
+
+def get_insertvalue_label(statement):
+    if statement.get_original() != "undef":
+        node_name = "insert {} in {} at index ".format(statement.get_insert_value(), statement.get_original())
+    else:
+        node_name = "insert {} in new object of type {} at index ".format(statement.get_insert_value(),
+                                                                          statement.get_object_type())
+    for index in statement.get_indices():
+        node_name += "{}, ".format(index)
+    return node_name[:-2]
+
+
+# Memory access and addressing operations
+# ---------------------------------------
+
+def get_load_label(statement):
+    return statement.get_value()
+
+
+def get_store_label(statement):
+    return "{} = {}".format(statement.get_register(), str(statement.get_value()))
+
+
+def get_cmpxchg_label(statement):
+    return "*{0} = {2} if *{0} = {1}".format(statement.get_address(), statement.get_cmp(), statement.get_new())
+
+
+def get_atomicrmw_label(statement):
+    return "{0}; {1}({0}, {2})".format(statement.get_address(), statement.get_operation(), statement.get_value())
+
+
+def get_getelementptr_label(statement):
+    node_name = "getelementptr {}".format(statement.get_value())
+    for idx in statement.get_indices():
+        node_name += "[{}]".format(idx)
+    return node_name
+
+
+# Conversion operations
+# ---------------------
+
+def get_conversion_label(statement):
+    return "{} {} to {}".format(statement.get_operation(), statement.get_value(), statement.get_final_type())
+
+
+# Other operations
+# ----------------
+
+def get_cmp_label(statement):
+    return "{} {} {}".format(statement.get_value1(), statement.get_condition(), statement.get_value2())
+
+
+def get_phi_label(statement):
+    node_name = ""
+    for option in statement.get_options():
+        node_name += ", {} if prev= {}".format(option.get_value(), option.get_label())
+    return node_name
+
+
+def get_select_label(statement):
+    return "select {} if {} else {}".format(statement.get_val1(), statement.get_condition(), statement.get_val2())
+
+
+def get_freeze_label(statement):
+    return "freeze {}".format(statement.get_value())
+
+
+# the calls of the call and callbr instructions
+def get_call_label(statement):
+    return "call {}".format(statement.get_function_name())
+
+
+# Edges
+# -----
+
+# the edge to a destination of a switch is labelled with the values of the cases that lead to it
+def get_switch_edge_label(statement, destination):
+    return "= {}".format(", ".join(statement.get_values(destination)))
+
+
+def get_indirectbr_edge_label(statement, destination):
+    return "{} == {}".format(statement.get_address(), destination)
@@ -0,0 +1,102 @@
+import re
+
+# The lexer splits a line of llvm ir in a single pass. Quoted names and strings are kept intact, so that a ';' or a
+# whitespace within a quoted name (e.g. @"operator;" or %"class.std::basic_string<char> ") neither starts a comment nor
+# splits the name.
+#
+# The metadata that is attached to an instruction (e.g. ", !dbg !12, !tbaa !8") follows the operands of the instruction.
+# Debug builds attach a location to nearly every instruction, as none of the analyze_* functions use these attachments,
+# they are stripped from the line before it is split, rather than being consumed as (part of) an operand.
+#
+# Two views on a line are offered:
+#   - get_words returns the whitespace separated words of the line, the punctuation remains attached to the words in
+#     this view, this is the format that is consumed by most of the analyze_* functions
+#   - tokenize returns typed tokens, in which the punctuation is split out, so that the analyze_* functions that consume
+#     them (those of the br, switch and indirectbr instructions) never have to strip a ',' from a word
+# As the joiner yields the words of an instruction, tokenize_words gives the typed tokens of these words. The tokens
+# are kept as strings, so that they can be consumed by the token cursor like the words, the kind of a token (e.g. a
+# local name, a number or punctuation) follows from its first character, and is given by get_kind.
+
+WORD = "word"
+LOCAL = "local"
+GLOBAL = "global"
+METADATA = "metadata"
+ATTRIBUTE_GROUP = "attribute_group"
+NUMBER = "number"
+STRING = "string"
+PUNCTUATION = "punctuation"
+
+# the part of the line that precedes the comment, a ';' within quotes does not start a comment
+code = re.compile(r'(?:[^";]|"[^"]*"?)*')
+
+# a word is a sequence of characters that are not whitespace, where a quoted part may contain whitespace
+word = re.compile(r'(?:[^\s"]|"[^"]*"?)+')
+
+# the attachments that trail the code of a line
+attachments = re.compile(r'(?:,\s*![-\w.$]+\s+!(?:[0-9]+|{}))+\s*$')
+
+# a token is a name, a keyword or a number, any of which can contain a quoted part (e.g. @"operator;" or c"abc\00"), a
+# quoted string, or a single punctuation character
+token = re.compile(r'[^\s,()\[\]{}<>*="]+(?:"[^"]*"?[^\s,()\[\]{}<>*="]*)*|"[^"]*"?|\S')
+
+# without quotes, the tokens are separated by putting whitespace around every punctuation character
+spaced_punctuation = [(character, " {} ".format(character)) for character in ",[](){}<>*="]
+
+# map the first character of a token onto its kind, the other tokens are punctuation
+kinds = {"%": LOCAL, "@": GLOBAL, "!": METADATA, "#": ATTRIBUTE_GROUP, "\"": STRING, "-": NUMBER, "+": NUMBER}
+kinds.update({digit: NUMBER for digit in "0123456789"})
+kinds.update({character: WORD for character in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$."})
+
+
+# strip the comment from the line
+def get_code(line):
+    # most lines do not contain any quotes, for these lines, the comment simply starts at the first ';'
+    if '"' not in line:
+        return line.split(";", 1)[0]
+    return code.match(line).group()
+
+
+# strip the metadata attachments from the code of a line
+def strip_attachments(line):
+    if "!" not in line:
+        return line
+    match = attachments.search(line)
+    if match is None:
+        return line
+    return line[:match.start()]
+
+
+# get the whitespace separated words of the line, without the comment and the metadata attachments
+def get_words(line):
+    if '"' not in line:
+        return strip_attachments(line.split(";", 1)[0]).split()
+    return word.findall(strip_attachments(code.match(line).group()))
+
+
+# get the typed tokens of the line, without the comment and the metadata attachments
+def tokenize(line):
+    return tokenize_words(get_words(line))
+
+
+# get the typed tokens of the words of a line, or of an instruction that was joined from multiple lines
+def tokenize_words(words):
+    text = " ".join(words)
+    if '"' in text:
+        return token.findall(text)
+
+    for character, spaced in spaced_punctuation:
+        if character in text:
+            text = text.replace(character, spaced)
+    return text.split()
+
+
+# get the kind of a typed token
+def get_kind(t):
+    if t == "...":
+        return PUNCTUATION
+    if t[:2] == 'c"':
+        return STRING
+    kind = kinds.get(t[0], PUNCTUATION)
+    if kind == NUMBER and len(t) == 1 and t in "-+":
+        return PUNCTUATION
+    return kind
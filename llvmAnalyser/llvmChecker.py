@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 
 # this class will be used to validate each token against the possible values a field can have
@@ -31,42 +32,79 @@ def is_unnamed_addr(token):
 
 
 def is_attribute(token):
-    return is_parameter_attribute(token) | is_function_attribute(token)
+    return classify_attribute(token)[0] != 0
 
 
 def is_group_attribute(token):
     return "#" in token
 
 
+# the kinds of attributes, a token can be of both kinds (e.g. nofree)
+PARAMETER_ATTRIBUTE = 1
+FUNCTION_ATTRIBUTE = 2
+
+parameter_attributes = frozenset({"zeroext", "signext", "inreg", "byval", "inalloca",
+                                  "sret", "noalias", "nocapture", "nofree", "nest",
+                                  "returned", "nonnull", "swiftself", "swifterror",
+                                  "immarg", "noundef", "align"})
+
+# the parameter attributes that take arguments
+parameter_attribute_format = re.compile(r'(?:byval|byref|preallocated|dereferenceable|dereferenceable_or_null|align|'
+                                        r'sret)\(')
+
+function_attributes = frozenset({"alwaysinline", "builtin", "cold", "convergent", "hot", "inaccessiblememonly",
+                                 "inaccessiblemem_or_argmemonly", "inlinehint", "jumptable", "minsize",
+                                 "naked", "\"no-inline-line-tables\"", "no-jump-tables", "nobuiltin",
+                                 "noduplicate", "nofree", "noimplicitfloat", "noinline", "nomerge",
+                                 "nonlazybind", "noredzone", "indirect-tls-seg-refs", "noreturn",
+                                 "norecurse", "willreturn", "nosync", "nounwind", "null_pointer_is_valid",
+                                 "optforfuzzing", "optnone", "optsize", "\"patchable-function\"",
+                                 "readnone", "readonly", "\"stack-probe-size\"",
+                                 "\"no-stack-arg-probe\"", "writeonly", "argmemonly", "returns_twice",
+                                 "safestack", "sanitize_address", "sanitize_memory", "sanitize_thread",
+                                 "sanitize_hwaddress", "sanitize_memtag", "speculative_load_hardening",
+                                 "speculatable", "ssp", "sspreq", "sspstrong", "strictfp", "\"denormal-fp-math\"",
+                                 "\"denormal-fp-math-f32\"", "\"thunk\"", "uwtable", "nocf_check", "shadowcallstack",
+                                 "\"probe-stack\"", "mustprogress"})
+
+
+# classify the token as an attribute, this returns the kind of attribute the token is (0 if it is no attribute),
+# along with its extent: the number of brackets that it leaves open, these have to be closed by the following tokens
+# the same tokens are classified over and over again, so the classification is memoized
+@lru_cache(maxsize=4096)
+def classify_attribute(token):
+    kind = 0
+    if token.replace(",", "") in parameter_attributes or parameter_attribute_format.match(token):
+        kind |= PARAMETER_ATTRIBUTE
+    if token in function_attributes or "alignstack" in token or "allocsize" in token:
+        kind |= FUNCTION_ATTRIBUTE
+    return kind, token.count("(") - token.count(")")
+
+
 def is_parameter_attribute(token):
-    is_attr = token.replace(",", "") in {"zeroext", "signext", "inreg", "byval", "inalloca",
-                                         "sret", "noalias", "nocapture", "nofree", "nest",
-                                         "returned", "nonnull", "swiftself", "swifterror",
-                                         "immarg", "noundef", "align"}
-    is_attr = is_attr or re.match(r'^byval\(.*?\)?,?', token) or re.match(r'^byref\(.*?\)?', token)
-    is_attr = is_attr or re.match(r'^preallocated\(.*?\)?,?', token) or re.match(r'^dereferenceable\(.*?\)?,?', token)
-    is_attr = is_attr or re.match(r'^align\(.*?\)?,?', token) or re.match(r'dereferenceable_or_null\(.*?\)?,?', token)
-    is_attr = is_attr or re.match(r'^sret\(.*\)?,?', token)
-    return is_attr
+    return classify_attribute(token)[0] & PARAMETER_ATTRIBUTE != 0
 
 
 def is_function_attribute(token):
-    is_attr = token in {"alwaysinline", "builtin", "cold", "convergent", "hot", "inaccessiblememonly",
-                        "inaccessiblemem_or_argmemonly", "inlinehint", "jumptable", "minsize",
-                        "naked", "\"no-inline-line-tables\"", "no-jump-tables", "nobuiltin",
-                        "noduplicate", "nofree", "noimplicitfloat", "noinline", "nomerge",
-                        "nonlazybind", "noredzone", "indirect-tls-seg-refs", "noreturn",
-                        "norecurse", "willreturn", "nosync", "nounwind", "null_pointer_is_valid",
-                        "optforfuzzing", "optnone", "optsize", "\"patchable-function\"",
-                        "\"patchable-function\"", "readnone", "readonly", "\"stack-probe-size\"",
-                        "\"no-stack-arg-probe\"", "writeonly", "argmemonly", "returns_twice",
-                        "safestack", "sanitize_address", "sanitize_memory", "sanitize_thread",
-                        "sanitize_hwaddress", "sanitize_memtag", "speculative_load_hardening",
-                        "speculatable", "ssp", "sspreq", "sspstrong", "strictfp", "\"denormal-fp-math\"",
-                        "\"denormal-fp-math-f32\"", "\"thunk\"", "uwtable", "nocf_check", "shadowcallstack",
-                        "\"probe-stack\"", "mustprogress"}
-    is_attr = is_attr | ("alignstack" in token) | ("allocsize" in token)
-    return is_attr
+    return classify_attribute(token)[0] & FUNCTION_ATTRIBUTE != 0
+
+
+# get the number of brackets that the token leaves open
+def get_extent(token):
+    return classify_attribute(token)[1]
+
+
+# read the attribute at the start of the tokens, the arguments of an attribute can be spread over multiple tokens
+# (e.g. allocsize(4, 8)), and the align attribute takes its value as a separate token
+def read_attribute(tokens):
+    open_brackets = get_extent(tokens.peek())
+    attribute = tokens.advance()
+    while open_brackets != 0:
+        open_brackets += get_extent(tokens.peek())
+        attribute += " {}".format(tokens.advance())
+    if attribute == "align":
+        attribute += " {}".format(tokens.advance())
+    return attribute
 
 
 def is_address_space(token):
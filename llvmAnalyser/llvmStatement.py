@@ -4,7 +4,11 @@ It defines functions assumed to be defined for all statements.
 """
 
 
+# a statement is created for every instruction and is kept for as long as the graph of its function, the statements
+# therefore declare their attributes as slots, so that they do not carry a dictionary of attributes
 class LlvmStatement:
+    __slots__ = ()
+
     def __init__(self):
         pass
 
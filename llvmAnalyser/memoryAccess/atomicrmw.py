@@ -1,27 +1,30 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 # The ‘atomicrmw’ instruction is used to atomically modify memory.
 
 # atomicrmw [volatile] <operation> <ty>* <pointer>, <ty> <value> [syncscope("<target-scope>")] <ordering>
 
 
 def analyze_atomicrmw(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Atomicrmw()
 
     # pop potential assignment
-    while tokens[0] != "atomicrmw":
-        tokens.pop(0)
+    while tokens.peek() != "atomicrmw":
+        tokens.advance()
 
     # pop the atomicrmw token
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the potential volatile token
-    if tokens[0] == "volatile":
-        tokens.pop(0)
+    if tokens.peek() == "volatile":
+        tokens.advance()
 
     # pop the operation
-    operation = tokens.pop(0)
+    operation = tokens.advance()
     statement.set_operation(operation)
 
     # pop the address
@@ -36,12 +39,14 @@ def analyze_atomicrmw(tokens):
 
     # we are not interested in ordering, we can therefore pop all remaining tokens
     while tokens:
-        tokens.pop(0)
+        tokens.advance()
 
     return statement
 
 
 class Atomicrmw(LlvmStatement):
+    __slots__ = ("operation", "address", "value")
+
     def __init__(self):
         super().__init__()
         self.operation = None
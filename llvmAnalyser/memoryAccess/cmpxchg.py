@@ -1,6 +1,7 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 
 
 # The ‘cmpxchg’ instruction is used to atomically modify memory.
@@ -11,22 +12,24 @@ from llvmAnalyser.values import get_value
 #                           <success ordering> <failure ordering>
 
 def analyze_cmpxchg(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Cmpxchg()
 
     # pop a potential assignment instruction
-    while tokens[0] != "cmpxchg":
-        tokens.pop(0)
+    while tokens.peek() != "cmpxchg":
+        tokens.advance()
 
     # pop the cmpxchg token
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the weak token, if present
-    if tokens[0] == "weak":
-        tokens.pop(0)
+    if tokens.peek() == "weak":
+        tokens.advance()
 
     # pop the volatile token, if present
-    if tokens[0] == "volatile":
-        tokens.pop(0)
+    if tokens.peek() == "volatile":
+        tokens.advance()
 
     # get the address value
     _, tokens = get_type(tokens)
@@ -45,12 +48,14 @@ def analyze_cmpxchg(tokens):
 
     # we are not interested in ordering instructions, and these can therefore be popped
     while tokens:
-        tokens.pop(0)
+        tokens.advance()
 
     return statement
 
 
 class Cmpxchg(LlvmStatement):
+    __slots__ = ("address", "cmp", "new")
+
     def __init__(self):
         super().__init__()
         self.address = None
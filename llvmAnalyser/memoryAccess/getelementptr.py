@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 '''
 Overview:
@@ -14,18 +15,20 @@ addresses.
 
 
 def analyze_getelementptr(tokens: list):
+    tokens = as_cursor(tokens)
+
     op = Getelementptr()
 
     # skip potential assignment tokens
-    while tokens[0] != "getelementptr":
-        tokens.pop(0)
+    while tokens.peek() != "getelementptr":
+        tokens.advance()
 
     # pop getelementptr
-    tokens.pop(0)
+    tokens.advance()
 
     # pop a potential inbounds keyword
-    if tokens[0] == "inbounds":
-        tokens.pop(0)
+    if tokens.peek() == "inbounds":
+        tokens.advance()
 
     # pop the type
     _, tokens = get_type(tokens)
@@ -39,19 +42,21 @@ def analyze_getelementptr(tokens: list):
 
     # access potential further indices
     while len(tokens) != 0:
-        if tokens[0] == "inrange":
-            tokens.pop(0)
+        if tokens.peek() == "inrange":
+            tokens.advance()
 
         # get the index type
         _, tokens = get_type(tokens)
 
         # get the index value
-        op.add_index(tokens.pop(0).replace(",", ""))
+        op.add_index(tokens.advance().replace(",", ""))
 
     return op
 
 
 class Getelementptr(LlvmStatement):
+    __slots__ = ("value", "indices")
+
     def __init__(self):
         super().__init__()
         self.value = None
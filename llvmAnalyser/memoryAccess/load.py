@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # The ‘load’ instruction is used to read from memory.
 # <result> = load [volatile] <ty>, <ty>* <pointer>[, align <alignment>]
 #                                                 [, !nontemporal !<nontemp_node>]
@@ -19,30 +20,32 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 
 
 def analyze_load(tokens):
+    tokens = as_cursor(tokens)
+
     load = Load()
 
     # pop the assignment instruction
-    while tokens[0] != "load":
-        tokens.pop(0)
+    while tokens.peek() != "load":
+        tokens.advance()
 
     # pop the load instruction
-    tokens.pop(0)
+    tokens.advance()
 
     # check for atomic
-    if tokens[0] == "atomic":
-        tokens.pop(0)
+    if tokens.peek() == "atomic":
+        tokens.advance()
 
     # check for volatile
-    if tokens[0] == "volatile":
-        tokens.pop(0)
+    if tokens.peek() == "volatile":
+        tokens.advance()
 
     # skip type
     resulting_type, tokens = get_type(tokens)
     load.set_type(resulting_type)
 
     # check for ,
-    if tokens[0] == ",":
-        tokens.pop(0)
+    if tokens.peek() == ",":
+        tokens.advance()
 
     # skip type
     _, tokens = get_type(tokens)
@@ -55,6 +58,8 @@ def analyze_load(tokens):
 
 
 class Load(LlvmStatement):
+    __slots__ = ("value", "resulting_type")
+
     def __init__(self):
         super().__init__()
         self.value = None
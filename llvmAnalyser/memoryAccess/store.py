@@ -1,21 +1,24 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 
 def analyze_store(tokens):
+    tokens = as_cursor(tokens)
+
     store = Store()
 
     # pop the store instruction
-    tokens.pop(0)
+    tokens.advance()
 
     # check for atomic
-    if tokens[0] == "atomic":
-        tokens.pop(0)
+    if tokens.peek() == "atomic":
+        tokens.advance()
 
     # check for volatile
-    if tokens[0] == "volatile":
-        tokens.pop(0)
+    if tokens.peek() == "volatile":
+        tokens.advance()
 
     # skip type
     temp, tokens = get_type(tokens)
@@ -32,6 +35,8 @@ def analyze_store(tokens):
 
 
 class Store(LlvmStatement):
+    __slots__ = ("value", "register")
+
     def __init__(self):
         super().__init__()
         self.value = None
@@ -1,9 +1,10 @@
 from llvmAnalyser.llvmChecker import *
-from llvmAnalyser.function import Parameter as Argument
+from llvmAnalyser.function import Parameter as Argument, get_nr_of_tokens_past_last_bracket
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.conversion.conversion import analyze_conversion
+from llvmAnalyser.cursor import as_cursor
 
 
 # The ‘call’ instruction represents a simple function call.
@@ -13,34 +14,32 @@ from llvmAnalyser.conversion.conversion import analyze_conversion
 
 
 def analyze_call(tokens: list):
+    tokens = as_cursor(tokens)
+
     call = Call()
 
     # skip all initial tokens
-    while tokens[0] != "call":
-        tokens.pop(0)
+    while tokens.peek() != "call":
+        tokens.advance()
 
-    tokens.pop(0)
+    tokens.advance()
 
     # check if there are fast-math flags
-    while is_fast_math_flag(tokens[0]):
-        tokens.pop(0)
+    while is_fast_math_flag(tokens.peek()):
+        tokens.advance()
 
     # check if there is a cconv field
-    if is_calling_convention(tokens[0]):
-        attr = tokens.pop(0)
+    if is_calling_convention(tokens.peek()):
+        attr = tokens.advance()
         if attr == "cc":
-            attr += " {}".format(tokens.pop(0))
+            attr += " {}".format(tokens.advance())
         call.set_calling_convention(attr)
     else:
         call.set_calling_convention("ccc")
 
     # check if there are parameter attributes
-    while is_parameter_attribute(tokens[0]):
-        open_brackets = tokens[0].count("(") - tokens[0].count(")")
-        attr = tokens.pop(0)
-        while open_brackets != 0:
-            open_brackets += tokens[0].count("(") - tokens[0].count(")")
-            attr += " {}".format(tokens.pop(0))
+    while is_parameter_attribute(tokens.peek()):
+        attr = read_attribute(tokens)
         call.add_return_attr(attr)
 
     # skip the return type
@@ -48,26 +47,26 @@ def analyze_call(tokens: list):
     call.set_return_type(return_type)
 
     # skip potential redundant tokens
-    while tokens[0].count("(") == 0 and "bitcast" not in tokens[0]:
-        tokens.pop(0)
+    while tokens.peek().count("(") == 0 and "bitcast" not in tokens.peek():
+        tokens.advance()
 
     # read the function name
-    if "bitcast" in tokens[0]:
+    if "bitcast" in tokens.peek():
         conversion = analyze_conversion(tokens)
         call.set_function_name(conversion.get_value())
-        if tokens[0][0] == "(":
-            tokens[0] = tokens[0][1:]
+        if tokens.peek()[0] == "(":
+            tokens.replace(tokens.peek()[1:])
     else:
-        temp = tokens[0].split("(", 1)
-        tokens[0] = temp[1]
+        temp = tokens.peek().split("(", 1)
+        tokens.replace(temp[1])
 
         call.set_function_name(temp[0])
 
     # read the argument list
     while tokens and \
-            not is_group_attribute(tokens[0]) and \
-            not is_function_attribute(tokens[0]) and \
-            ("(" in tokens[0] or ")" not in tokens[0]):
+            not is_group_attribute(tokens.peek()) and \
+            not is_function_attribute(tokens.peek()) and \
+            ("(" in tokens.peek() or ")" not in tokens.peek()):
         argument = Argument()
 
         # read argument type
@@ -75,12 +74,8 @@ def analyze_call(tokens: list):
         argument.set_parameter_type(parameter_type)
 
         # read potential parameter attributes
-        while is_parameter_attribute(tokens[0]):
-            open_brackets = tokens[0].count("(") - tokens[0].count(")")
-            attribute = tokens.pop(0)
-            while open_brackets != 0 or attribute == "align":
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += " {}".format(tokens.pop(0))
+        while is_parameter_attribute(tokens.peek()):
+            attribute = read_attribute(tokens)
             argument.add_parameter_attribute(attribute)
 
         # read register
@@ -90,49 +85,42 @@ def analyze_call(tokens: list):
         call.add_argument(argument)
 
     # make sure you finish the parameter list, this token will not get popped if we have an empty argument list
-    if tokens and tokens[0] == ")":
-        tokens.pop(0)
+    if tokens and tokens.peek() == ")":
+        tokens.advance()
 
     # read function attributes
-    if tokens and is_group_attribute(tokens[0]):
-        call.set_group_function_attribute(tokens[0])
-        tokens.pop(0)
-    while tokens and is_function_attribute(tokens[0]):
-        if "allocsize" in tokens[0]:
-            attribute = tokens.pop(0)
-            open_brackets = attribute.count("(") - attribute.count(")")
-            while open_brackets != 0:
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += " {}".format(tokens.pop(0))
-            call.add_function_attribute(attribute)
-        else:
-            call.add_function_attribute(tokens.pop(0))
+    if tokens and is_group_attribute(tokens.peek()):
+        call.set_group_function_attribute(tokens.advance())
+    while tokens and is_function_attribute(tokens.peek()):
+        call.add_function_attribute(read_attribute(tokens))
 
     # analyze operand bundle sets
-    if tokens and "[" in tokens[0]:
+    if tokens and "[" in tokens.peek():
         operand_bundle_set = OperandBundleSet()
-        tokens.pop(0)
+        tokens.advance()
 
         # analyze operand bundles
-        while tokens[0] != "]":
+        while tokens.peek() != "]":
             operand_bundle = OperandBundle()
 
             # get the operand bundle tag
-            quote_count = tokens[0].count("\"")
-            tag = tokens.pop(0)
+            quote_count = tokens.peek().count("\"")
+            tag = tokens.advance()
             while quote_count < 2:
-                tag += " {}".format(tokens.pop(0))
+                tag += " {}".format(tokens.advance())
                 quote_count = tag.count("\"")
 
             temp = tag.split('"', 2)
             operand_bundle.set_tag("\"{}\"".format(temp[1]))
-            tokens.insert(0, temp[-1])
+            tokens.push(temp[-1])
 
+            # the operands of the bundle are enclosed by the bracket that follows the tag
+            tokens.replace(tokens.peek()[1:])
             desired_remaining_token_length = get_nr_of_tokens_past_last_bracket(tokens)
 
-            if tokens[0][0] == ")":
+            if tokens.peek()[0] == ")":
                 operand_bundle_set.add_operand_bundle(operand_bundle)
-                tokens.pop(0)
+                tokens.advance()
                 continue
 
             # analyze operands
@@ -151,29 +139,15 @@ def analyze_call(tokens: list):
 
         call.set_operand_bundle_set(operand_bundle_set)
 
-        tokens.pop(0)
+        tokens.advance()
 
     return call
 
 
-def get_nr_of_tokens_past_last_bracket(tokens):
-    tokens[0] = tokens[0][1:]
-
-    open_brackets = 1
-
-    # loop over the tokens until this first bracket is closed again, when this happens, return the index
-    for i in range(len(tokens)):
-        for j in range(len(tokens[i])):
-            char = tokens[i][j]
-            if char == "(":
-                open_brackets += 1
-            elif char == ")":
-                open_brackets -= 1
-            if open_brackets == 0:
-                return len(tokens) - i
-
-
 class Call(LlvmStatement):
+    __slots__ = ("function_name", "arguments", "function_attributes", "operand_bundle_set", "memory",
+                 "calling_convention", "return_attrs", "return_type")
+
     def __init__(self):
         super().__init__()
         self.function_name = None
@@ -257,6 +231,8 @@ class Call(LlvmStatement):
 
 
 class OperandBundleSet:
+    __slots__ = ("operand_bundles",)
+
     def __init__(self):
         self.operand_bundles = list()
 
@@ -268,6 +244,8 @@ class OperandBundleSet:
 
 
 class OperandBundle:
+    __slots__ = ("tag", "operands")
+
     def __init__(self):
         self.tag = None
         self.operands = list()
@@ -286,6 +264,8 @@ class OperandBundle:
 
 
 class Operand:
+    __slots__ = ("operand_type", "operand_value")
+
     def __init__(self):
         self.operand_type = None
         self.operand_value = None
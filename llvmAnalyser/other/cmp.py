@@ -2,24 +2,27 @@ from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.llvmChecker import is_fast_math_flag
+from llvmAnalyser.cursor import as_cursor
 
 
 def analyze_cmp(tokens):
+    tokens = as_cursor(tokens)
+
     cmp = Cmp()
 
     # pop the potential assignment instruction
-    while tokens[0] not in ["fcmp", "icmp"]:
-        tokens.pop(0)
+    while tokens.peek() not in ["fcmp", "icmp"]:
+        tokens.advance()
 
     # pop the fcmp instruction
-    cmp.set_op_type(tokens.pop(0))
+    cmp.set_op_type(tokens.advance())
 
     # pop potential fast-math flags
-    while is_fast_math_flag(tokens[0]):
-        tokens.pop(0)
+    while is_fast_math_flag(tokens.peek()):
+        tokens.advance()
 
     # get the condition
-    cmp.set_condition(tokens.pop(0))
+    cmp.set_condition(tokens.advance())
 
     # pop the type
     _, tokens = get_type(tokens)
@@ -35,6 +38,8 @@ def analyze_cmp(tokens):
 
 
 class Cmp(LlvmStatement):
+    __slots__ = ("op_type", "condition", "value1", "value2")
+
     def __init__(self):
         super().__init__()
         self.op_type = None
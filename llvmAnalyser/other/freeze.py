@@ -1,20 +1,23 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 # The ‘freeze’ instruction is used to stop propagation of undef and poison values.
 
 # <result> = freeze ty <val>    ; yields ty:result
 
 
 def analyze_freeze(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Freeze()
 
     # pop the potential assignment
-    while tokens[0] != "freeze":
-        tokens.pop(0)
+    while tokens.peek() != "freeze":
+        tokens.advance()
 
     # pop the freeze token
-    tokens.pop(0)
+    tokens.advance()
 
     # get the value
     _, tokens = get_type(tokens)
@@ -25,6 +28,8 @@ def analyze_freeze(tokens):
 
 
 class Freeze(LlvmStatement):
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.value = None
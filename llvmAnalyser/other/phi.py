@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.llvmChecker import is_fast_math_flag
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 '''
 Overview:
@@ -10,18 +11,20 @@ based upon the block it was in before the current block
 
 
 def analyze_phi(tokens):
+    tokens = as_cursor(tokens)
+
     phi = Phi()
 
     # pop the potential assignment section
-    while tokens[0] != "phi":
-        tokens.pop(0)
+    while tokens.peek() != "phi":
+        tokens.advance()
 
     # pop the phi instruction
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the potential fast math flags
-    while is_fast_math_flag(tokens[0]):
-        tokens.pop(0)
+    while is_fast_math_flag(tokens.peek()):
+        tokens.advance()
 
     # pop the return type
     _, tokens = get_type(tokens)
@@ -30,23 +33,23 @@ def analyze_phi(tokens):
         option = PhiOption()
 
         # pop the '[' token
-        tokens.pop(0)
+        tokens.advance()
 
         # get the value
         value = ""
-        while "," not in tokens[0]:
-            value += tokens.pop(0)
-        value += tokens.pop(0).replace(",", "")
+        while "," not in tokens.peek():
+            value += tokens.advance()
+        value += tokens.advance().replace(",", "")
         option.set_value(value)
 
         # get the label
         label = ""
-        while "]" not in tokens[0]:
-            label += tokens.pop(0)
+        while "]" not in tokens.peek():
+            label += tokens.advance()
         option.set_label(label)
 
         # pop the ']' token
-        tokens.pop(0)
+        tokens.advance()
 
         phi.add_option(option)
 
@@ -54,6 +57,8 @@ def analyze_phi(tokens):
 
 
 class Phi(LlvmStatement):
+    __slots__ = ("options",)
+
     def __init__(self):
         super().__init__()
         self.options = list()
@@ -72,6 +77,8 @@ class Phi(LlvmStatement):
 
 
 class PhiOption:
+    __slots__ = ("value", "label")
+
     def __init__(self):
         self.value = None
         self.label = None
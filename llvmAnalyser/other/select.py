@@ -2,6 +2,7 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.llvmChecker import is_fast_math_flag
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 # The ‘select’ instruction is used to choose one value based on a condition, without IR-level branching.
 
 # <result> = select [fast-math flags] selty <cond>, <ty> <val1>, <ty> <val2>             ; yields ty
@@ -10,18 +11,20 @@ from llvmAnalyser.values import get_value
 
 
 def analyze_select(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Select()
 
     # pop the potential assignment
-    while tokens[0] != "select":
-        tokens.pop(0)
+    while tokens.peek() != "select":
+        tokens.advance()
 
     # pop the select token
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the potential fast-math flags
-    while is_fast_math_flag(tokens[0]):
-        tokens.pop(0)
+    while is_fast_math_flag(tokens.peek()):
+        tokens.advance()
 
     # get the condition
     _, tokens = get_type(tokens)
@@ -42,6 +45,8 @@ def analyze_select(tokens):
 
 
 class Select(LlvmStatement):
+    __slots__ = ("condition", "val1", "val2")
+
     def __init__(self):
         super().__init__()
         self.condition = None
@@ -0,0 +1,489 @@
+from mmap import mmap, ACCESS_READ
+from array import array
+from collections import OrderedDict
+from bisect import bisect_right
+from zlib import decompressobj, compress, decompress
+from os import fstat
+
+# The reader gives line based access to an llvm file without loading the entire file in memory.
+# The file is memory mapped, and only the offsets at which each line starts are stored. These offsets are kept in a
+# compact array of unsigned 64 bit integers. Lines are only decoded once they are requested, so the memory that is used
+# scales with the number of lines that are actually visited, rather than with the size of the file.
+# In case the offsets are already known (e.g. from the module index), they can be passed along, so that the file does
+# not have to be scanned for line endings.
+#
+# Compressed llvm files (.ll.gz, .ll.xz, .ll.zst) are decompressed as a stream, without inflating them to disk. The
+# decompressed content is divided in blocks of a fixed size, and the offsets of the lines refer to the decompressed
+# content. Only a few decompressed blocks are kept in memory at any time.
+# For gzip files, the state of the decompressor is stored at the start of every block, these seek points allow
+# jumping to any block by only decompressing that block. The decompressors of the other formats can not be copied, so
+# for these formats, the blocks are kept in memory, compressed with zlib, as they are read from the stream.
+#
+# Bitcode files (.bc) are disassembled by llvm-dis, whose output is piped directly into a buffered reader, so that the
+# disassembled llvm file never has to be written to disk, and the file can already be scanned during disassembly.
+# The module index only saves the scan of a bitcode file, llvm-dis is still run every time the file is opened, and the
+# blocks of its output that were read are kept in memory (compressed with zlib) until the reader is closed. Bitcode
+# files that are analysed repeatedly are therefore better disassembled once, and analysed as llvm files.
+#
+# A set of llvm files (e.g. the files of the separate translation units) can be read as if the files were
+# concatenated, the files are only opened once one of their lines is requested.
+#
+# A scan of the module only needs the lines with a given first byte (e.g. define, declare and closing brackets). For a
+# memory mapped file, NumPy selects these lines in bulk, so that the interpreter never visits the other lines.
+
+BLOCK_SIZE = 1 << 22
+INPUT_SIZE = 1 << 16
+CACHED_BLOCKS = 4
+CLASSIFY_SIZE = 1 << 26
+
+
+class LineReader:
+    def __init__(self, offsets=None):
+        # the offsets are determined lazily, so that a pre-scan of the file can register them while iterating
+        # over the lines, instead of requiring a separate pass over the file
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.get_offsets()) - 1
+
+    def __getitem__(self, i):
+        offsets = self.get_offsets()
+
+        if i < 0:
+            i += len(offsets) - 1
+        if i < 0 or i >= len(offsets) - 1:
+            raise IndexError("line index out of range")
+
+        return self.read(offsets[i], offsets[i + 1]).decode("utf-8").rstrip()
+
+    def get_offsets(self):
+        if self.offsets is None:
+            for _ in self.iter_lines():
+                pass
+        return self.offsets
+
+    # iterate over the raw lines of the file in a single pass, yielding the offset at which each line starts along
+    # with the undecoded line itself, the offsets of the lines get registered along the way if they were not known
+    # in case first bytes are given, None is yielded instead of the lines that do not start with one of these bytes
+    def iter_lines(self, first_bytes=None):
+        raise NotImplementedError
+
+    # iterate over the lines that start with one of the given bytes, yielding the index of each line along with the
+    # offset at which it starts and the undecoded line itself, the offsets of all lines get registered along the way
+    def iter_selected_lines(self, first_bytes):
+        for i, (start, line) in enumerate(self.iter_lines(first_bytes)):
+            if line is not None:
+                yield i, start, line
+
+    def read(self, start, end):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LlvmReader(LineReader):
+    def __init__(self, file, offsets=None):
+        super().__init__(offsets)
+        self.file = open(file, "rb")
+
+        # an empty file can not be memory mapped
+        if fstat(self.file.fileno()).st_size == 0:
+            self.data = b""
+        else:
+            self.data = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+
+    def get_offsets(self):
+        if self.offsets is None:
+            self.offsets = get_line_offsets(self.data)
+        return self.offsets
+
+    def iter_lines(self, first_bytes=None):
+        data = self.data
+        if self.offsets is not None:
+            offsets = self.offsets
+            for i in range(len(offsets) - 1):
+                if first_bytes is None or data[offsets[i]] in first_bytes:
+                    yield offsets[i], data[offsets[i]:offsets[i + 1]]
+                else:
+                    yield offsets[i], None
+            return
+
+        offsets = array("Q", [0])
+        start = 0
+        end = data.find(b"\n")
+        while end != -1:
+            offsets.append(end + 1)
+            if first_bytes is None or data[start] in first_bytes:
+                yield start, data[start:end + 1]
+            else:
+                yield start, None
+            start = end + 1
+            end = data.find(b"\n", start)
+
+        # register the final line, in case the data does not end with a newline
+        if start != len(data):
+            offsets.append(len(data))
+            if first_bytes is None or data[start] in first_bytes:
+                yield start, data[start:]
+            else:
+                yield start, None
+
+        self.offsets = offsets
+
+    def iter_selected_lines(self, first_bytes):
+        self.offsets, selected = classify_lines(self.data, first_bytes, self.offsets)
+        offsets = self.offsets
+        for i in selected:
+            yield i, offsets[i], self.data[offsets[i]:offsets[i + 1]]
+
+    def read(self, start, end):
+        return self.data[start:end]
+
+    def close(self):
+        if isinstance(self.data, mmap):
+            self.data.close()
+        self.file.close()
+
+
+# a reader for content that is only available in blocks, every block except for the final one has the same size
+class BlockLlvmReader(LineReader):
+    def __init__(self, offsets=None):
+        super().__init__(offsets)
+
+        # keep the most recently used blocks in memory
+        self.cached_blocks = OrderedDict()
+
+    # iterate over all blocks in order
+    def iter_blocks(self):
+        raise NotImplementedError
+
+    # get a single block, this returns an empty block if the index lies past the final block
+    def get_block(self, k):
+        raise NotImplementedError
+
+    def get_cached_block(self, k):
+        if k in self.cached_blocks:
+            self.cached_blocks.move_to_end(k)
+            return self.cached_blocks[k]
+
+        block = self.get_block(k)
+        self.cached_blocks[k] = block
+        if len(self.cached_blocks) > CACHED_BLOCKS:
+            self.cached_blocks.popitem(last=False)
+        return block
+
+    def iter_lines(self, first_bytes=None):
+        if self.offsets is not None:
+            offsets = self.offsets
+            for i in range(len(offsets) - 1):
+                if first_bytes is None or self.read(offsets[i], offsets[i] + 1)[0] in first_bytes:
+                    yield offsets[i], self.read(offsets[i], offsets[i + 1])
+                else:
+                    yield offsets[i], None
+            return
+
+        offsets = array("Q", [0])
+
+        # the start of a line can be located within a previous block, this part of the line is carried over
+        carry = b""
+        position = 0
+        for block in self.iter_blocks():
+            data = carry + block if carry else block
+            start = 0
+            end = data.find(b"\n")
+            while end != -1:
+                offsets.append(position + end + 1)
+                if first_bytes is None or data[start] in first_bytes:
+                    yield position + start, data[start:end + 1]
+                else:
+                    yield position + start, None
+                start = end + 1
+                end = data.find(b"\n", start)
+
+            carry = data[start:]
+            position += start
+
+        # register the final line, in case the data does not end with a newline
+        if carry:
+            offsets.append(position + len(carry))
+            yield position, carry if first_bytes is None or carry[0] in first_bytes else None
+
+        self.offsets = offsets
+
+    def read(self, start, end):
+        if end <= start:
+            return b""
+
+        first = start // BLOCK_SIZE
+        last = (end - 1) // BLOCK_SIZE
+        if first == last:
+            return self.get_cached_block(first)[start - first * BLOCK_SIZE:end - first * BLOCK_SIZE]
+
+        parts = list()
+        for k in range(first, last + 1):
+            parts.append(self.get_cached_block(k)[max(start - k * BLOCK_SIZE, 0):end - k * BLOCK_SIZE])
+        return b"".join(parts)
+
+
+class GzipLlvmReader(BlockLlvmReader):
+    def __init__(self, file, offsets=None):
+        super().__init__(offsets)
+        self.file = open(file, "rb")
+
+        # the seek points, checkpoint k contains the position within the compressed file from which the compressed
+        # data needs to be read, alongside the state of the decompressor at the start of block k
+        self.checkpoints = [(0, decompressobj(31))]
+
+    def iter_blocks(self):
+        return self.decompress_blocks(0)
+
+    def get_block(self, k):
+        start = min(k, len(self.checkpoints) - 1)
+        for i, block in enumerate(self.decompress_blocks(start), start):
+            if i == k:
+                return block
+        return b""
+
+    # decompress the blocks starting at block k, registering the seek points of the blocks that follow
+    def decompress_blocks(self, k):
+        position, decompressor = self.checkpoints[k]
+        decompressor = decompressor.copy()
+
+        data = b""
+        parts = list()
+        size = 0
+        while True:
+            part = decompressor.decompress(data, BLOCK_SIZE - size)
+            parts.append(part)
+            size += len(part)
+
+            # a gzip file can consist of multiple members, each of which needs a new decompressor
+            if decompressor.eof:
+                data = decompressor.unused_data
+                decompressor = decompressobj(31)
+            else:
+                data = decompressor.unconsumed_tail
+
+            if size == BLOCK_SIZE:
+                k += 1
+                if k == len(self.checkpoints):
+                    self.checkpoints.append((position - len(data), decompressor.copy()))
+                yield b"".join(parts)
+                parts = list()
+                size = 0
+
+            # all input was consumed without filling the block, so more input is needed
+            elif not data:
+                self.file.seek(position)
+                data = self.file.read(INPUT_SIZE)
+                position += len(data)
+                if not data:
+                    break
+
+        if size:
+            yield b"".join(parts)
+
+    def close(self):
+        self.file.close()
+
+
+class BufferedLlvmReader(BlockLlvmReader):
+    def __init__(self, stream, offsets=None):
+        super().__init__(offsets)
+        self.stream = stream
+
+        # the blocks that were read from the stream, compressed with zlib
+        self.chunks = list()
+        self.finished = False
+
+    def read_block(self):
+        if self.finished:
+            return b""
+
+        # a stream is allowed to return less data than requested, so keep reading until the block is filled
+        parts = list()
+        size = 0
+        while size < BLOCK_SIZE:
+            data = self.stream.read(BLOCK_SIZE - size)
+            if not data:
+                self.finished = True
+                break
+            parts.append(data)
+            size += len(data)
+
+        block = b"".join(parts)
+        if block:
+            self.chunks.append(compress(block, 1))
+        return block
+
+    def iter_blocks(self):
+        k = 0
+        while True:
+            if k < len(self.chunks):
+                block = decompress(self.chunks[k])
+            else:
+                block = self.read_block()
+            if not block:
+                return
+            yield block
+            k += 1
+
+    def get_block(self, k):
+        while len(self.chunks) <= k and not self.finished:
+            self.read_block()
+        if k < len(self.chunks):
+            return decompress(self.chunks[k])
+        return b""
+
+    def close(self):
+        self.stream.close()
+
+
+class PipedLlvmReader(BufferedLlvmReader):
+    def __init__(self, file, llvm_dis, offsets=None):
+        from subprocess import Popen, PIPE
+
+        self.file = file
+        self.process = Popen([llvm_dis, file, "-o", "-"], stdout=PIPE)
+        super().__init__(self.process.stdout, offsets)
+
+    def read_block(self):
+        block = super().read_block()
+
+        # verify that the disassembly completed, as a failure would otherwise look like a truncated llvm file
+        if self.finished and self.process.wait() != 0:
+            raise OSError("Disassembling {} failed with exit code {}".format(self.file, self.process.returncode))
+
+        return block
+
+    def close(self):
+        # closing the pipe stops the disassembly in case it did not finish yet
+        self.stream.close()
+        self.process.wait()
+
+
+class ModuleSetReader(LineReader):
+    def __init__(self, files, offsets, llvm_dis="llvm-dis-6.0"):
+        super().__init__()
+        self.files = files
+        self.file_offsets = offsets
+        self.llvm_dis = llvm_dis
+        self.readers = [None] * len(files)
+
+        # the index of the first line and the first byte of every file, followed by the totals
+        self.line_bases = array("Q", [0])
+        self.byte_bases = array("Q", [0])
+        for file_offsets in offsets:
+            self.line_bases.append(self.line_bases[-1] + len(file_offsets) - 1)
+            self.byte_bases.append(self.byte_bases[-1] + file_offsets[-1])
+
+    def __len__(self):
+        return self.line_bases[-1]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("line index out of range")
+
+        k = bisect_right(self.line_bases, i) - 1
+        return self.get_reader(k)[i - self.line_bases[k]]
+
+    def get_reader(self, k):
+        if self.readers[k] is None:
+            self.readers[k] = open_reader(self.files[k], self.file_offsets[k], self.llvm_dis)
+        return self.readers[k]
+
+    def iter_lines(self, first_bytes=None):
+        for k in range(len(self.files)):
+            for start, line in self.get_reader(k).iter_lines(first_bytes):
+                yield self.byte_bases[k] + start, line
+
+    def read(self, start, end):
+        parts = list()
+        k = bisect_right(self.byte_bases, start) - 1
+        while start < end and k < len(self.files):
+            part_end = min(end, self.byte_bases[k + 1])
+            parts.append(self.get_reader(k).read(start - self.byte_bases[k], part_end - self.byte_bases[k]))
+            start = part_end
+            k += 1
+        return b"".join(parts)
+
+    def close(self):
+        for reader in self.readers:
+            if reader is not None:
+                reader.close()
+
+
+# open the reader that belongs to the type of the given llvm file
+# the modules that are needed for the compressed formats are only imported once such a file is encountered
+def open_reader(file, offsets=None, llvm_dis="llvm-dis-6.0"):
+    if file.endswith(".bc"):
+        return PipedLlvmReader(file, llvm_dis, offsets)
+    elif file.endswith(".gz"):
+        return GzipLlvmReader(file, offsets)
+    elif file.endswith(".xz"):
+        import lzma
+        return BufferedLlvmReader(lzma.open(file, "rb"), offsets)
+    elif file.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("The zstandard package is required to read {}".format(file))
+        return BufferedLlvmReader(zstandard.ZstdDecompressor().stream_reader(open(file, "rb"),
+                                                                               read_across_frames=True,
+                                                                               closefd=True), offsets)
+    return LlvmReader(file, offsets)
+
+
+# get the offsets at which each of the lines start, the final offset will be the end of the data,
+# so that line i will always be located at data[offsets[i]:offsets[i + 1]]
+def get_line_offsets(data):
+    offsets = array("Q", [0])
+
+    size = len(data)
+    position = data.find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = data.find(b"\n", position + 1)
+
+    # register the final line, in case the data does not end with a newline
+    if offsets[-1] != size:
+        offsets.append(size)
+
+    return offsets
+
+
+# get the offsets of the lines within the data, along with the indices of the lines that start with one of the given
+# bytes, the data is processed in chunks, so that the temporary arrays stay small
+# NumPy is only imported once the lines are classified, as it takes a while to import
+def classify_lines(data, first_bytes, offsets=None):
+    import numpy
+
+    size = len(data)
+    buffer = numpy.frombuffer(data, dtype=numpy.uint8) if size else numpy.zeros(0, dtype=numpy.uint8)
+
+    if offsets is None:
+        starts = [numpy.zeros(1, dtype=numpy.int64)]
+        for position in range(0, size, CLASSIFY_SIZE):
+            chunk = buffer[position:position + CLASSIFY_SIZE]
+            starts.append(numpy.flatnonzero(chunk == 10) + (position + 1))
+        line_offsets = numpy.concatenate(starts)
+
+        # register the final line, in case the data does not end with a newline
+        if line_offsets[-1] != size:
+            line_offsets = numpy.append(line_offsets, size)
+
+        offsets = array("Q")
+        offsets.frombytes(line_offsets.astype(numpy.uint64).tobytes())
+    else:
+        line_offsets = numpy.frombuffer(offsets, dtype=numpy.uint64).astype(numpy.int64)
+
+    selection = numpy.zeros(256, dtype=bool)
+    selection[list(first_bytes)] = True
+    selected = numpy.flatnonzero(selection[buffer[line_offsets[:-1]]]).tolist()
+
+    # the memory mapped data can only be closed once no array refers to it anymore
+    del buffer
+    return offsets, selected
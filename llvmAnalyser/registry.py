@@ -0,0 +1,78 @@
+from importlib import import_module
+import sys
+
+# The registry maps every instruction onto the module that analyzes it. The modules are only imported once the
+# instruction is encountered for the first time, so that the instructions that do not occur within the llvm file do
+# not add to the startup time.
+
+# map every instruction onto the module and the name of the function that analyzes the instruction
+analyzers = {
+    "ret": ("llvmAnalyser.terminator.ret", "analyze_ret"),
+    "br": ("llvmAnalyser.terminator.br", "analyze_br"),
+    "switch": ("llvmAnalyser.terminator.switch", "analyze_switch"),
+    "indirectbr": ("llvmAnalyser.terminator.indirectbr", "analyze_inidrectbr"),
+    "invoke": ("llvmAnalyser.terminator.invoke", "analyze_invoke"),
+    "callbr": ("llvmAnalyser.terminator.callbr", "analyze_callbr"),
+    "resume": ("llvmAnalyser.terminator.resume", "analyze_resume"),
+    "fneg": ("llvmAnalyser.unary.fneg", "analyze_fneg"),
+    "binary": ("llvmAnalyser.binary.binaryOp", "BinaryOpAnalyzer"),
+    "bitwise_binary": ("llvmAnalyser.bitwiseBinary.bitwiseBinary", "analyze_bitwise_binary"),
+    "extractelement": ("llvmAnalyser.vector.extractelement", "analyze_extractelement"),
+    "insertelement": ("llvmAnalyser.vector.insertelement", "analyze_insertelement"),
+    "shufflevector": ("llvmAnalyser.vector.shufflevector", "analyze_shufflevector"),
+    "extractvalue": ("llvmAnalyser.aggregate.extractvalue", "analyze_extractvalue"),
+    "insertvalue": ("llvmAnalyser.aggregate.insertvalue", "analyze_insertvalue"),
+    "load": ("llvmAnalyser.memoryAccess.load", "analyze_load"),
+    "store": ("llvmAnalyser.memoryAccess.store", "analyze_store"),
+    "cmpxchg": ("llvmAnalyser.memoryAccess.cmpxchg", "analyze_cmpxchg"),
+    "atomicrmw": ("llvmAnalyser.memoryAccess.atomicrmw", "analyze_atomicrmw"),
+    "getelementptr": ("llvmAnalyser.memoryAccess.getelementptr", "analyze_getelementptr"),
+    "conversion": ("llvmAnalyser.conversion.conversion", "analyze_conversion"),
+    "cmp": ("llvmAnalyser.other.cmp", "analyze_cmp"),
+    "phi": ("llvmAnalyser.other.phi", "analyze_phi"),
+    "select": ("llvmAnalyser.other.select", "analyze_select"),
+    "freeze": ("llvmAnalyser.other.freeze", "analyze_freeze"),
+    "call": ("llvmAnalyser.other.call", "analyze_call")
+}
+
+# map the statements that are inspected by the analyser onto the module in which they are defined
+statements = {
+    "Invoke": "llvmAnalyser.terminator.invoke",
+    "CallBr": "llvmAnalyser.terminator.callbr",
+    "Fneg": "llvmAnalyser.unary.fneg",
+    "BinOp": "llvmAnalyser.binary.binaryOp",
+    "ExtractElement": "llvmAnalyser.vector.extractelement",
+    "InsertElement": "llvmAnalyser.vector.insertelement",
+    "Shufflevector": "llvmAnalyser.vector.shufflevector",
+    "Load": "llvmAnalyser.memoryAccess.load",
+    "Store": "llvmAnalyser.memoryAccess.store",
+    "Getelementptr": "llvmAnalyser.memoryAccess.getelementptr",
+    "Conversion": "llvmAnalyser.conversion.conversion",
+    "Call": "llvmAnalyser.other.call"
+}
+
+loaded_analyzers = dict()
+loaded_statements = dict()
+
+
+def get_analyzer(instruction):
+    if instruction not in loaded_analyzers:
+        module_name, analyzer_name = analyzers[instruction]
+        loaded_analyzers[instruction] = getattr(import_module(module_name), analyzer_name)
+    return loaded_analyzers[instruction]
+
+
+# check whether or not the statement is one of the given statements
+# a statement can only be an instance of a class whose module was imported, so the modules that were not imported yet
+# do not need to be imported to check this
+def is_statement(statement, *statement_names):
+    for statement_name in statement_names:
+        if statement_name not in loaded_statements:
+            module = sys.modules.get(statements[statement_name])
+            if module is None:
+                continue
+            loaded_statements[statement_name] = getattr(module, statement_name)
+
+        if isinstance(statement, loaded_statements[statement_name]):
+            return True
+    return False
@@ -0,0 +1,26 @@
+# The symbol table interns the names that are used throughout the analysis: function names, registers and types. Every
+# distinct name is stored once, so that the statements, the parameters and the dictionaries of the analyser all refer
+# to the same string object, rather than each holding a copy of it. Lookups of an interned name within a dictionary
+# only need to compare the identity of the string.
+#
+# Every analyser owns a symbol table, which it passes along to the parts that intern names, so that the names are only
+# kept alive for as long as the analysis that uses them.
+
+
+class SymbolTable:
+    def __init__(self):
+        self.names = dict()
+
+    # get the interned version of the name, the name is registered in case it was not encountered before
+    def intern(self, name):
+        if name is None:
+            return None
+        return self.names.setdefault(name, name)
+
+    # intern the keys, as well as the names that are stored as values, of a table of the analyser
+    def intern_table(self, table):
+        return {self.intern(key): self.intern(value) if isinstance(value, str) else value
+                for key, value in table.items()}
+
+    def __len__(self):
+        return len(self.names)
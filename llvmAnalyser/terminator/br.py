@@ -1,39 +1,43 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # analyzer for the br commands that can either be of the form
 # br i1 <cond>, label <iftrue>, label <iffalse>
 # br label <dest>          ; Unconditional branch
+# the br command is read from the typed tokens of the lexer
 
 
 def analyze_br(tokens: list):
+    tokens = as_cursor(tokens)
+
     br = Br()
 
     # pop the br command
-    tokens.pop(0)
+    tokens.advance()
 
-    if tokens[0] == "label":
-        br.set_label_1(tokens[1])
+    if tokens.peek() == "label":
+        br.set_label_1(tokens.peek(1))
         return br
 
     # pop the i1 type specifier
-    tokens.pop(0)
+    tokens.advance()
 
     # copy the condition to the br object
-    br.set_condition(tokens[0])
-    tokens.pop(0)
+    br.set_condition(tokens.advance())
 
-    # read the iftrue label
-    tokens.pop(0)
-    br.set_label_1(tokens[0].replace(",", ""))
-    tokens.pop(0)
+    # read the iftrue label, which follows the comma and the label keyword
+    tokens.skip(2)
+    br.set_label_1(tokens.advance())
 
     # read the iffalse label
-    tokens.pop(0)
-    br.set_label_2(tokens[0])
+    tokens.skip(2)
+    br.set_label_2(tokens.advance())
 
     return br
 
 
 class Br(LlvmStatement):
+    __slots__ = ("condition", "label1", "label2")
+
     def __init__(self):
         super().__init__()
         self.condition = None
@@ -1,10 +1,11 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.llvmChecker import is_calling_convention, is_parameter_attribute, is_address_space, \
-    is_function_attribute, is_group_attribute
+    is_function_attribute, is_group_attribute, read_attribute
 from llvmAnalyser.function import Parameter as Argument
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.conversion.conversion import analyze_conversion
+from llvmAnalyser.cursor import as_cursor
 
 
 # analyzer for the callbr command that will be of the form given below
@@ -14,53 +15,51 @@ from llvmAnalyser.conversion.conversion import analyze_conversion
 
 
 def analyze_callbr(tokens: list):
+    tokens = as_cursor(tokens)
+
     br = CallBr()
 
     # pop the potential assignment
-    while tokens[0] != "callbr":
-        tokens.pop(0)
+    while tokens.peek() != "callbr":
+        tokens.advance()
 
     # pop the callbr command
-    tokens.pop(0)
+    tokens.advance()
 
     # pop the calling convention
-    if is_calling_convention(tokens[0]):
-        tokens.pop(0)
+    if is_calling_convention(tokens.peek()):
+        tokens.advance()
 
     # pop the parameter attributes
-    while is_parameter_attribute(tokens[0]):
-        open_brackets = tokens[0].count("(") - tokens[0].count(")")
-        tokens.pop(0)
-        while open_brackets != 0:
-            open_brackets += tokens[0].count("(") - tokens[0].count(")")
-            tokens.pop(0)
+    while is_parameter_attribute(tokens.peek()):
+        read_attribute(tokens)
 
     # pop the address space
-    if is_address_space(tokens[0]):
-        tokens.pop(0)
+    if is_address_space(tokens.peek()):
+        tokens.advance()
 
     # get the return type
     ret_type, tokens = get_type(tokens)
     br.set_return_type(ret_type)
 
     # skip potential redundant tokens
-    while tokens[0].count("(") == 0 and "bitcast" not in tokens[0]:
-        tokens.pop(0)
+    while tokens.peek().count("(") == 0 and "bitcast" not in tokens.peek():
+        tokens.advance()
 
     # get the function name
-    if "bitcast" in tokens[0]:
+    if "bitcast" in tokens.peek():
         conversion = analyze_conversion(tokens)
         br.set_function(conversion.get_value())
     else:
-        temp = tokens[0].split("(", 1)
+        temp = tokens.peek().split("(", 1)
         br.set_function(temp[0])
-        tokens[0] = temp[1]
+        tokens.replace(temp[1])
 
     # read the argument list
     while tokens and \
-            not is_group_attribute(tokens[0]) and \
-            not is_function_attribute(tokens[0]) and \
-            ("(" in tokens[0] or ")" not in tokens[0]):
+            not is_group_attribute(tokens.peek()) and \
+            not is_function_attribute(tokens.peek()) and \
+            ("(" in tokens.peek() or ")" not in tokens.peek()):
         argument = Argument()
 
         # read argument type
@@ -68,12 +67,8 @@ def analyze_callbr(tokens: list):
         argument.set_parameter_type(parameter_type)
 
         # read potential parameter attributes
-        while is_parameter_attribute(tokens[0]):
-            open_brackets = tokens[0].count("(") - tokens[0].count(")")
-            attribute = tokens.pop(0)
-            while open_brackets != 0 or attribute == "align":
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += tokens.pop(0)
+        while is_parameter_attribute(tokens.peek()):
+            attribute = read_attribute(tokens)
             argument.add_parameter_attribute(attribute)
 
         # read register
@@ -83,30 +78,32 @@ def analyze_callbr(tokens: list):
         br.add_function_argument(argument)
 
     # pop potential function attributes
-    while is_function_attribute(tokens[0]):
-        tokens.pop(0)
+    while is_function_attribute(tokens.peek()):
+        tokens.advance()
 
     # pop operand bundles
-    while tokens[0] != "to":
-        tokens.pop(0)
+    while tokens.peek() != "to":
+        tokens.advance()
 
-    tokens.pop(0)
-    tokens.pop(0)
+    tokens.advance()
+    tokens.advance()
 
     # pop the fallthrough label
-    br.set_fallthrough_label(tokens.pop(0))
+    br.set_fallthrough_label(tokens.advance())
 
     while tokens:
         # pop the label token
-        tokens.pop(0)
+        tokens.advance()
 
         # pop the label specification
-        br.add_indirect_label(tokens.pop(0).replace("]", ""))
+        br.add_indirect_label(tokens.advance().replace("]", ""))
 
     return br
 
 
 class CallBr(LlvmStatement):
+    __slots__ = ("return_type", "function_name", "function_arguments", "fallthrough_label", "indirect_labels")
+
     def __init__(self):
         super().__init__()
         self.return_type = None
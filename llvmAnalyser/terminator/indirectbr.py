@@ -1,34 +1,38 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
-from llvmAnalyser.types import get_type
+from llvmAnalyser.cursor import as_cursor
 # analyzer for the indirectbr command that will be of the form given below
 # the address argument given is the address of the label to jump to
 # indirectbr <somety>* <address>, [ label <dest1>, label <dest2> ]
+# the indirectbr command is read from the typed tokens of the lexer
 
 
 def analyze_inidrectbr(tokens: list):
+    tokens = as_cursor(tokens)
+
     br = IndirectBr()
 
     # pop the br command
-    tokens.pop(0)
-
-    _, tokens = get_type(tokens)
+    tokens.advance()
 
-    # pop the address specifier
-    br.set_address(tokens.pop(0).replace(",", ""))
+    # pop the type of the address, this is a pointer type, which ends at the address that precedes the list of labels
+    while tokens.peek(2) != "[":
+        tokens.advance()
 
-    tokens.pop(0)
-    # pop the labels
-    while tokens[0] != "]":
-        # pop the label token
-        tokens.pop(0)
+    # pop the address specifier, along with the comma and the opening bracket
+    br.set_address(tokens.advance())
+    tokens.skip(2)
 
-        # get the destination
-        br.add_label(tokens.pop(0).replace(",", ""))
+    # pop the labels, every destination is preceded by the label keyword
+    while tokens.peek() != "]":
+        if tokens.advance() == "label":
+            br.add_label(tokens.advance())
 
     return br
 
 
 class IndirectBr(LlvmStatement):
+    __slots__ = ("address", "labels")
+
     def __init__(self):
         super().__init__()
         self.address = None
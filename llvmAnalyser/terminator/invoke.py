@@ -1,9 +1,10 @@
 from llvmAnalyser.llvmChecker import *
 from llvmAnalyser.llvmStatement import LlvmStatement
-from llvmAnalyser.function import Parameter as Argument
+from llvmAnalyser.function import Parameter as Argument, get_nr_of_tokens_past_last_bracket
 from llvmAnalyser.conversion.conversion import analyze_conversion
 from llvmAnalyser.values import get_value
 from llvmAnalyser.types import get_type
+from llvmAnalyser.cursor import as_cursor
 
 
 # The ‘invoke’ instruction causes control to transfer to a specified function,
@@ -24,55 +25,53 @@ from llvmAnalyser.types import get_type
 
 
 def analyze_invoke(tokens):
+    tokens = as_cursor(tokens)
+
     invoke = Invoke()
 
     # pop potential assignment
-    while tokens[0] != "invoke":
-        tokens.pop(0)
+    while tokens.peek() != "invoke":
+        tokens.advance()
 
-    tokens.pop(0)
+    tokens.advance()
 
     # pop calling convention
-    if is_calling_convention(tokens[0]):
-        attr = tokens.pop(0)
+    if is_calling_convention(tokens.peek()):
+        attr = tokens.advance()
         if attr == "cc":
-            attr += " {}".format(tokens.pop(0))
+            attr += " {}".format(tokens.advance())
         invoke.set_calling_conv(attr)
     else:
         invoke.set_calling_conv("ccc")
 
     # check if there are parameter attributes
-    while is_parameter_attribute(tokens[0]):
-        open_brackets = tokens[0].count("(") - tokens[0].count(")")
-        attr = tokens.pop(0)
-        while open_brackets != 0:
-            open_brackets += tokens[0].count("(") - tokens[0].count(")")
-            attr += " {}".format(tokens.pop(0))
+    while is_parameter_attribute(tokens.peek()):
+        attr = read_attribute(tokens)
         invoke.add_ret_attr(attr)
 
     # pop optional address space field
-    if is_address_space(tokens[0]):
-        tokens.pop(0)
+    if is_address_space(tokens.peek()):
+        tokens.advance()
 
     # pop return type
     return_type, tokens = get_type(tokens)
     invoke.set_return_type(return_type)
 
     # get the function name
-    if "bitcast" in tokens[0]:
+    if "bitcast" in tokens.peek():
         conversion = analyze_conversion(tokens)
         invoke.set_func(conversion.get_value())
-        if tokens[0][0] == "(":
-            tokens[0] = tokens[0][1:]
+        if tokens.peek()[0] == "(":
+            tokens.replace(tokens.peek()[1:])
     else:
-        temp = tokens[0].split("(", 1)
-        tokens[0] = temp[1]
+        temp = tokens.peek().split("(", 1)
+        tokens.replace(temp[1])
 
         invoke.set_func(temp[0])
 
     while tokens:
-        if tokens[0] == ")":
-            tokens.pop(0)
+        if tokens.peek() == ")":
+            tokens.advance()
             break
 
         count = 0
@@ -88,12 +87,8 @@ def analyze_invoke(tokens):
         argument.set_parameter_type(parameter_type)
 
         # read potential parameter attributes
-        while is_parameter_attribute(tokens[0]):
-            open_brackets = tokens[0].count("(") - tokens[0].count(")")
-            attribute = tokens.pop(0)
-            while open_brackets != 0 or attribute == "align":
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += " {}".format(tokens.pop(0))
+        while is_parameter_attribute(tokens.peek()):
+            attribute = read_attribute(tokens)
             argument.add_parameter_attribute(attribute)
 
         # read register
@@ -103,45 +98,38 @@ def analyze_invoke(tokens):
         invoke.add_argument(argument)
 
     # read function attributes
-    if tokens and is_group_attribute(tokens[0]):
-        invoke.add_fn_attr(tokens[0])
-        tokens.pop(0)
-    while tokens and is_function_attribute(tokens[0]):
-        if "allocsize" in tokens[0]:
-            attribute = tokens.pop(0)
-            open_brackets = attribute.count("(") - attribute.count(")")
-            while open_brackets != 0:
-                open_brackets += tokens[0].count("(") - tokens[0].count(")")
-                attribute += " {}".format(tokens.pop(0))
-            invoke.add_fn_attr(attribute)
-        else:
-            invoke.add_fn_attr(tokens.pop(0))
+    if tokens and is_group_attribute(tokens.peek()):
+        invoke.add_fn_attr(tokens.advance())
+    while tokens and is_function_attribute(tokens.peek()):
+        invoke.add_fn_attr(read_attribute(tokens))
 
     # analyze operand bundle sets
-    if tokens and "[" in tokens[0]:
+    if tokens and "[" in tokens.peek():
         operand_bundle_set = OperandBundleSet()
-        tokens.pop(0)
+        tokens.advance()
 
         # analyze operand bundles
-        while tokens[0] != "]":
+        while tokens.peek() != "]":
             operand_bundle = OperandBundle()
 
             # get the operand bundle tag
-            quote_count = tokens[0].count("\"")
-            tag = tokens.pop(0)
+            quote_count = tokens.peek().count("\"")
+            tag = tokens.advance()
             while quote_count < 2:
-                tag += " {}".format(tokens.pop(0))
+                tag += " {}".format(tokens.advance())
                 quote_count = tag.count("\"")
 
             temp = tag.split('"', 2)
             operand_bundle.set_tag("\"{}\"".format(temp[1]))
-            tokens.insert(0, temp[-1])
+            tokens.push(temp[-1])
 
+            # the operands of the bundle are enclosed by the bracket that follows the tag
+            tokens.replace(tokens.peek()[1:])
             desired_remaining_token_length = get_nr_of_tokens_past_last_bracket(tokens)
 
-            if tokens[0][0] == ")":
+            if tokens.peek()[0] == ")":
                 operand_bundle_set.add_operand_bundle(operand_bundle)
-                tokens.pop(0)
+                tokens.advance()
                 continue
 
             # analyze operands
@@ -161,43 +149,29 @@ def analyze_invoke(tokens):
         invoke.set_operand_bundle_set(operand_bundle_set)
 
         # pop the ] token
-        tokens.pop(0)
+        tokens.advance()
 
     # skip to the normal label
-    tokens.pop(0)
+    tokens.advance()
 
     # pop label tag
-    tokens.pop(0)
+    tokens.advance()
 
-    invoke.set_normal(tokens[0].split("(")[0])
-    tokens.pop(0)
+    invoke.set_normal(tokens.peek().split("(")[0])
+    tokens.advance()
 
     # pop "unwind label"
-    tokens.pop(0)
-    tokens.pop(0)
-    invoke.set_exception(tokens[0].split("(")[0])
+    tokens.advance()
+    tokens.advance()
+    invoke.set_exception(tokens.peek().split("(")[0])
 
     return invoke
 
 
-def get_nr_of_tokens_past_last_bracket(tokens):
-    tokens[0] = tokens[0][1:]
-
-    open_brackets = 1
-
-    # loop over the tokens until this first bracket is closed again, when this happens, return the index
-    for i in range(len(tokens)):
-        for j in range(len(tokens[i])):
-            char = tokens[i][j]
-            if char == "(":
-                open_brackets += 1
-            elif char == ")":
-                open_brackets -= 1
-            if open_brackets == 0:
-                return len(tokens) - i
-
-
 class Invoke(LlvmStatement):
+    __slots__ = ("func", "normal", "exception", "arguments", "fn_attrs", "operand_bundle_set", "cconv", "ret_attrs",
+                 "return_type")
+
     def __init__(self):
         super().__init__()
         self.func = None
@@ -291,6 +265,8 @@ class Invoke(LlvmStatement):
 
 
 class OperandBundleSet:
+    __slots__ = ("operand_bundles",)
+
     def __init__(self):
         self.operand_bundles = list()
 
@@ -302,6 +278,8 @@ class OperandBundleSet:
 
 
 class OperandBundle:
+    __slots__ = ("tag", "operands")
+
     def __init__(self):
         self.tag = None
         self.operands = list()
@@ -320,6 +298,8 @@ class OperandBundle:
 
 
 class Operand:
+    __slots__ = ("operand_type", "operand_value")
+
     def __init__(self):
         self.operand_type = None
         self.operand_value = None
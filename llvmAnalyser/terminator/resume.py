@@ -1,16 +1,19 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # The ‘resume’ instruction is a terminator instruction that has no successors.
 #
 # resume <type> <value>
 
 
 def analyze_resume(tokens):
+    tokens = as_cursor(tokens)
+
     resume = Resume()
 
     # pop the resume instruction
-    tokens.pop(0)
+    tokens.advance()
 
     # get the ex type
     ex_type, tokens = get_type(tokens)
@@ -24,6 +27,8 @@ def analyze_resume(tokens):
 
 
 class Resume(LlvmStatement):
+    __slots__ = ("ex_type", "value")
+
     def __init__(self):
         super().__init__()
         self.ex_type = None
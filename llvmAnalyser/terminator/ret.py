@@ -1,6 +1,7 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 # The ‘ret’ instruction is used to return control flow (and optionally a value) from a function back to the caller.
 #
 # There are two forms of the ‘ret’ instruction:
@@ -12,10 +13,12 @@ from llvmAnalyser.values import get_value
 
 
 def analyze_ret(tokens: list):
+    tokens = as_cursor(tokens)
+
     ret = Ret()
 
     # pop the return command
-    tokens.pop(0)
+    tokens.advance()
 
     # get the return type
     ret_type, tokens = get_type(tokens)
@@ -29,6 +32,8 @@ def analyze_ret(tokens: list):
 
 
 class Ret(LlvmStatement):
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.value = None
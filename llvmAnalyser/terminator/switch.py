@@ -1,50 +1,55 @@
-from llvmAnalyser.types import get_type
+from array import array
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 # The ‘switch’ instruction is used to transfer control flow to one of several different places.
 # It is a generalization of the ‘br’ instruction, allowing a branch to occur to one of many possible destinations.
 # switch <intty> <value>, label <defaultdest> [ <intty> <val>, label <dest> ... ]
+#
+# Switches with thousands of cases are common in generated code (e.g. parsers and state machines). Rather than an object
+# per case, the switch stores the case values in a compact array, along with the index of their destination within the
+# distinct destinations of the switch. The switch is read from the typed tokens of the lexer, the type of the condition
+# and of the cases is an integer type, which is a single token, so every case is read as the same sequence of tokens.
 
 
 def analyze_switch(tokens):
-    switch = Switch()
+    tokens = as_cursor(tokens)
 
-    # pop the switch label
-    tokens.pop(0)
+    switch = Switch()
 
-    # pop the condition
-    _, tokens = get_type(tokens)
-    tokens.pop(0)
+    # pop the switch label, along with the type of the condition, the condition and the comma that follows it
+    tokens.skip(4)
 
     # get the default label
-    tokens.pop(0)
-    switch.set_default(tokens[0])
-    tokens.pop(0)
-
-    tokens.pop(0)
-
-    while tokens[0] != "]":
-        branch = Branch()
+    tokens.advance()
+    switch.set_default(tokens.advance())
 
-        # pop the compared value
-        _, tokens = get_type(tokens)
-        branch.set_condition(tokens[0].replace(",", ""))
-        tokens.pop(0)
+    # pop the opening bracket
+    tokens.advance()
 
-        # get the corresponding label
-        tokens.pop(0)
-        branch.set_destination(tokens[0])
-        tokens.pop(0)
+    while tokens.peek() != "]":
+        # pop the type, followed by the compared value
+        tokens.advance()
+        value = tokens.advance()
 
-        switch.add_branch(branch)
+        # get the corresponding label, which follows the comma and the label keyword
+        tokens.skip(2)
+        switch.add_case(value, tokens.advance())
 
     return switch
 
 
 class Switch(LlvmStatement):
+    __slots__ = ("default", "values", "destination_indices", "destinations", "destination_map")
+
     def __init__(self):
         super().__init__()
         self.default = None
-        self.branches = list()
+
+        # the values of the cases are stored as integers, unless one of them does not fit in 64 bits (or is a boolean)
+        self.values = array("q")
+        self.destination_indices = array("I")
+        self.destinations = list()
+        self.destination_map = dict()
 
     def set_default(self, default):
         self.default = default
@@ -52,38 +57,42 @@ class Switch(LlvmStatement):
     def get_default(self):
         return self.default
 
-    def add_branch(self, branch):
-        self.branches.append(branch)
-
-    def get_branches(self):
-        return self.branches
+    def add_case(self, value, destination):
+        index = self.destination_map.get(destination)
+        if index is None:
+            index = len(self.destinations)
+            self.destination_map[destination] = index
+            self.destinations.append(destination)
+        self.destination_indices.append(index)
+
+        if isinstance(self.values, array):
+            try:
+                self.values.append(int(value))
+                return
+            except (ValueError, OverflowError):
+                self.values = [str(case_value) for case_value in self.values]
+        self.values.append(value)
+
+    # get the value and the destination of every case, in the order in which the cases are specified
+    def get_cases(self):
+        return [(str(value), self.destinations[index]) for value, index in zip(self.values, self.destination_indices)]
+
+    def get_destinations(self):
+        return self.destinations
+
+    # get the values of the cases that lead to the destination
+    def get_values(self, destination):
+        index = self.destination_map[destination]
+        return [str(value) for value, case_index in zip(self.values, self.destination_indices) if case_index == index]
+
+    def __len__(self):
+        return len(self.values)
 
     def get_used_variables(self):
         return list()
 
     def __str__(self):
         output = "switch def: {}\n".format(self.default)
-        for branch in self.branches:
-            output += "{}\n".format(branch)
+        for value, destination in self.get_cases():
+            output += "\tif = {}, goto {}\n".format(value, destination)
         return output
-
-
-class Branch:
-    def __init__(self):
-        self.conditional_value = None
-        self.destination_block = None
-
-    def set_condition(self, condition):
-        self.conditional_value = condition
-
-    def set_destination(self, destination):
-        self.destination_block = destination
-
-    def get_condition(self):
-        return self.conditional_value
-
-    def get_destination(self):
-        return self.destination_block
-
-    def __str__(self):
-        return "\tif = {}, goto {}".format(self.conditional_value, self.destination_block)
@@ -1,25 +1,116 @@
 import re
+from llvmAnalyser.cursor import as_cursor
 
 vector = re.compile(r'<(vscale x )?[0-9]* x (?:i[1-9][0-9]*|half|bfloat|float|double|fp128|x86_FP80|ppc_fp128|.*\*)>')
 
 
+# The same types are specified over and over within a module, e.g. the long mangled struct types of c++ templates. The
+# type cache remembers the types that were parsed, keyed on the tokens that the type consisted of, so that a type that
+# was encountered before is not parsed again.
+#
+# Whether or not the parsing of a type consumes a token is decided by the token itself and the token that follows it,
+# the lookahead. The lookahead is part of the key, but only the features of it that are inspected by the parser, such
+# that e.g. the type of a call is shared by all the functions that are called, rather than stored once per function.
+class TypeCache:
+    def __init__(self, max_size=65536):
+        self.max_size = max_size
+        self.types = dict()
+        self.size = 0
+
+    # get the type at the start of the tokens in case it was parsed before, the tokens of the type are consumed
+    def lookup(self, tokens):
+        counts = self.types.get(tokens.peek())
+        if counts is not None:
+            for count, types in counts.items():
+                if count > len(tokens):
+                    continue
+                specified_type = types.get((tokens.get_slice(count), get_lookahead(tokens, count)))
+                if specified_type is not None:
+                    tokens.skip(count)
+                    return specified_type
+
+        return None
+
+    # remember the type that was parsed from the given number of tokens, which have just been consumed
+    def store(self, tokens, count, specified_type):
+        if self.size >= self.max_size:
+            self.clear()
+
+        consumed = tokens.get_slice(count, -count)
+        types = self.types.setdefault(consumed[0], dict()).setdefault(count, dict())
+        types[(consumed, get_lookahead(tokens, 0))] = specified_type
+        self.size += 1
+        return specified_type
+
+    def clear(self):
+        self.types = dict()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+
+# a variadic function type (e.g. i32 (...)*) is recognized based on the number of remaining tokens, these types are
+# parsed every time
+def is_cacheable(tokens):
+    return len(tokens) > 0 and (len(tokens) < 2 or tokens.peek(1)[:5] != "(...)")
+
+
+# get the features of the token at the given offset, that are inspected when the type in front of it is parsed
+def get_lookahead(tokens, offset):
+    if offset >= len(tokens):
+        return None
+
+    token = tokens.peek(offset)
+    if "*" in token:
+        return token
+    if "(" not in token:
+        return ""
+    if token.split("(")[0] not in {"", "*"}:
+        return "("
+    return token
+
+
+# the type cache of the module that is being analysed, the analyser clears it once it starts analysing a module
+type_cache = TypeCache()
+
+
 # this function takes a chain of tokens of which the type has to start in the first token
 # it will return the entire type that is specified along with the remaining tokens
 def get_type(tokens):
-    if "\"" in tokens[0]:
+    tokens = as_cursor(tokens)
+
+    if not is_cacheable(tokens):
+        return parse_type(tokens)
+
+    specified_type = type_cache.lookup(tokens)
+    if specified_type is not None:
+        return specified_type, tokens
+
+    start = tokens.get_position()
+    specified_type, tokens = parse_type(tokens)
+    specified_type = type_cache.store(tokens, tokens.get_position() - start, specified_type)
+    return specified_type, tokens
+
+
+# parse the type at the start of the tokens
+def parse_type(tokens):
+    tokens = as_cursor(tokens)
+
+    if "\"" in tokens.peek():
         return get_string_type(tokens)
 
-    if tokens[0][0] == "{" or tokens[0][1] == "{":
+    if tokens.peek()[0] == "{" or tokens.peek()[1] == "{":
         return get_struct_type(tokens)
 
-    if tokens[0][0] == "<":
+    if tokens.peek()[0] == "<":
         return get_vector_type(tokens)
 
-    if tokens[0][0] == "[":
+    if tokens.peek()[0] == "[":
         return get_array_type(tokens)
 
-    specified_type = tokens[0]
-    tokens.pop(0)
+    specified_type = tokens.peek()
+    tokens.advance()
 
     # register end of type
     if specified_type[-1] == "," and specified_type.count("(") == specified_type.count(")"):
@@ -30,7 +121,7 @@ def get_type(tokens):
         specified_type = specified_type[:-1]
         return specified_type, tokens
 
-    if len(tokens) >= 5 and tokens[0][:5] == "(...)":
+    if len(tokens) >= 5 and tokens.peek()[:5] == "(...)":
         return specified_type, tokens
 
     return check_for_templated_parts(specified_type, tokens)
@@ -38,22 +129,23 @@ def get_type(tokens):
 
 # check if the type that is discovered at this point is the return type of a function type
 def check_for_function_type(specified_type, tokens):
-    if (len(tokens) == 0 or "(" not in tokens[0]) and specified_type.count("(") == specified_type.count(")"):
+    tokens = as_cursor(tokens)
+
+    if (len(tokens) == 0 or "(" not in tokens.peek()) and specified_type.count("(") == specified_type.count(")"):
         if specified_type[-1] == ",":
             specified_type = specified_type[:-1]
         return specified_type, tokens
 
-    if tokens[0].split("(")[0] not in {"", "*"} and tokens[0].count("(") != 0:
+    if tokens.peek().split("(")[0] not in {"", "*"} and tokens.peek().count("(") != 0:
         if specified_type[-1] == ",":
             specified_type = specified_type[:-1]
         return specified_type, tokens
 
     open_counter = specified_type.count("(") - specified_type.count(")")
     while True:
-        open_counter += tokens[0].count("(")
-        open_counter -= tokens[0].count(")")
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        open_counter += tokens.peek().count("(")
+        open_counter -= tokens.peek().count(")")
+        specified_type += " {}".format(tokens.advance())
         if open_counter <= 0:
             if specified_type[-1] == ",":
                 specified_type = specified_type[:-1]
@@ -64,24 +156,28 @@ def check_for_function_type(specified_type, tokens):
 
 # check if the type that is discovered at this point is a pointer to said type
 def check_for_pointer_type(specified_type, tokens):
+    tokens = as_cursor(tokens)
+
     if len(tokens) == 0:
         if specified_type[-1] == ",":
             specified_type = specified_type[:-1]
         return specified_type, tokens
-    if "*" not in tokens[0] or ("(" in tokens[0] and tokens[0].count("(") != tokens[0].count(")")):
+    if "*" not in tokens.peek() or ("(" in tokens.peek() and tokens.peek().count("(") != tokens.peek().count(")")):
         return check_for_function_type(specified_type, tokens)
 
-    elif tokens[0].count("(") == tokens[0].count(")") and "*" not in tokens[0].rsplit(")", 1)[-1]:
+    elif tokens.peek().count("(") == tokens.peek().count(")") and "*" not in tokens.peek().rsplit(")", 1)[-1]:
         return check_for_function_type(specified_type, tokens)
 
-    temp_tokens = tokens[0].rsplit("*", 1)
-    tokens.pop(0)
+    temp_tokens = tokens.peek().rsplit("*", 1)
+    tokens.advance()
 
     specified_type += " {}*".format(temp_tokens[0])
     return check_for_function_type(specified_type, tokens)
 
 
 def check_for_templated_parts(specified_type, tokens):
+    tokens = as_cursor(tokens)
+
     if len(tokens) == 0:
         if specified_type[-1] == ",":
             specified_type = specified_type[:-1]
@@ -89,70 +185,73 @@ def check_for_templated_parts(specified_type, tokens):
 
     open_counter = specified_type.count("<") - specified_type.count(">")
     while open_counter != 0:
-        open_counter += tokens[0].count("<")
-        open_counter -= tokens[0].count(">")
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        open_counter += tokens.peek().count("<")
+        open_counter -= tokens.peek().count(">")
+        specified_type += " {}".format(tokens.advance())
 
     return check_for_pointer_type(specified_type, tokens)
 
 
 # check if the base type is a vector type
 def get_vector_type(tokens):
-    if "<" not in tokens[0] or "{" in tokens[0]:
+    tokens = as_cursor(tokens)
+
+    if "<" not in tokens.peek() or "{" in tokens.peek():
         return None
 
-    specified_type = tokens[0]
-    tokens.pop(0)
+    specified_type = tokens.peek()
+    tokens.advance()
     while True:
         if vector.match(specified_type):
             return check_for_pointer_type(specified_type, tokens)
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        specified_type += " {}".format(tokens.advance())
 
 
 # check if the base type is an array type
 def get_array_type(tokens):
-    if "[" not in tokens[0]:
+    tokens = as_cursor(tokens)
+
+    if "[" not in tokens.peek():
         return None
 
-    specified_type = tokens[0]
-    tokens.pop(0)
+    specified_type = tokens.peek()
+    tokens.advance()
     open_counter = 1
     while True:
-        open_counter += tokens[0].count("[")
-        open_counter -= tokens[0].count("]")
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        open_counter += tokens.peek().count("[")
+        open_counter -= tokens.peek().count("]")
+        specified_type += " {}".format(tokens.advance())
         if open_counter == 0:
             return check_for_pointer_type(specified_type, tokens)
 
 
 # check if the base type is a struct type
 def get_struct_type(tokens):
-    if "{" not in tokens[0]:
+    tokens = as_cursor(tokens)
+
+    if "{" not in tokens.peek():
         return None
 
-    specified_type = tokens[0]
-    tokens.pop(0)
+    specified_type = tokens.peek()
+    tokens.advance()
     while True:
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        specified_type += " {}".format(tokens.advance())
         if "}" in specified_type:
             return check_for_pointer_type(specified_type, tokens)
 
 
 # check if the type is a type specified in string
 def get_string_type(tokens):
-    if "\"" not in tokens[0]:
+    tokens = as_cursor(tokens)
+
+    if "\"" not in tokens.peek():
         return None
 
-    specified_type = tokens[0]
-    tokens.pop(0)
+    specified_type = tokens.peek()
+    tokens.advance()
     while True:
         if specified_type.count("\"") == 2:
             if specified_type[-1] == ")" and specified_type.count("(") + 1 == specified_type.count(")"):
                 specified_type = specified_type[:-1]
             return check_for_function_type(specified_type, tokens)
-        specified_type += " {}".format(tokens[0])
-        tokens.pop(0)
+        specified_type += " {}".format(tokens.advance())
@@ -2,23 +2,26 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.llvmChecker import is_fast_math_flag
 from llvmAnalyser.values import get_value
 from llvmAnalyser.types import get_type
+from llvmAnalyser.cursor import as_cursor
 # The ‘fneg’ instruction returns the negation of its operand.
 # <result> = fneg [fast-math flags]* <ty> <op1>   ; yields ty:result
 
 
 def analyze_fneg(tokens):
+    tokens = as_cursor(tokens)
+
     fneg = Fneg()
 
     # pop potential assignment
-    while tokens[0] != "fneg":
-        tokens.pop(0)
+    while tokens.peek() != "fneg":
+        tokens.advance()
 
     # pop the fneg command
-    tokens.pop(0)
+    tokens.advance()
 
     # pop potential fast math flags
-    while is_fast_math_flag(tokens[0]):
-        tokens.pop(0)
+    while is_fast_math_flag(tokens.peek()):
+        tokens.advance()
 
     # skip the type
     _, tokens = get_type(tokens)
@@ -31,6 +34,8 @@ def analyze_fneg(tokens):
 
 
 class Fneg(LlvmStatement):
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.value = None
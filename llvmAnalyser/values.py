@@ -1,6 +1,8 @@
 import re
+from functools import lru_cache
 from llvmAnalyser.types import get_type
 from llvmAnalyser.llvmChecker import is_fast_math_flag, is_parameter_attribute
+from llvmAnalyser.cursor import as_cursor, TokenCursor
 
 # this function accepts a chain of tokens and will return the defined value within it
 # the value needs to start on the first token
@@ -8,11 +10,83 @@ from llvmAnalyser.llvmChecker import is_fast_math_flag, is_parameter_attribute
 
 boolean = re.compile(r'^((false)|(true))(,|\)|\),)?$')
 fp = re.compile(r'^[-+]?[0-9]+[.]?[0-9]*([eE][-+]?[0-9]+)?(,|\)|\),)?$')
-fp_hex = re.compile(r'^0x[0-9a-fA-F]+(,|\)|\),)?$')
+numeric = re.compile(r'^(0x[0-9a-fA-F]+|[-+]?[0-9]+[.]?[0-9]*([eE][-+]?[0-9]+)?)(,|\)|\),)?$')
 null_none_undef = re.compile(r'^((null)|(none)|(undef))(,|\)|\),)?$')
 zeroinitializer = re.compile(r'^zeroinitializer(,|\)|\),)?$')
 global_var = re.compile(r'^@([_\.][0-9a-zA-Z]+)+(,|\)|\),)?$')
 
+# map the first character of a value onto the format of the simple constant that can start with it
+simple_constants = {"t": boolean, "f": boolean, "n": null_none_undef, "u": null_none_undef, "z": zeroinitializer,
+                    "@": global_var, "-": fp, "+": fp}
+simple_constants.update({digit: numeric for digit in "0123456789"})
+
+# the number of keywords (e.g. inbounds) that can precede the bracketed operands of a constant expression
+MAX_KEYWORDS = 2
+
+
+# The same constant expressions are used over and over within a module, e.g. the getelementptr of a string constant
+# that is passed to a function. The constant expression cache remembers the value of every constant expression that
+# was parsed, keyed on its tokens, up to the bracket that closes its operands.
+# Parsing a constant expression can split or modify the tokens it consumes, so the expression is parsed on a copy of
+# its tokens, after which the resulting tokens are spliced into the actual tokens, both when the expression is parsed
+# and when it is taken from the cache.
+class ConstantExpressionCache:
+    def __init__(self, max_size=16384):
+        self.max_size = max_size
+        self.expressions = dict()
+
+    # parse the constant expression that starts with the given keyword, which has already been consumed
+    def parse(self, parse_expression, keyword, tokens):
+        count = get_expression_length(tokens)
+        if count is None:
+            return parse_expression(keyword, tokens)
+
+        key = (keyword, tokens.get_slice(count))
+        expression = self.expressions.get(key)
+        if expression is None:
+            copy = TokenCursor(list(key[1]))
+            try:
+                value = parse_expression(keyword, copy)
+            except IndexError:
+                # the expression does not end at the bracket that closes its operands
+                return parse_expression(keyword, tokens)
+
+            if len(self.expressions) >= self.max_size:
+                self.clear()
+            expression = (value, copy.tokens, copy.get_position())
+            self.expressions[key] = expression
+
+        value, expression_tokens, consumed = expression
+        tokens.splice(count, expression_tokens, consumed)
+        return value
+
+    def clear(self):
+        self.expressions = dict()
+
+    def __len__(self):
+        return len(self.expressions)
+
+
+# the constant expression cache of the module that is being analysed, the analyser clears it once it starts analysing a
+# module
+constant_expression_cache = ConstantExpressionCache()
+
+
+# get the number of tokens of the constant expression that starts at the tokens, this consists of the keywords
+# followed by the operands within brackets, None is returned in case the operands are not within brackets
+def get_expression_length(tokens):
+    i = 0
+    while i < len(tokens) and i < MAX_KEYWORDS and tokens.peek(i).isalpha():
+        i += 1
+
+    if i == len(tokens) or tokens.peek(i)[0] != "(":
+        return None
+
+    bracket = tokens.get_matching_bracket(i)
+    if bracket is None:
+        return None
+    return bracket[0] + 1
+
 
 def remove_trailing_char(value):
     if value[-1] == ",":
@@ -23,119 +97,88 @@ def remove_trailing_char(value):
 
 
 def get_final_bracket_token(tokens):
-    tokens[0] = tokens[0][1:]
+    tokens = as_cursor(tokens)
 
-    open_brackets = 1
+    tokens.replace(tokens.peek()[1:])
 
-    # loop over the tokens until this first bracket is closed again, when this happens, return the index
-    for i in range(len(tokens)):
-        for j in range(len(tokens[i])):
-            char = tokens[i][j]
-            if char == "(":
-                open_brackets += 1
-            elif char == ")":
-                open_brackets -= 1
-            if open_brackets == 0:
-                if tokens[i][j + 1:] != "" and tokens[i][j + 1:] != ",":
-                    tokens.insert(i + 1, tokens[i][j + 1:])
-                tokens[i] = tokens[i][:j]
-                return i
+    # find the token in which this first bracket is closed again, and split it at the bracket
+    bracket = tokens.get_closing_bracket()
+    if bracket is None:
+        return None
 
+    i, j = bracket
+    token = tokens.peek(i)
+    if token[j + 1:] != "" and token[j + 1:] != ",":
+        tokens.insert(i + 1, token[j + 1:])
+    tokens.replace(token[:j], i)
+    return i
 
-def get_value(tokens):
-    value = tokens.pop(0)
 
-    # match variable argument
-    if value == "...":
-        value = remove_trailing_char(value)
-        return value, tokens
+# get the number of angle, square, curly and round brackets that are opened within the token
+@lru_cache(maxsize=4096)
+def get_open_brackets(token):
+    return (token.count("<") - token.count(">"), token.count("[") - token.count("]"),
+            token.count("{") - token.count("}"), token.count("(") - token.count(")"))
 
-    # match registers
-    if value[0] == "%":
-        value = remove_trailing_char(value)
-        return value, tokens
 
-    # match booleans
-    if boolean.match(value):
-        value = remove_trailing_char(value)
-        return value, tokens
+def get_value(tokens):
+    tokens = as_cursor(tokens)
 
-    # match numeric constants
-    if fp.match(value):
-        value = remove_trailing_char(value)
-        return value, tokens
+    value = tokens.advance()
 
-    # match hexadecimal numeric constants
-    if fp_hex.match(value):
-        value = remove_trailing_char(value)
-        return value, tokens
+    # match constant expressions
+    parse_expression = constant_expressions.get(value)
+    if parse_expression is not None:
+        return constant_expression_cache.parse(parse_expression, value, tokens), tokens
 
-    # match null and none
-    if null_none_undef.match(value):
+    # match variable argument and registers
+    if value == "..." or value[0] == "%":
         value = remove_trailing_char(value)
         return value, tokens
 
-    # match zero initialization
-    if zeroinitializer.match(value):
+    # match booleans, numeric constants, null, none, undef, zero initialization and global vars
+    simple_constant = simple_constants.get(value[0])
+    if simple_constant is not None and simple_constant.match(value):
         value = remove_trailing_char(value)
         return value, tokens
 
-    # match global var
-    if global_var.match(value):
-        value = remove_trailing_char(value)
-        return value, tokens
-
-    if value in ["trunc", "zext", "sext", "fptrunc", "fpext",
-                 "fptoui", "fptosi", "uitofp", "sitofp", "ptrtoint",
-                 "inttoptr", "bitcast", "addrspacecast"]:
-        return get_value_from_conversion(value, tokens), tokens
-
-    if value == "getelementptr":
-        return get_value_from_getelementptr(value, tokens), tokens
-
-    if value == "select":
-        return get_value_from_select(value, tokens), tokens
+    return get_construct_value(value, tokens), tokens
 
-    if value in ["icmp", "fcmp"]:
-        return get_value_from_icmp_or_fcmp(value, tokens), tokens
 
-    if value in ["extractelement", "insertelement", "shufflevector"]:
-        return get_value_from_vector_op(value, tokens), tokens
+# read construct value, the brackets are counted per token, rather than over the entire value that was read so far
+def get_construct_value(value, tokens):
+    tokens = as_cursor(tokens)
 
-    if value in ["extractvalue", "insertvalue"]:
-        return get_value_from_aggregate_op(value, tokens), tokens
-
-    if value in ["add", "fadd", "sub", "fsub",
-                 "mul", "fmul", "udiv", "sdiv",
-                 "fdiv", "urem", "srem", "frem"]:
-        return get_value_from_bianry_op(value, tokens), tokens
-
-    # read construct value
+    parts = [value]
+    angle_brackets, square_brackets, curly_brackets, round_brackets = get_open_brackets(value)
     while True:
-        angle_brackets = value.count("<") - value.count(">")
-        square_brackets = value.count("[") - value.count("]")
-        curly_brackets = value.count("{") - value.count("}")
-        round_brackets = value.count("(") - value.count(")")
-
         if angle_brackets == 0 and square_brackets == 0 and curly_brackets == 0 and \
                 ((value[-1] == ")" and round_brackets == -1) or
                  (round_brackets == 0)):
             if value[-1] == ")" and round_brackets == -1:
-                tokens.insert(0, ')')
-                value = value[:-1]
+                tokens.push(')')
+                parts[-1] = value[:-1]
             elif value[-1] == ",":
-                value = value[:-1]
+                parts[-1] = value[:-1]
 
-            return value, tokens
+            return " ".join(parts)
 
-        value += " {}".format(tokens.pop(0))
+        value = tokens.advance()
+        parts.append(value)
+        angle, square, curly, parenthesis = get_open_brackets(value)
+        angle_brackets += angle
+        square_brackets += square
+        curly_brackets += curly
+        round_brackets += parenthesis
 
 
 def get_value_from_conversion(op, tokens):
+    tokens = as_cursor(tokens)
+
     i = len(tokens)
 
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
+    if tokens.peek()[0] == "(":
         i = get_final_bracket_token(tokens)
 
         # add one, as the i indexing starts from 0
@@ -149,33 +192,35 @@ def get_value_from_conversion(op, tokens):
     op += " {}".format(value)
 
     # pop the to token
-    op += " {}".format(tokens.pop(0))
+    op += " {}".format(tokens.advance())
 
     i -= start_len - len(tokens)
 
     # get the final type
-    while i > 0 and "dereferenceable" not in tokens[0]:
-        op += " {}".format(tokens.pop(0))
+    while i > 0 and "dereferenceable" not in tokens.peek():
+        op += " {}".format(tokens.advance())
         i -= 1
 
     # pop potential remaining tokens
-    while i > 0 and "dereferenceable" in tokens[0]:
-        tokens.pop(0)
-        tokens.pop(0)
+    while i > 0 and "dereferenceable" in tokens.peek():
+        tokens.advance()
+        tokens.advance()
         i -= 2
 
     return op
 
 
 def get_value_from_getelementptr(value, tokens):
+    tokens = as_cursor(tokens)
+
     # pop a potential inbounds keyword
-    if tokens[0] == "inbounds":
-        value += " {}".format(tokens.pop(0))
+    if tokens.peek() == "inbounds":
+        value += " {}".format(tokens.advance())
 
     desired_token_length = 0
 
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
+    if tokens.peek()[0] == "(":
         desired_token_length = len(tokens) - get_final_bracket_token(tokens) - 1
 
     # get the type
@@ -192,15 +237,15 @@ def get_value_from_getelementptr(value, tokens):
 
     # access potential further indices
     while desired_token_length != len(tokens) and value[-1] == ",":
-        if tokens[0] == "inrange":
-            value += " {}".format(tokens.pop(0))
+        if tokens.peek() == "inrange":
+            value += " {}".format(tokens.advance())
 
         # get the index type
         idx_type, tokens = get_type(tokens)
         value += " {}".format(idx_type)
 
         # get the index value
-        value += " {}".format(tokens.pop(0))
+        value += " {}".format(tokens.advance())
 
     if value[-1] == ",":
         value = value[:-1]
@@ -209,13 +254,15 @@ def get_value_from_getelementptr(value, tokens):
 
 
 def get_value_from_select(value, tokens):
+    tokens = as_cursor(tokens)
+
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
-        tokens[0] = tokens[0][1:]
+    if tokens.peek()[0] == "(":
+        tokens.replace(tokens.peek()[1:])
 
     # pop the potential fast-math flags
-    while is_fast_math_flag(tokens[0]):
-        value += " {}".format(tokens.pop(0))
+    while is_fast_math_flag(tokens.peek()):
+        value += " {}".format(tokens.advance())
 
     # get the condition
     ctype, tokens = get_type(tokens)
@@ -239,11 +286,13 @@ def get_value_from_select(value, tokens):
 
 
 def get_value_from_icmp_or_fcmp(value, tokens):
+    tokens = as_cursor(tokens)
+
     # get the condition
-    value += " {}".format(tokens.pop(0))
+    value += " {}".format(tokens.advance())
 
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
+    if tokens.peek()[0] == "(":
         get_final_bracket_token(tokens)
 
     # get the type
@@ -261,11 +310,13 @@ def get_value_from_icmp_or_fcmp(value, tokens):
 
 
 def get_value_from_vector_op(value, tokens):
+    tokens = as_cursor(tokens)
+
     op_type = value
 
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
-        tokens[0] = tokens[0][1:]
+    if tokens.peek()[0] == "(":
+        tokens.replace(tokens.peek()[1:])
 
     # get the first type value pair
     vector_type, tokens = get_type(tokens)
@@ -290,12 +341,14 @@ def get_value_from_vector_op(value, tokens):
 
 
 def get_value_from_aggregate_op(value, tokens):
+    tokens = as_cursor(tokens)
+
     op_type = value
 
     desired_token_length = 0
 
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
+    if tokens.peek()[0] == "(":
         # keep track of the original length, because there is chance that an element will get split into two
         # elements, in case there is valuable information trailing behind the closed bracket
         original_len = len(tokens)
@@ -322,7 +375,7 @@ def get_value_from_aggregate_op(value, tokens):
 
     # get the indices
     while len(tokens) != desired_token_length:
-        value += " {}".format(tokens.pop(0))
+        value += " {}".format(tokens.advance())
 
     if value[-1] == ",":
         value = value[:-1]
@@ -331,25 +384,27 @@ def get_value_from_aggregate_op(value, tokens):
 
 
 def get_value_from_bianry_op(value, tokens):
+    tokens = as_cursor(tokens)
+
     # pop a potential opening bracket
-    if tokens[0][0] == "(":
-        tokens[0] = tokens[0][1:]
+    if tokens.peek()[0] == "(":
+        tokens.replace(tokens.peek()[1:])
 
     # pop potential nuw token
-    if tokens[0] == "nuw":
-        value += " {}".format(tokens.pop(0))
+    if tokens.peek() == "nuw":
+        value += " {}".format(tokens.advance())
 
     # pop potential nsw token
-    if tokens[0] == "nsw":
-        value += " {}".format(tokens.pop(0))
+    if tokens.peek() == "nsw":
+        value += " {}".format(tokens.advance())
 
     # pop potential exact token
-    if tokens[0] == "exact":
-        value += " {}".format(tokens.pop(0))
+    if tokens.peek() == "exact":
+        value += " {}".format(tokens.advance())
 
     # pop potential fastmath flags
-    while is_fast_math_flag(tokens[0]):
-        value += " {}".format(tokens.pop(0))
+    while is_fast_math_flag(tokens.peek()):
+        value += " {}".format(tokens.advance())
 
     # get the type
     value_type, tokens = get_type(tokens)
@@ -364,3 +419,19 @@ def get_value_from_bianry_op(value, tokens):
     value += " {}".format(value2)
 
     return value
+
+
+# map the keyword of every constant expression onto the function that parses it
+constant_expressions = dict()
+constant_expressions.update({op: get_value_from_conversion for op in ["trunc", "zext", "sext", "fptrunc", "fpext",
+                                                                      "fptoui", "fptosi", "uitofp", "sitofp",
+                                                                      "ptrtoint", "inttoptr", "bitcast",
+                                                                      "addrspacecast"]})
+constant_expressions["getelementptr"] = get_value_from_getelementptr
+constant_expressions["select"] = get_value_from_select
+constant_expressions.update({op: get_value_from_icmp_or_fcmp for op in ["icmp", "fcmp"]})
+constant_expressions.update({op: get_value_from_vector_op for op in ["extractelement", "insertelement",
+                                                                     "shufflevector"]})
+constant_expressions.update({op: get_value_from_aggregate_op for op in ["extractvalue", "insertvalue"]})
+constant_expressions.update({op: get_value_from_bianry_op for op in ["add", "fadd", "sub", "fsub", "mul", "fmul",
+                                                                     "udiv", "sdiv", "fdiv", "urem", "srem", "frem"]})
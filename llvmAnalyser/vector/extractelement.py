@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 
 # extractelement extracts a single scalar element from a vector at a specfied index
@@ -10,14 +11,16 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 
 
 def analyze_extractelement(tokens):
+    tokens = as_cursor(tokens)
+
     statement = ExtractElement()
 
     # pop the potential assignment
-    while tokens[0] != "extractelement":
-        tokens.pop(0)
+    while tokens.peek() != "extractelement":
+        tokens.advance()
 
     # pop the extractelement token
-    tokens.pop(0)
+    tokens.advance()
 
     # get the vector type
     vector_type, tokens = get_type(tokens)
@@ -38,6 +41,8 @@ def analyze_extractelement(tokens):
 
 
 class ExtractElement(LlvmStatement):
+    __slots__ = ("vector_type", "vector_value", "index")
+
     def __init__(self):
         super().__init__()
         self.vector_type = None
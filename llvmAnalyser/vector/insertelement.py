@@ -1,6 +1,7 @@
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
 from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.cursor import as_cursor
 
 
 # insertelement inserts a scalar element into a vector at a specfied index
@@ -10,14 +11,16 @@ from llvmAnalyser.llvmStatement import LlvmStatement
 
 
 def analyze_insertelement(tokens):
+    tokens = as_cursor(tokens)
+
     statement = InsertElement()
 
     # pop the potential assignment
-    while tokens[0] != "insertelement":
-        tokens.pop(0)
+    while tokens.peek() != "insertelement":
+        tokens.advance()
 
     # pop the insertelement token
-    tokens.pop(0)
+    tokens.advance()
 
     # get the vector type
     vector_type, tokens = get_type(tokens)
@@ -38,12 +41,14 @@ def analyze_insertelement(tokens):
     _, tokens = get_type(tokens)
 
     # get the index
-    statement.set_index(tokens.pop(0))
+    statement.set_index(tokens.advance())
 
     return statement
 
 
 class InsertElement(LlvmStatement):
+    __slots__ = ("vector_type", "vector_value", "scalar_value", "index")
+
     def __init__(self):
         super().__init__()
         self.vector_type = None
@@ -1,6 +1,7 @@
 from llvmAnalyser.llvmStatement import LlvmStatement
 from llvmAnalyser.types import get_type
 from llvmAnalyser.values import get_value
+from llvmAnalyser.cursor import as_cursor
 
 
 # The ‘shufflevector’ instruction constructs a permutation of elements from two input vectors,
@@ -10,14 +11,16 @@ from llvmAnalyser.values import get_value
 # <result> = shufflevector <vscale x n x <ty>> <v1>, <vscale x n x <ty>> v2, <vscale x m x i32> <mask>
 
 def analyze_shufflevector(tokens):
+    tokens = as_cursor(tokens)
+
     statement = Shufflevector()
 
     # pop potential assignment
-    while tokens[0] != "shufflevector":
-        tokens.pop(0)
+    while tokens.peek() != "shufflevector":
+        tokens.advance()
 
     # pop the shufflevector token
-    tokens.pop(0)
+    tokens.advance()
 
     # get the first vector type
     _, tokens = get_type(tokens)
@@ -44,6 +47,8 @@ def analyze_shufflevector(tokens):
 
 
 class Shufflevector(LlvmStatement):
+    __slots__ = ("first_vector_value", "second_vector_value", "third_vector_value")
+
     def __init__(self):
         super().__init__()
         self.first_vector_value = None
@@ -1,4 +1,5 @@
 from shutil import which
+from os import path
 from yaml import load
 
 try:
@@ -27,7 +28,15 @@ print("[1/3]: Validating environment - finished")
 
 print("[2/3]: llvm analysis - started")
 
+# the linked llvm file can also be stored compressed, or only as bitcode, in which case it is disassembled on the fly
+# without any linked file, the llvm files of the separate translation units are analysed
 llvm_path = config["project_path"] + "/llvm/linked.ll"
+for candidate in ["linked.ll", "linked.ll.gz", "linked.ll.zst", "linked.ll.xz", "llvm_submodules/linked.bc",
+                  "llvm_submodules"]:
+    if path.exists(config["project_path"] + "/llvm/" + candidate):
+        llvm_path = config["project_path"] + "/llvm/" + candidate
+        break
+
 analyzer = LLVMAnalyser()
 analyzer.get_relevant_functions(llvm_path)
 
@@ -1,9 +1,26 @@
 import unittest
 from test.llvm_types_test import *
 from test.llvm_values_test import *
+from test.llvm_lexer_test import *
+from test.llvm_dispatch_test import *
+from test.llvm_joiner_test import *
+from test.llvm_cursor_test import *
+from test.llvm_checker_test import *
+from test.llvm_symbols_test import *
+from test.llvm_type_cache_test import *
+from test.llvm_statement_test import *
 from test.llvm_def_test import *
 from test.llvm_call_test import *
 from test.llvm_invoke_test import *
+from test.llvm_switch_test import *
+from test.llvm_reader_test import *
+from test.llvm_index_test import *
+from test.llvm_lazy_test import *
+from test.llvm_cache_test import *
+from test.llvm_labels_test import *
+from test.llvm_graph_test import *
+from test.llvm_incremental_test import *
+from test.llvm_module_set_test import *
 from test.test import *
 
 if __name__ == '__main__':
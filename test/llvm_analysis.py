@@ -0,0 +1,83 @@
+import re
+from os import path
+from llvmAnalyser.analyser import LLVMAnalyser
+
+# The module and the helpers shared by the tests that run the analyser on an llvm file. The module holds a test that
+# pushes onto a stack, the push calls an excluded function that mutates the stack, as well as an excluded function
+# that is never queried.
+
+module = b'''%class.Stack = type { i32*, i32 }
+%"class.testing::AssertionResult" = type { i8, i8* }
+%class.StackTest_push_Test = type { i8 }
+
+define dso_local void @_ZN5Stack4pushEi(%class.Stack*, i32) #0 align 2 {
+  %3 = alloca %class.Stack*, align 8
+  store %class.Stack* %0, %class.Stack** %3, align 8
+  %4 = load %class.Stack*, %class.Stack** %3, align 8
+  %5 = getelementptr inbounds %class.Stack, %class.Stack* %4, i32 0, i32 1
+  call void @_ZNSt6__growEPi(i32* %5)
+  call void @_ZNSt7__traceEv()
+  ret void
+}
+
+define dso_local void @_ZNSt6__growEPi(i32*) #0 {
+  %2 = alloca i32*, align 8
+  store i32* %0, i32** %2, align 8
+  %3 = load i32*, i32** %2, align 8
+  %4 = load i32, i32* %3, align 4
+  %5 = add nsw i32 %4, 1
+  store i32 %5, i32* %3, align 4
+  ret void
+}
+
+define dso_local void @_ZNSt7__traceEv() #0 {
+  ret void
+}
+
+define dso_local i32 @_ZN5Stack4sizeEv(%class.Stack*) #0 align 2 {
+  %2 = getelementptr inbounds %class.Stack, %class.Stack* %0, i32 0, i32 1
+  %3 = load i32, i32* %2, align 4
+  ret i32 %3
+}
+
+define dso_local void @_ZN19StackTest_push_Test8TestBodyEv(%class.StackTest_push_Test*) unnamed_addr #0 align 2 {
+  %2 = alloca %class.Stack, align 8
+  %3 = alloca i32, align 4
+  %4 = alloca %"class.testing::AssertionResult", align 8
+  %5 = alloca i32, align 4
+  call void @_ZN5Stack4pushEi(%class.Stack* %2, i32 5)
+  store i32 1, i32* %3, align 4
+  %6 = call i32 @_ZN5Stack4sizeEv(%class.Stack* %2)
+  store i32 %6, i32* %5, align 4
+  call void @_ZN7testing8internal11CmpHelperEQIiiEENS_15AssertionResultEPKcS4_RKT_RKT0_(%"class.testing::AssertionResult"* sret %4, i32* dereferenceable(4) %3, i32* dereferenceable(4) %5)
+  ret void
+}
+
+declare dso_local void @_ZN7testing8internal11CmpHelperEQIiiEENS_15AssertionResultEPKcS4_RKT_RKT0_(%"class.testing::AssertionResult"* sret, i32* dereferenceable(4), i32* dereferenceable(4)) #1
+
+attributes #0 = { noinline optnone uwtable }
+'''
+
+
+# write the content to a file within the directory, the path of the file is returned
+def write_module(directory, content=module, name="linked.ll"):
+    file = path.join(directory, name)
+    with open(file, "wb") as f:
+        f.write(content)
+    return file
+
+
+# analyse the file up to a depth of one, the given options override the config of the analyser
+# this returns the analyser along with the focal methods it found
+def analyse(file, **options):
+    analyzer = LLVMAnalyser()
+    analyzer.config["graph"] = False
+    analyzer.config["max_depth"] = 1
+    analyzer.config.update(options)
+
+    # the test function signature is compiled once the analyser is created, so it is compiled again in case it is given
+    analyzer.test_identifier = re.compile(analyzer.config["test_function_signature"])
+    analyzer.get_relevant_functions(file)
+    focal_methods = analyzer.get_focal_methods()
+    analyzer.lines.close()
+    return analyzer, focal_methods
@@ -0,0 +1,67 @@
+import unittest
+from os import path, listdir, utime, urandom
+from pickle import dumps, loads
+from tempfile import TemporaryDirectory
+from graph.graph import Graph
+from llvmAnalyser.cache import FunctionCache
+from test.llvm_analysis import write_module, analyse
+
+
+class TestLLVMCache(unittest.TestCase):
+    def test_graph_pickle(self):
+        graph = Graph()
+        prev_node = graph.add_node("start")
+        for i in range(5000):
+            new_node = graph.add_node("%{} = add i32 %0, 1".format(i))
+            new_node.add_argument(graph.add_node("%0"))
+            graph.add_edge(prev_node, new_node)
+            prev_node = new_node
+
+        # the long chain of nodes must not exceed the recursion limit
+        restored = loads(dumps(graph))
+
+        self.assertEqual(len(restored.nodes), len(graph.nodes))
+        self.assertEqual(len(restored.edges), len(graph.edges))
+        self.assertEqual(restored.nodes[1].get_incs(), [restored.nodes[0]])
+        self.assertEqual(restored.nodes[1].get_outs(), [restored.nodes[3]])
+        self.assertEqual(restored.nodes[1].get_arguments(), [restored.nodes[2]])
+
+    def test_cache(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+            cache = path.join(directory, "cache")
+
+            _, expected = analyse(file, cache="")
+
+            analyzer, focal_methods = analyse(file, cache=cache)
+            self.assertEqual(focal_methods, expected)
+            self.assertEqual(analyzer.cache.hits, 0)
+            self.assertEqual(len(listdir(cache)), len(analyzer.graphs))
+
+            # the second run loads every function from the cache
+            analyzer, focal_methods = analyse(file, cache=cache)
+            self.assertEqual(focal_methods, expected)
+            self.assertEqual(analyzer.cache.hits, len(analyzer.graphs))
+            self.assertEqual(analyzer.cache.misses, 0)
+
+            # the marks that depend upon the configuration are not taken from the cache
+            analyzer, focal_methods = analyse(file, cache=cache, test_function_signature="^@_ZN5Stack4pushEi$")
+            self.assertEqual(focal_methods, dict())
+            self.assertGreater(analyzer.cache.hits, 0)
+            graph = analyzer.graphs["@_ZN5Stack4pushEi"]
+            self.assertTrue(graph.is_test_func())
+            self.assertEqual(graph.assertions, [graph.nodes[0]])
+
+    def test_eviction(self):
+        with TemporaryDirectory() as directory:
+            cache = FunctionCache(directory, 10 ** 6)
+            keys = [cache.get_key(body) for body in (b"a", b"b", b"c")]
+            data = urandom(400000)
+            for i, key in enumerate(keys):
+                cache.store(key, data)
+                utime(path.join(directory, key), (i, i))
+
+            # the least recently used entry gets evicted
+            self.assertEqual(sorted(listdir(directory)), sorted(keys[1:]))
+            self.assertEqual(cache.load(keys[0]), None)
+            self.assertEqual(cache.load(keys[1]), data)
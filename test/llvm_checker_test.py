@@ -0,0 +1,35 @@
+import unittest
+from llvmAnalyser.llvmChecker import *
+from llvmAnalyser.cursor import TokenCursor
+from llvmAnalyser.other.call import analyze_call
+
+
+class TestLLVMChecker(unittest.TestCase):
+    def test_classify_attribute(self):
+        self.assertEqual(classify_attribute("nonnull,"), (PARAMETER_ATTRIBUTE, 0))
+        self.assertEqual(classify_attribute("dereferenceable_or_null(8)"), (PARAMETER_ATTRIBUTE, 0))
+        self.assertEqual(classify_attribute("byval(%struct.S)*"), (PARAMETER_ATTRIBUTE, 0))
+        self.assertEqual(classify_attribute("nofree"), (PARAMETER_ATTRIBUTE | FUNCTION_ATTRIBUTE, 0))
+        self.assertEqual(classify_attribute("allocsize(0,"), (FUNCTION_ATTRIBUTE, 1))
+        self.assertEqual(classify_attribute("%1,"), (0, 0))
+
+        self.assertTrue(is_parameter_attribute("sret(%struct.S)"))
+        self.assertFalse(is_parameter_attribute("nounwind"))
+        self.assertTrue(is_function_attribute("nounwind"))
+        self.assertTrue(is_attribute("noinline"))
+        self.assertFalse(is_attribute("i32"))
+
+    def test_read_attribute(self):
+        tokens = TokenCursor(["allocsize(0,", "1)", "#3"])
+        self.assertEqual(read_attribute(tokens), "allocsize(0, 1)")
+        self.assertEqual(tokens, ["#3"])
+
+        # the align attribute takes its value as a separate token
+        tokens = TokenCursor(["align", "16", "i8*"])
+        self.assertEqual(read_attribute(tokens), "align 16")
+        self.assertEqual(tokens, ["i8*"])
+
+        call = analyze_call("%2 = call noalias align 16 i8* @malloc(i64 16) allocsize(0)".split(" "))
+        self.assertEqual(call.get_return_attrs(), ["noalias", "align 16"])
+        self.assertTrue(call.returns_pointer())
+        self.assertEqual(call.get_function_attributes(), ["allocsize(0)"])
@@ -0,0 +1,64 @@
+import unittest
+from llvmAnalyser.cursor import TokenCursor, as_cursor
+from llvmAnalyser.types import get_type
+from llvmAnalyser.other.call import analyze_call
+
+
+class TestLLVMCursor(unittest.TestCase):
+    def test_cursor(self):
+        tokens = TokenCursor(["store", "i32", "%1,", "i32*", "%2"])
+        self.assertEqual(tokens.peek(), "store")
+        self.assertEqual(tokens.peek(2), "%1,")
+        self.assertEqual(tokens.advance(), "store")
+        self.assertEqual(len(tokens), 4)
+
+        self.assertFalse(tokens.accept("i64"))
+        self.assertTrue(tokens.accept("i32"))
+        self.assertEqual(tokens.expect("%1,"), "%1,")
+        self.assertRaises(ValueError, tokens.expect, "i64*")
+        self.assertEqual(tokens.peek(-1), "%1,")
+
+        # a partially consumed token is replaced, and a split off part is pushed back in front of the tokens
+        tokens.replace("*")
+        tokens.push("i32")
+        self.assertEqual(tokens, ["i32", "*", "%2"])
+        self.assertEqual(tokens.get_position(), 2)
+
+        tokens.insert(1, "addrspace(1)")
+        self.assertEqual(list(tokens), ["i32", "addrspace(1)", "*", "%2"])
+
+        self.assertIs(as_cursor(tokens), tokens)
+        self.assertEqual(as_cursor([]), [])
+
+    def test_parsers(self):
+        # the parsers share the cursor, and return the cursor with the remaining tokens
+        tokens = TokenCursor(["i32*,", "%2"])
+        specified_type, remaining = get_type(tokens)
+        self.assertEqual(specified_type, "i32*")
+        self.assertIs(remaining, tokens)
+        self.assertEqual(remaining, ["%2"])
+
+        # a long argument list is consumed in a single pass over the tokens
+        arguments = ", ".join("i32 %{}".format(i) for i in range(2000))
+        call = analyze_call("%r = call i32 @_Z3fooiz({})".format(arguments).split(" "))
+        self.assertEqual(len(call.get_arguments()), 2000)
+        self.assertEqual(call.get_argument_registers()[-1], "%1999")
+
+    def test_brackets(self):
+        tokens = TokenCursor(["(i32", "(i8*)*", "bitcast", "(i32*", "%1", "to", "i8*)),", "i32", "%2)", "#0"])
+        self.assertEqual(tokens.get_matching_bracket(), (6, 4))
+        self.assertEqual(tokens.get_matching_bracket(1), (1, 4))
+        self.assertEqual(tokens.get_matching_bracket(3), (6, 3))
+        self.assertIsNone(tokens.get_matching_bracket(2))
+
+        # the bracket in which the token is enclosed
+        self.assertEqual(tokens.get_closing_bracket(2), (6, 4))
+        self.assertEqual(tokens.get_closing_bracket(7), (8, 2))
+        self.assertIsNone(tokens.get_closing_bracket(9))
+
+        # the offsets are relative to the position of the cursor, also after the tokens are modified
+        tokens.skip(3)
+        self.assertEqual(tokens.get_matching_bracket(), (3, 3))
+        tokens.replace(tokens.peek()[1:])
+        self.assertEqual(tokens.get_closing_bracket(), (3, 3))
+        self.assertEqual(tokens.get_closing_bracket(4), (5, 2))
@@ -0,0 +1,20 @@
+import unittest
+from llvmAnalyser.analyser import get_opcode, instructions
+from llvmAnalyser.lexer import get_words
+
+
+class TestLLVMDispatch(unittest.TestCase):
+    def test_opcode(self):
+        self.assertEqual(get_opcode(get_words("  store i32 %0, i32* %2, align 4")), "store")
+        self.assertEqual(get_opcode(get_words("  %3 = load i32, i32* %2, align 4")), "load")
+        self.assertEqual(get_opcode(get_words("  br label %4")), "br")
+        self.assertEqual(get_opcode(get_words("  ret void")), "ret")
+
+        # the opcode is taken from its position, so registers and values named after instructions do not influence it
+        self.assertEqual(get_opcode(get_words("  %select = call i32 @_Z3fooi(i32 %load)")), "call")
+        self.assertEqual(get_opcode(get_words("  store i1 select (i1 true, i1 false, i1 true), i1* %br")), "store")
+
+    def test_handlers(self):
+        self.assertEqual(instructions[get_opcode(get_words("  %5 = tail call i32 @_Z3fooi(i32 %4)"))], "analyze_call")
+        self.assertEqual(instructions[get_opcode(get_words("  %5 = xor i32 %4, -1"))], "register_bitwise_binary")
+        self.assertEqual(instructions[get_opcode(get_words("  %5 = bitcast i32* %4 to i8*"))], "register_conversion")
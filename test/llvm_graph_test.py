@@ -0,0 +1,38 @@
+import unittest
+from pickle import dumps, loads
+from graph.graph import Graph
+from llvmAnalyser import labels
+
+
+class TestLLVMGraph(unittest.TestCase):
+    def test_start_of_block(self):
+        graph = Graph()
+        graph.add_node("@f")
+        argument = graph.add_node("%5")
+        self.assertIsNone(graph.get_start_of_block("%5"))
+
+        # the most recently added node with the name of the block is the start of the block
+        block = graph.add_node("%5")
+        graph.register_start_of_block("%5")
+        self.assertIs(graph.get_start_of_block("%5"), block)
+        self.assertIsNot(graph.get_named_node("%5"), argument)
+
+        # the nodes of which the name is rendered from their statement, or which are assigned to, are not found
+        graph.add_node(None, labels.get_load_label).set_context(None)
+        graph.add_node("%7").set_assignee("%8")
+        self.assertIsNone(graph.get_named_node("%7"))
+        self.assertIsNone(graph.get_named_node("%8 = %7"))
+
+        restored = loads(dumps(graph))
+        self.assertEqual(restored.get_named_node("%5").get_id(), block.get_id())
+        self.assertIs(restored.get_start_of_block("%5"), restored.get_named_node("%5"))
+
+    def test_needed_nodes(self):
+        graph = Graph()
+        nodes = [graph.add_node("%{}".format(i)) for i in range(4)]
+        graph.add_edge(nodes[2], nodes[0])
+        graph.add_edge(nodes[0], nodes[3])
+        graph.add_edge(nodes[2], nodes[0], "default")
+        self.assertEqual(list(graph.needed_nodes), [nodes[2], nodes[0], nodes[3]])
+        self.assertEqual(len(graph.edges), 3)
+        self.assertEqual(nodes[0].get_incs(), [nodes[2], nodes[2]])
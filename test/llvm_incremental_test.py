@@ -0,0 +1,119 @@
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from llvmAnalyser.analyser import LLVMAnalyser
+from llvmAnalyser.incremental import read_state, get_state_path
+from test.llvm_analysis import module, write_module, analyse
+
+unrelated_function = b'''
+define dso_local void @_ZN5Stack5clearEv(%class.Stack*) #0 align 2 {
+  ret void
+}
+'''
+
+changed_function = b'''define dso_local void @_ZNSt7__traceEv() #0 {
+  %1 = alloca i32, align 4
+  ret void
+}'''
+
+# a second test, which shares a callee with the test of the module, it is analysed after the other test
+second_test = b'''define dso_local void @_ZN19StackTest_size_Test8TestBodyEv(%class.StackTest_push_Test*) unnamed_addr #0 align 2 {
+  %2 = alloca %class.Stack, align 8
+  %3 = alloca i32, align 4
+  %4 = alloca %"class.testing::AssertionResult", align 8
+  %5 = alloca i32, align 4
+  store i32 2, i32* %3, align 4
+  %6 = call i32 @_ZN5Stack4sizeEv(%class.Stack* %2)
+  store i32 %6, i32* %5, align 4
+  call void @_ZN7testing8internal11CmpHelperEQIiiEENS_15AssertionResultEPKcS4_RKT_RKT0_(%"class.testing::AssertionResult"* sret %4, i32* dereferenceable(4) %3, i32* dereferenceable(4) %5)
+  ret void
+}
+
+'''
+
+
+# analyse the file in incremental mode, while counting the number of times the focal methods are actually determined
+def analyse_incremental(file, lazy=False):
+    with patch.object(LLVMAnalyser, "find_focal_methods", autospec=True,
+                      side_effect=LLVMAnalyser.find_focal_methods) as find_focal_methods:
+        analyzer, focal_methods = analyse(file, lazy=lazy, incremental=True)
+    analyzer.evaluations = find_focal_methods.call_count
+    return analyzer, focal_methods
+
+
+class TestLLVMIncremental(unittest.TestCase):
+    def test_incremental(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+            expected = {"@_ZN19StackTest_push_Test8TestBodyEv": {"@_ZN5Stack4pushEi"}}
+
+            analyzer, focal_methods = analyse_incremental(file)
+            self.assertEqual(focal_methods, expected)
+            self.assertGreater(analyzer.evaluations, 0)
+
+            state = read_state(get_state_path(file), analyzer.get_state_fingerprint())
+            closure = state.get_test("@_ZN19StackTest_push_Test8TestBodyEv")[1]
+            self.assertIn("@_ZN5Stack4pushEi", closure)
+            self.assertIn("@_ZNSt7__traceEv", closure)
+            self.assertNotIn("@_ZN5Stack5clearEv", closure)
+
+            # nothing changed, so the previous results are reused
+            analyzer, focal_methods = analyse_incremental(file)
+            self.assertEqual(focal_methods, expected)
+            self.assertEqual(analyzer.evaluations, 0)
+
+            # a function outside of the closure of the test does not invalidate the results
+            write_module(directory, module + unrelated_function)
+            analyzer, focal_methods = analyse_incremental(file)
+            self.assertEqual(focal_methods, expected)
+            self.assertEqual(analyzer.evaluations, 0)
+
+            # a function within the closure of the test does invalidate the results
+            write_module(directory, module.replace(b'''define dso_local void @_ZNSt7__traceEv() #0 {
+  ret void
+}''', changed_function))
+            analyzer, focal_methods = analyse_incremental(file)
+            self.assertEqual(focal_methods, expected)
+            self.assertGreater(analyzer.evaluations, 0)
+
+    def test_lazy_incremental(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+            expected = {"@_ZN19StackTest_push_Test8TestBodyEv": {"@_ZN5Stack4pushEi"}}
+
+            # the closure of the test does not analyse the excluded functions that were never requested
+            analyzer, focal_methods = analyse_incremental(file, lazy=True)
+            self.assertEqual(focal_methods, expected)
+            self.assertIn("@_ZNSt6__growEPi", analyzer.node_stack)
+            self.assertNotIn("@_ZNSt7__traceEv", analyzer.node_stack)
+
+            # the previous results are reused, without analysing any of the excluded functions
+            analyzer, focal_methods = analyse_incremental(file, lazy=True)
+            self.assertEqual(focal_methods, expected)
+            self.assertEqual(analyzer.evaluations, 0)
+            self.assertNotIn("@_ZNSt6__growEPi", analyzer.node_stack)
+
+            # an excluded function that was never analysed still invalidates the results once it changes
+            write_module(directory, module.replace(b'''define dso_local void @_ZNSt7__traceEv() #0 {
+  ret void
+}''', changed_function))
+            analyzer, focal_methods = analyse_incremental(file, lazy=True)
+            self.assertEqual(focal_methods, expected)
+            self.assertGreater(analyzer.evaluations, 0)
+
+    def test_shared_callees(self):
+        with TemporaryDirectory() as directory:
+            test_body = b"define dso_local void @_ZN19StackTest_push_Test8TestBodyEv"
+            file = write_module(directory, module.replace(test_body, second_test + test_body))
+            analyse_incremental(file)
+
+            # only the second test changes, so the focal methods of the first test are reused, while the second test
+            # looks up the mutation types of the callees it shares with the first test
+            write_module(directory, module.replace(test_body, second_test.replace(b"i32 2,", b"i32 3,") + test_body))
+            analyzer, focal_methods = analyse_incremental(file)
+            self.assertEqual(analyzer.evaluations, 2)
+
+            clean_analyzer, clean_focal_methods = analyse(file)
+            self.assertEqual(focal_methods, clean_focal_methods)
+            self.assertEqual(list(analyzer.found_mutation_types.items()),
+                             list(clean_analyzer.found_mutation_types.items()))
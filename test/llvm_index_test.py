@@ -0,0 +1,138 @@
+import unittest
+import gzip
+from shutil import which
+from subprocess import call
+from os import path, utime, stat
+from tempfile import TemporaryDirectory
+from llvmAnalyser.index import load_module, read_index, get_index_path
+
+module = b'''%class.Stack = type { i32*, i32, i32 }
+
+@_ZN5StackC1Ei = dso_local unnamed_addr alias void (%class.Stack*, i32), void (%class.Stack*, i32)* @_ZN5StackC2Ei
+
+define dso_local void @_ZN5StackC2Ei(%class.Stack*, i32) unnamed_addr #0 align 2 {
+  ret void
+}
+
+define dso_local zeroext i1 @_ZN5Stack4fullEv(%class.Stack*) #2 align 2 {
+  %2 = alloca %class.Stack*, align 8
+  br label %3
+
+3:                                                ; preds = %1
+  br i1 true, label %4, label %5
+
+4:                                                ; preds = %3
+  ret i1 true
+
+5:                                                ; preds = %3
+  ret i1 false
+}
+
+declare dso_local void @exit(i32) #3
+
+attributes #0 = { noinline nounwind optnone uwtable "frame-pointer"="all" }
+'''
+
+
+class TestLLVMIndex(unittest.TestCase):
+    def test_index(self):
+        with TemporaryDirectory() as directory:
+            file = path.join(directory, "linked.ll")
+            with open(file, "wb") as f:
+                f.write(module)
+
+            reader, index = load_module(file)
+
+            self.assertEqual(len(index.get_functions()), 2)
+            self.assertEqual(index.get_aliases(), {"@_ZN5StackC1Ei": "@_ZN5StackC2Ei"})
+
+            entry = index.get_function("@_ZN5StackC2Ei")
+            self.assertEqual(entry.get_define_line(), 4)
+            self.assertEqual(reader[entry.get_define_line()][:6], "define")
+            self.assertEqual(module[entry.get_start():entry.get_end()],
+                             b"define dso_local void @_ZN5StackC2Ei(%class.Stack*, i32) unnamed_addr #0 align 2 {\n"
+                             b"  ret void\n}\n")
+            self.assertEqual(index.get_function("@_ZN5StackC2Ei").get_labels(), {})
+
+            entry = index.get_function("@_ZN5Stack4fullEv")
+            self.assertEqual(entry.get_define_line(), 8)
+            self.assertEqual(entry.get_labels(), {"%3": 12, "%4": 15, "%5": 18})
+            self.assertEqual(index.get_function("@exit"), None)
+
+            self.assertEqual(index.get_declarations(), {"@exit": 22})
+            self.assertEqual(index.get_attribute_groups(), {"#0": ["noinline", "nounwind", "optnone", "uwtable"]})
+            self.assertEqual(index.get_named_types(), {"%class.Stack": "{ i32*, i32, i32 }"})
+
+            reader.close()
+
+    def test_sidecar(self):
+        with TemporaryDirectory() as directory:
+            file = path.join(directory, "linked.ll")
+            with open(file, "wb") as f:
+                f.write(module)
+
+            reader, index = load_module(file)
+            reader.close()
+
+            # the index is written next to the llvm file, keyed by the size and modification time of the file
+            stored = read_index(get_index_path(file))
+            self.assertEqual(stored.size, len(module))
+            self.assertEqual(stored.mtime, stat(file).st_mtime_ns)
+            self.assertEqual(list(stored.offsets), list(index.offsets))
+
+            # touching the file keeps the index, as the content hash still matches
+            utime(file, ns=(stat(file).st_atime_ns, stat(file).st_mtime_ns + 10 ** 9))
+            reader, index = load_module(file)
+            self.assertIs(reader.offsets, index.offsets)
+            reader.close()
+            self.assertEqual(read_index(get_index_path(file)).mtime, stat(file).st_mtime_ns)
+            self.assertEqual(len(index.get_functions()), 2)
+
+            # changing the content rebuilds the index
+            with open(file, "wb") as f:
+                f.write(module.replace(b"@_ZN5Stack4fullEv", b"@_ZN5Stack5emptyEv"))
+            reader, index = load_module(file)
+            reader.close()
+            self.assertEqual(sorted(index.get_functions()), ["@_ZN5Stack5emptyEv", "@_ZN5StackC2Ei"])
+
+    def test_compressed(self):
+        with TemporaryDirectory() as directory:
+            file = path.join(directory, "linked.ll.gz")
+            with open(file, "wb") as f:
+                f.write(gzip.compress(module))
+
+            reader, index = load_module(file)
+            reader.close()
+            self.assertEqual(index.get_function("@_ZN5Stack4fullEv").get_labels(), {"%3": 12, "%4": 15, "%5": 18})
+
+            # the stored index is used to jump directly to the functions within the compressed file
+            reader, index = load_module(file)
+            entry = index.get_function("@_ZN5StackC2Ei")
+            self.assertEqual(reader[entry.get_define_line() + 1], "  ret void")
+            self.assertEqual(reader.read(entry.get_start(), entry.get_end()), module[entry.get_start():entry.get_end()])
+            reader.close()
+
+    @unittest.skipIf(which("llvm-as") is None or which("llvm-dis") is None, "requires llvm-as and llvm-dis")
+    def test_bitcode(self):
+        with TemporaryDirectory() as directory:
+            file = path.join(directory, "linked.ll")
+            with open(file, "wb") as f:
+                f.write(module)
+            call(["llvm-as", file, "-o", path.join(directory, "linked.bc")])
+            call(["llvm-dis", path.join(directory, "linked.bc"), "-o", file])
+
+            expected_reader, expected_index = load_module(file)
+
+            # the bitcode is disassembled through a pipe
+            reader, index = load_module(path.join(directory, "linked.bc"), "llvm-dis")
+            self.assertEqual(list(index.offsets), list(expected_index.offsets))
+            self.assertEqual({name: entry.to_tuple() for name, entry in index.get_functions().items()},
+                             {name: entry.to_tuple() for name, entry in expected_index.get_functions().items()})
+            self.assertEqual(index.get_aliases(), {"@_ZN5StackC1Ei": "@_ZN5StackC2Ei"})
+            reader.close()
+
+            reader, index = load_module(path.join(directory, "linked.bc"), "llvm-dis")
+            entry = index.get_function("@_ZN5Stack4fullEv")
+            self.assertEqual(reader[entry.get_define_line()], expected_reader[entry.get_define_line()])
+            reader.close()
+            expected_reader.close()
@@ -0,0 +1,47 @@
+import unittest
+from llvmAnalyser.joiner import iter_instructions
+
+lines = ['define dso_local i32 @foo(i32) #0 {',
+         '  switch i32 %0, label %4 [',
+         '    i32 1, label %2',
+         '    i32 2, label %3',
+         '  ]',
+         '',
+         '2:                                                ; preds = %1',
+         '  %3 = invoke i32 @bar(i32 %0)',
+         '          to label %4 unwind label %5',
+         '  %6 = landingpad { i8*, i32 }',
+         '          catch i8* null',
+         '          cleanup',
+         '  %7 = call i8* @__cxa_begin_catch(i8* null)',
+         '  switch i32 %0, label %4 [ i32 9, label %2 ]',
+         '  tail call void @llvm.dbg.value(metadata i32 %0, metadata !15, metadata !DIExpression()), !dbg !16',
+         '}']
+
+
+class TestLLVMJoiner(unittest.TestCase):
+    def test_instructions(self):
+        instructions = [(instruction.get_tokens(), instruction.get_first_line(), instruction.get_last_line())
+                        for instruction in iter_instructions(lines)]
+
+        self.assertEqual([(first, last) for _, first, last in instructions],
+                         [(0, 0), (1, 4), (6, 6), (7, 8), (9, 11), (12, 12), (13, 13), (15, 15)])
+
+        self.assertEqual(instructions[1][0], ["switch", "i32", "%0,", "label", "%4", "[", "i32", "1,", "label", "%2",
+                                              "i32", "2,", "label", "%3", "]"])
+        self.assertEqual(instructions[3][0][-6:], ["to", "label", "%4", "unwind", "label", "%5"])
+        self.assertEqual(instructions[4][0][-4:], ["catch", "i8*", "null", "cleanup"])
+
+        # the call that follows the clauses of the landingpad is an instruction of its own
+        self.assertEqual(instructions[5][0][2], "call")
+
+        # the calls to the debug intrinsics are skipped
+        self.assertEqual(instructions[-1][0], ["}"])
+
+    def test_start(self):
+        self.assertEqual([instruction.get_first_line() for instruction in iter_instructions(lines, 9)],
+                         [9, 12, 13, 15])
+
+        # an instruction that is not closed ends at the final line
+        instructions = list(iter_instructions(lines[:3]))
+        self.assertEqual(instructions[-1].get_last_line(), 2)
@@ -0,0 +1,96 @@
+import unittest
+from pickle import dumps, loads
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from graph.graph import Graph
+from graph.node import Node
+from llvmAnalyser import labels
+from test.llvm_analysis import write_module, analyse
+
+branches = b'''define dso_local void @_ZN11Branch_Test8TestBodyEv(i32, i8*) #0 {
+  switch i32 %0, label %3 [ i32 1, label %4 i32 2, label %4 i32 3, label %5 ]
+
+3:
+  indirectbr i8* %1, [ label %4, label %5 ]
+
+4:
+  ret void
+
+5:
+  ret void
+}
+'''
+
+
+
+class TestLLVMLabels(unittest.TestCase):
+    def test_lazy_labels(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+
+            # the labels are not rendered while the graphs are built
+            with patch("llvmAnalyser.labels.get_binary_op_label", side_effect=labels.get_binary_op_label) as label:
+                analyzer, _ = analyse(file)
+                label.assert_not_called()
+
+                nodes = list(analyzer.graphs["@_ZNSt6__growEPi"].nodes.values())
+                self.assertEqual([node.get_name() for node in nodes],
+                                 ["@_ZNSt6__growEPi", "%2 = %0", "%3 = %2", "%4 = %3", "%5 = %4 + 1", "%3 = %5", "ret"])
+                label.assert_called_once_with(nodes[4].get_context())
+
+        self.assertEqual(nodes[4].get_assignee(), "%5")
+        self.assertIsNone(nodes[5].get_assignee())
+
+        nodes = list(analyzer.graphs["@_ZN5Stack4pushEi"].nodes.values())
+        self.assertEqual(nodes[3].get_name(), "%5 = getelementptr %4[0][1]")
+        self.assertIs(nodes[4].get_label(), labels.get_call_label)
+        self.assertEqual(nodes[4].get_name(), "call @_ZNSt6__growEPi")
+
+    def test_lazy_edge_labels(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory, branches)
+
+            # the labels of the edges are not rendered while the graphs are built
+            with patch("llvmAnalyser.labels.get_switch_edge_label",
+                       side_effect=labels.get_switch_edge_label) as switch, \
+                    patch("llvmAnalyser.labels.get_indirectbr_edge_label",
+                          side_effect=labels.get_indirectbr_edge_label) as indirectbr:
+                analyzer, _ = analyse(file)
+                switch.assert_not_called()
+                indirectbr.assert_not_called()
+
+        edges = analyzer.graphs["@_ZN11Branch_Test8TestBodyEv"].edges.values()
+        self.assertEqual(sorted(edge.get_label() for edge in edges if edge.start_node.get_name() == "switch"),
+                         ["= 1, 2", "= 3", "default"])
+        self.assertEqual(sorted(edge.get_label() for edge in edges if edge.start_node.get_name() == "indirectbr"),
+                         ["%1 == %4", "%1 == %5"])
+
+    def test_focal_methods_without_labels(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+
+            # the search for the focal methods does not render the labels of the nodes it visits
+            rendered = list()
+            get_name = Node.get_name
+            with patch.object(Node, "get_name", lambda node: rendered.append(node) or get_name(node)):
+                _, focal_methods = analyse(file)
+
+        self.assertEqual(focal_methods, {"@_ZN19StackTest_push_Test8TestBodyEv": {"@_ZN5Stack4pushEi"}})
+        self.assertEqual([node for node in rendered if node.get_label() is not None], [])
+
+    def test_escaped_label(self):
+        graph = Graph()
+        block = graph.add_node("%5")
+        graph.register_start_of_block("%5")
+        self.assertIs(graph.get_start_of_block("%5"), block)
+
+        class Statement:
+            def get_function_name(self):
+                return '@"\\01foo"'
+
+        node = graph.add_node(None, labels.get_call_label)
+        node.set_context(Statement())
+        node.set_assignee("%1")
+        self.assertEqual(node.get_name(), '%1 = call @\\"\\01foo\\"')
+        self.assertFalse(node.has_name(node.get_name()))
+        self.assertEqual(str(node), 'Q1[label="%1 = call @\\"\\01foo\\""]')
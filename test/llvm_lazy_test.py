@@ -0,0 +1,21 @@
+import unittest
+from tempfile import TemporaryDirectory
+from test.llvm_analysis import write_module, analyse
+
+
+class TestLLVMLazy(unittest.TestCase):
+    def test_lazy(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+
+            eager_analyzer, eager_focal_methods = analyse(file, lazy=False)
+            lazy_analyzer, lazy_focal_methods = analyse(file, lazy=True)
+
+            self.assertEqual(lazy_focal_methods, eager_focal_methods)
+            self.assertEqual(lazy_focal_methods, {"@_ZN19StackTest_push_Test8TestBodyEv": {"@_ZN5Stack4pushEi"}})
+
+            # the excluded function that receives the tracked variable is analysed on demand, whereas the excluded
+            # function that is never queried is not analysed at all
+            self.assertIn("@_ZNSt6__growEPi", lazy_analyzer.graphs)
+            self.assertIn("@_ZNSt7__traceEv", eager_analyzer.graphs)
+            self.assertNotIn("@_ZNSt7__traceEv", lazy_analyzer.graphs)
@@ -0,0 +1,62 @@
+import unittest
+from llvmAnalyser.lexer import *
+from llvmAnalyser.other.call import analyze_call
+from llvmAnalyser.terminator.br import analyze_br
+from llvmAnalyser.terminator.indirectbr import analyze_inidrectbr
+
+
+class TestLLVMLexer(unittest.TestCase):
+    def test_words(self):
+        self.assertEqual(get_words("\t%1 = load i32, i32* %2, align 4 ; comment\n"),
+                         ["%1", "=", "load", "i32,", "i32*", "%2,", "align", "4"])
+        self.assertEqual(get_words("; ModuleID = 'linked.ll'\n"), [])
+        self.assertEqual(get_words("\n"), [])
+
+        # a ';' or whitespace within quotes neither starts a comment nor splits a word
+        self.assertEqual(get_words('  call void @"operator;"(%"class.a b"* %1) ; "comment"\n'),
+                         ["call", "void", '@"operator;"(%"class.a b"*', "%1)"])
+        self.assertEqual(get_words('attributes #0 = { "target-cpu"="x86-64" }'),
+                         ["attributes", "#0", "=", "{", '"target-cpu"="x86-64"', "}"])
+
+    def test_attachments(self):
+        self.assertEqual(get_words("  br label %5, !dbg !21, !llvm.loop !30"), ["br", "label", "%5"])
+        self.assertEqual(get_words("  %1 = load i8*, i8** %2, align 8, !dbg !7, !nonnull !{} ; comment"),
+                         ["%1", "=", "load", "i8*,", "i8**", "%2,", "align", "8"])
+        self.assertEqual(get_words('  call void asm sideeffect "nop, !a !1", ""(), !srcloc !5'),
+                         ["call", "void", "asm", "sideeffect", '"nop, !a !1",', '""()'])
+
+        # the metadata of a function definition and the metadata nodes themselves are kept
+        self.assertEqual(get_words("define void @f() !dbg !12 {"), ["define", "void", "@f()", "!dbg", "!12", "{"])
+        self.assertEqual(get_words("!0 = !{!1, !2}"), ["!0", "=", "!{!1,", "!2}"])
+
+    def test_code(self):
+        self.assertEqual(get_code("  %1 = add i32 %0, 1 ; comment"), "  %1 = add i32 %0, 1 ")
+        self.assertEqual(get_code('@.str = constant [4 x i8] c"a;b\\00" ; comment'), '@.str = constant [4 x i8] c"a;b\\00" ')
+
+    def test_quoted_call(self):
+        call = analyze_call(get_words('  %2 = call i32 @"operator;"(i32 %1) ; comment'))
+        self.assertEqual(call.get_function_name(), '@"operator;"')
+        self.assertEqual(call.get_argument_registers(), ["%1"])
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("  br i1 %5, label %6, label %\"a;b\" ; comment"),
+                         ["br", "i1", "%5", ",", "label", "%6", ",", "label", '%"a;b"'])
+        self.assertEqual(tokenize('  call void (...) @f(i8* null, i32 -4, [2 x i8]* c"a,b") #1, !dbg !7'),
+                         ["call", "void", "(", "...", ")", "@f", "(", "i8", "*", "null", ",", "i32", "-4", ",", "[",
+                          "2", "x", "i8", "]", "*", 'c"a,b"', ")", "#1"])
+        self.assertEqual(tokenize_words(["switch", "i32", "%0,", "label", "%4", "["]),
+                         tokenize("switch i32 %0, label %4 ["))
+        self.assertEqual(tokenize("; comment"), [])
+
+        self.assertEqual([get_kind(t) for t in tokenize('x = @g(%"a b", !1, #0, -4, "s", c"s", ...) -')],
+                         [WORD, PUNCTUATION, GLOBAL, PUNCTUATION, LOCAL, PUNCTUATION, METADATA, PUNCTUATION,
+                          ATTRIBUTE_GROUP, PUNCTUATION, NUMBER, PUNCTUATION, STRING, PUNCTUATION, STRING, PUNCTUATION,
+                          PUNCTUATION, PUNCTUATION, PUNCTUATION])
+
+    def test_branches(self):
+        br = analyze_br(tokenize("br i1 %5, label %6, label %7"))
+        self.assertEqual((br.get_used_variables(), br.get_label1(), br.get_label2()), (["%5"], "%6", "%7"))
+        self.assertEqual(analyze_br(tokenize("br label %\"for end\"")).get_label1(), '%"for end"')
+
+        br = analyze_inidrectbr(tokenize("indirectbr { i8, i32 }* %addr, [ label %2, label %3 ]"))
+        self.assertEqual((br.get_used_variables(), br.get_labels()), (["%addr"], ["%2", "%3"]))
@@ -0,0 +1,60 @@
+import unittest
+from os import path, mkdir
+from tempfile import TemporaryDirectory
+from llvmAnalyser.index import load_module_set
+from test.llvm_analysis import module, write_module, analyse
+
+# split the module over two translation units, the test function is defined in the first one, and refers to the
+# functions of the second one through declarations
+test_start = module.index(b"define dso_local void @_ZN19StackTest_push_Test8TestBodyEv")
+test_end = module.index(b"}", test_start) + 2
+
+test_unit = module[test_start:test_end] + b'''
+declare dso_local void @_ZN5Stack4pushEi(%class.Stack*, i32)
+
+declare dso_local i32 @_ZN5Stack4sizeEv(%class.Stack*)
+''' + module[test_end:]
+
+stack_unit = module[:test_start] + b'''
+define linkonce_odr dso_local void @_ZN19StackTest_push_Test8TestBodyEv(%class.StackTest_push_Test*) {
+  ret void
+}
+
+attributes #0 = { noinline nounwind }
+'''
+
+
+class TestLLVMModuleSet(unittest.TestCase):
+    def test_module_set(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+
+            submodules = path.join(directory, "llvm_submodules")
+            mkdir(submodules)
+            write_module(submodules, test_unit, "a_test.ll")
+            write_module(submodules, stack_unit, "b_stack.ll")
+
+            reader, index = load_module_set(submodules)
+
+            # the first definition is used, and the lines refer to the concatenation of the files
+            entry = index.get_function("@_ZN19StackTest_push_Test8TestBodyEv")
+            self.assertEqual(entry.get_define_line(), 0)
+            self.assertEqual(reader[0][:6], "define")
+
+            # the files are only opened once their lines are needed
+            self.assertNotEqual(reader.readers[0], None)
+            self.assertEqual(reader.readers[1], None)
+
+            entry = index.get_function("@_ZN5Stack4pushEi")
+            self.assertEqual(reader[entry.get_define_line()][:33], "define dso_local void @_ZN5Stack4")
+            self.assertEqual(reader.read(entry.get_start(), entry.get_end()),
+                             stack_unit[entry.get_start() - len(test_unit):entry.get_end() - len(test_unit)])
+
+            declaration_line = test_unit[:test_end - test_start].count(b"\n") + 1
+            self.assertEqual(index.get_declarations()["@_ZN5Stack4pushEi"], declaration_line)
+
+            # both files define a different attribute group #0, the ids only refer to the groups of their own file
+            self.assertEqual(index.get_attribute_groups(), dict())
+            reader.close()
+
+            self.assertEqual(analyse(submodules)[1], analyse(file)[1])
@@ -0,0 +1,117 @@
+import unittest
+import gzip
+import lzma
+from os import path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from llvmAnalyser.reader import LlvmReader, open_reader, get_line_offsets, classify_lines
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def write_file(directory, content, name="linked.ll"):
+    file = path.join(directory, name)
+    with open(file, "wb") as f:
+        f.write(content)
+    return file
+
+
+class TestLLVMReader(unittest.TestCase):
+    def test_line_offsets(self):
+        self.assertEqual(list(get_line_offsets(b"")), [0])
+        self.assertEqual(list(get_line_offsets(b"a\n")), [0, 2])
+        self.assertEqual(list(get_line_offsets(b"a\nbc\n\nd")), [0, 2, 5, 6, 7])
+
+    def test_lines(self):
+        with TemporaryDirectory() as directory:
+            file = write_file(directory, b"define void @foo() {\n  ret void  \n}\n\n; comment")
+            reader = LlvmReader(file)
+
+            self.assertEqual(len(reader), 5)
+            self.assertEqual(reader[0], "define void @foo() {")
+            self.assertEqual(reader[1], "  ret void")
+            self.assertEqual(reader[2], "}")
+            self.assertEqual(reader[3], "")
+            self.assertEqual(reader[4], "; comment")
+            self.assertEqual(reader[-1], "; comment")
+            self.assertRaises(IndexError, reader.__getitem__, 5)
+
+            reader.close()
+
+    def test_empty_file(self):
+        with TemporaryDirectory() as directory:
+            reader = LlvmReader(write_file(directory, b""))
+            self.assertEqual(len(reader), 0)
+            reader.close()
+
+    def test_classify_lines(self):
+        data = b"define void @foo() {\n  ret void\n}\n\ndeclare i32 @bar()"
+        offsets, selected = classify_lines(data, frozenset(b"}d"))
+        self.assertEqual(list(offsets), list(get_line_offsets(data)))
+        self.assertEqual(selected, [0, 2, 4])
+
+        # the offsets that are already known are reused
+        with patch("llvmAnalyser.reader.CLASSIFY_SIZE", 4):
+            self.assertEqual(classify_lines(data, frozenset(b" "), offsets), (offsets, [1]))
+            self.assertEqual(classify_lines(data, frozenset(b" ")), (offsets, [1]))
+        self.assertEqual(classify_lines(b"", frozenset(b"d")), (get_line_offsets(b""), []))
+
+    def test_selected_lines(self):
+        content = b"".join(b"define void @f%d() {\n%d:\n  ret void, !dbg !%d\n}\n\n!%d = !DILocation(line: %d)\n" %
+                           (i, i, i, i, i) for i in range(500))
+        first_bytes = frozenset(b"}d0123456789")
+
+        with TemporaryDirectory() as directory:
+            file = write_file(directory, content)
+            offsets = get_line_offsets(content)
+            lines = [(i, offsets[i], content[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+            expected = [(i, start, line) for i, start, line in lines if line[:1] in {b"}", b"d"} or line[:1].isdigit()]
+
+            # the lines are classified in bulk, in chunks
+            with patch("llvmAnalyser.reader.CLASSIFY_SIZE", 1000):
+                reader = LlvmReader(file)
+                self.assertEqual(list(reader.iter_selected_lines(first_bytes)), expected)
+                self.assertEqual(list(reader.offsets), list(get_line_offsets(content)))
+                self.assertEqual(list(reader.iter_selected_lines(first_bytes)), expected)
+                reader.close()
+
+            # the lines that are not selected are not copied
+            reader = open_reader(write_file(directory, gzip.compress(content), "linked.ll.gz"))
+            for _ in range(2):
+                self.assertEqual(list(reader.iter_selected_lines(first_bytes)), expected)
+                self.assertEqual([line for _, line in reader.iter_lines(first_bytes)][4:8],
+                                 [None, None, b"define void @f1() {\n", b"1:\n"])
+            reader.close()
+
+    def test_compressed_files(self):
+        content = b"".join(b"%%%d = add i32 %%%d, 1 ; line %d\n" % (i, i, i * 7) for i in range(2000)) + b"}"
+
+        with TemporaryDirectory() as directory:
+            files = [write_file(directory, gzip.compress(content[:5000]) + gzip.compress(content[5000:]),
+                                "linked.ll.gz"),
+                     write_file(directory, lzma.compress(content), "linked.ll.xz")]
+            if zstandard is not None:
+                files.append(write_file(directory, zstandard.ZstdCompressor().compress(content), "linked.ll.zst"))
+
+            expected = LlvmReader(write_file(directory, content))
+
+            # use small blocks, so that lines cross the borders of the blocks
+            with patch("llvmAnalyser.reader.BLOCK_SIZE", 1000):
+                for file in files:
+                    reader = open_reader(file)
+                    self.assertEqual([line for _, line in reader.iter_lines()],
+                                     [line for _, line in expected.iter_lines()])
+                    self.assertEqual(list(reader.offsets), list(expected.offsets))
+                    reader.close()
+
+                    # jump directly to the lines, using offsets that are already known
+                    reader = open_reader(file, expected.offsets)
+                    for i in (1500, 3, 2000, 999, 1000):
+                        self.assertEqual(reader[i], expected[i])
+                    self.assertEqual(reader.read(900, 3100), content[900:3100])
+                    reader.close()
+
+            expected.close()
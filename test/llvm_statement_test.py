@@ -0,0 +1,27 @@
+import unittest
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from importlib import import_module
+from llvmAnalyser.registry import analyzers
+from llvmAnalyser.llvmStatement import LlvmStatement
+from llvmAnalyser.function import Function, Parameter
+from llvmAnalyser.other.call import analyze_call
+from llvmAnalyser.lexer import get_words
+
+
+class TestLLVMStatement(unittest.TestCase):
+    def test_slots(self):
+        for module, _ in analyzers.values():
+            import_module(module)
+
+        statements = LlvmStatement.__subclasses__()
+        self.assertGreater(len(statements), 20)
+        for statement in statements + [Function, Parameter]:
+            self.assertFalse(hasattr(statement(), "__dict__"), statement.__name__)
+
+    def test_pickle(self):
+        # the statements are stored in the function cache
+        call = analyze_call(get_words('%1 = call i32 @foo(i32 %2) #0 [ "deopt"(i32 10, i32 20) ]'))
+        call = loads(dumps(call, protocol=HIGHEST_PROTOCOL))
+        self.assertEqual(call.get_function_name(), "@foo")
+        self.assertEqual(call.get_argument_registers(), ["%2"])
+        self.assertEqual(call.get_operand_bundle_set().get_operand_bundles()[0].get_tag(), '"deopt"')
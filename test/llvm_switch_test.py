@@ -0,0 +1,31 @@
+import unittest
+from llvmAnalyser.terminator.switch import analyze_switch
+from llvmAnalyser.lexer import tokenize
+
+
+class TestLLVMSwitch(unittest.TestCase):
+    def test_switch(self):
+        switch = analyze_switch(tokenize("switch i32 %0, label %7 [ i32 1, label %3 i32 -2, label %4 "
+                                         "i32 3, label %3 ]"))
+        self.assertEqual(switch.get_default(), "%7")
+        self.assertEqual(len(switch), 3)
+        self.assertEqual(switch.get_cases(), [("1", "%3"), ("-2", "%4"), ("3", "%3")])
+        self.assertEqual(switch.get_destinations(), ["%3", "%4"])
+        self.assertEqual((switch.get_values("%3"), switch.get_values("%4")), (["1", "3"], ["-2"]))
+
+    def test_wide_values(self):
+        # values that do not fit in 64 bits are kept as they are written
+        switch = analyze_switch(tokenize("switch i128 %0, label %2 [ i128 1, label %3 "
+                                         "i128 170141183460469231731687303715884105727, label %4 ]"))
+        self.assertEqual(switch.get_cases(), [("1", "%3"), ("170141183460469231731687303715884105727", "%4")])
+
+        switch = analyze_switch(tokenize("switch i1 %0, label %2 [ i1 true, label %3 ]"))
+        self.assertEqual(switch.get_cases(), [("true", "%3")])
+
+    def test_large_switch(self):
+        line = "switch i32 %0, label %1 [ " + " ".join("i32 {}, label %{}".format(i, i % 3 + 2)
+                                                      for i in range(10000)) + " ]"
+        switch = analyze_switch(tokenize(line))
+        self.assertEqual(len(switch), 10000)
+        self.assertEqual(switch.get_destinations(), ["%2", "%3", "%4"])
+        self.assertEqual(len(switch.get_values("%3")), 3333)
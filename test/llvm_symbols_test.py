@@ -0,0 +1,64 @@
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+from llvmAnalyser.symbols import SymbolTable
+from llvmAnalyser.other.call import analyze_call
+from llvmAnalyser.analyser import LLVMAnalyser
+from llvmAnalyser.types import type_cache
+from test.llvm_analysis import write_module, analyse
+
+
+class TestLLVMSymbols(unittest.TestCase):
+    def test_symbol_table(self):
+        table = SymbolTable()
+        name = "".join(["%", "12"])
+        self.assertIs(table.intern(name), name)
+        self.assertIs(table.intern("".join(["%", "12"])), name)
+        table.intern("@_Z3fooi")
+        self.assertEqual(len(table), 2)
+
+        interned = table.intern_table({"".join(["%", "12"]): "".join(["@_Z3", "fooi"]), "%13": 1})
+        self.assertIs(next(iter(interned)), name)
+        self.assertIs(interned[name], table.intern("@_Z3fooi"))
+        self.assertEqual(interned["%13"], 1)
+        self.assertIsNone(table.intern(None))
+
+    def test_shared_names(self):
+        # the names that are parsed from different lines refer to the same object, once the analyser interned them
+        analyzer = LLVMAnalyser()
+        handler = analyzer.function_handler
+        function_name = handler.identify_function("define dso_local void @_Z3fooi(i32 %0) #0 {".split(" "))
+        call = analyze_call("call void @_Z3fooi(i32 %0)".split(" "))
+        analyzer.intern_call(call)
+
+        self.assertIs(call.get_function_name(), function_name)
+        self.assertIs(call.get_arguments()[0].get_register(),
+                      handler.get_function(function_name).get_parameters()[0].get_register())
+        self.assertIs(call.get_arguments()[0].get_parameter_type(),
+                      handler.get_function(function_name).get_parameters()[0].get_parameter_type())
+
+    def test_analyser_symbols(self):
+        with TemporaryDirectory() as directory:
+            file = write_module(directory)
+            cache = path.join(directory, "cache")
+
+            first, _ = analyse(file, cache=cache)
+            stale = type_cache.types
+            analyzer, _ = analyse(file, cache=cache)
+
+        # the types that were parsed by the first analyser are not kept alive by the second one
+        self.assertIsNot(type_cache.types, stale)
+
+        # every analyser interns the names within its own table
+        self.assertIsNot(analyzer.symbols, first.symbols)
+
+        # the names of the functions that were loaded from the cache are interned as well
+        self.assertEqual(analyzer.cache.misses, 0)
+        name = analyzer.symbols.intern("@_ZNSt6__growEPi")
+        function = analyzer.function_handler.get_function("@_ZN5Stack4pushEi")
+        self.assertIs(analyzer.function_handler.get_function(name).get_function_name(), name)
+        self.assertIs(analyzer.graphs["@_ZN5Stack4pushEi"].nodes[4].get_context().get_function_name(), name)
+        self.assertIs(function.get_parameters()[0].get_register(),
+                      analyzer.symbols.intern(function.get_parameters()[0].get_register()))
+        self.assertIs(next(iter(analyzer.stores["@_ZN5Stack4pushEi"])),
+                      analyzer.symbols.intern(next(iter(analyzer.stores["@_ZN5Stack4pushEi"]))))
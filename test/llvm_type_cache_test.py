@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+from llvmAnalyser.types import get_type, parse_type, type_cache
+
+
+class TestLLVMTypeCache(unittest.TestCase):
+    def setUp(self):
+        type_cache.clear()
+
+        # every lookup that misses is followed by storing the parsed type, so the stores count the misses
+        self.lookup = patch.object(type_cache, "lookup", wraps=type_cache.lookup).start()
+        self.store = patch.object(type_cache, "store", wraps=type_cache.store).start()
+        self.addCleanup(patch.stopall)
+
+    def get_statistics(self):
+        return self.lookup.call_count - self.store.call_count, self.store.call_count
+
+    def assertSameType(self, tokens):
+        expected, remaining = parse_type(list(tokens))
+        for _ in range(2):
+            specified_type, cursor = get_type(list(tokens))
+            self.assertEqual(specified_type, expected)
+            self.assertEqual(cursor, remaining.get_remaining())
+
+    def test_repeated_type(self):
+        tokens = ['%"class.std::map"*', "%1,", "align", "8"]
+        self.assertSameType(tokens)
+        self.assertEqual(self.get_statistics(), (1, 1))
+
+        # the same type is shared by the calls to different functions
+        self.assertEqual(get_type(["void", "@_Z1fv()"])[0], "void")
+        specified_type, tokens = get_type(["void", "@_Z1gi(i32", "%1)"])
+        self.assertEqual((specified_type, tokens), ("void", ["@_Z1gi(i32", "%1)"]))
+        self.assertEqual(self.get_statistics()[0], 2)
+
+        # the cached type is returned, rather than a copy of it
+        self.assertIs(get_type(["i64", "%1"])[0], get_type(["i64", "%2"])[0])
+
+    def test_lookahead(self):
+        # the same first token can start a different type depending on the tokens that follow it
+        self.assertSameType(["i32", "(i32)*", "%1"])
+        self.assertSameType(["i32", "%1"])
+        self.assertSameType(["i32", "(i8*,", "...)*", "%1"])
+        self.assertSameType(["i32", "(i8*,", "...)", "@printf(i8*", "%1)"])
+        self.assertSameType(["%struct.a", "*", "%1"])
+        self.assertSameType(["%struct.a", "%1"])
+        self.assertSameType(["i8*"])
+        self.assertSameType(["[4", "x", "i8]*", "%1"])
+        self.assertSameType(["[4", "x", "i8]", "*", "%1"])
+        self.assertSameType(["[4", "x", "i8],", "[4", "x", "i8]*", "@.str"])
+
+    def test_variadic_type(self):
+        self.assertEqual(get_type(["i32", "(...)*", "bitcast", "(i32", "(i32)*", "@f"])[0], "i32")
+        self.assertEqual(get_type(["i32", "(...)*"])[0], "i32 (...)*")
+        self.assertEqual(self.get_statistics(), (0, 0))
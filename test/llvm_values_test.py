@@ -1,5 +1,6 @@
 import unittest
-from llvmAnalyser.values import get_value
+from unittest.mock import patch
+from llvmAnalyser.values import get_value, constant_expression_cache, constant_expressions
 
 
 class TestLLVMValues(unittest.TestCase):
@@ -198,3 +199,38 @@ class TestLLVMValues(unittest.TestCase):
 
         result = get_value(["frem", "float", "4.0,", "3.0"])
         self.assertEqual(result[0], "frem float 4.0, 3.0")
+
+    def test_constant_expression_cache(self):
+        constant_expression_cache.clear()
+
+        # keep track of the constant expressions that are actually parsed
+        parsed = list()
+
+        def count_parsed(parse_expression):
+            def parse(keyword, tokens):
+                parsed.append(keyword)
+                return parse_expression(keyword, tokens)
+            return parse
+
+        parsers = {keyword: count_parsed(constant_expressions[keyword])
+                   for keyword in ("getelementptr", "extractvalue")}
+        with patch.dict(constant_expressions, parsers):
+            for _ in range(2):
+                tokens = ["getelementptr", "inbounds", "([4", "x", "i8],", "[4", "x", "i8]*", "@.str,", "i64", "0,",
+                          "i64", "0),", "i32", "5)"]
+                result = get_value(tokens)
+                self.assertEqual(result[0], "getelementptr inbounds [4 x i8], [4 x i8]* @.str, i64 0, i64 0")
+                self.assertEqual(result[1], ["i32", "5)"])
+
+                # the part of the token that follows the closing bracket remains
+                result = get_value(["extractvalue", "({i32,", "float}", "{i32", "4,", "float", "17.0},",
+                                    "0)(@\"foo\")"])
+                self.assertEqual(result[0], "extractvalue {i32, float} {i32 4, float 17.0}, 0")
+                self.assertEqual(result[1], ["(@\"foo\")"])
+
+        # the second time, both expressions are taken from the cache
+        self.assertEqual(parsed, ["getelementptr", "extractvalue"])
+
+        # an expression without brackets is parsed every time
+        self.assertEqual(get_value(["add", "i32", "4,", "5"])[0], "add i32 4, 5")
+        self.assertEqual(len(constant_expression_cache), 2)